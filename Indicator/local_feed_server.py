@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Orion Rangi Sonic Engine - Local Feed Server
+Websocket Stand-In for Exchange Feeds
+
+W.J. McCrea - Reality Protocol LLC
+"""
+
+import argparse
+import asyncio
+import json
+import websockets
+from typing import List, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+def load_frames(path: str) -> List[str]:
+    """Load recorded raw frames, one JSON frame per line"""
+    with open(path) as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+class LocalFeedServer:
+    """
+    Local websocket server that replays recorded exchange frames.
+    
+    Each client must send its subscription first; frames are then streamed
+    at `rate` frames per second (or as fast as possible). Setting
+    `disconnect_after` drops the client after that many frames, and
+    `skip_on_reconnect` skips frames on each later connection, so reconnect,
+    resubscribe and (for recordings with contiguous sequence numbers)
+    sequence-gap handling can be exercised without a live exchange.
+    """
+    
+    def __init__(self, frames: List[str], host: str = '127.0.0.1', port: int = 0,
+                 rate: Optional[float] = None, disconnect_after: Optional[int] = None,
+                 skip_on_reconnect: int = 0, loop_frames: bool = False):
+        self.frames = frames
+        self.host = host
+        self.port = port
+        self.rate = rate
+        self.disconnect_after = disconnect_after
+        self.skip_on_reconnect = skip_on_reconnect
+        self.loop_frames = loop_frames
+        
+        self.subscriptions: List[Any] = []
+        self.connections = 0
+        self.frames_sent = 0
+        self._position = 0
+        self._server = None
+        
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+        
+    async def start(self):
+        """Start listening; with port=0 an ephemeral port is chosen"""
+        self._server = await websockets.serve(self._handle_client, self.host, self.port)
+        self.port = next(iter(self._server.sockets)).getsockname()[1]
+        logger.info(f"Local feed server listening on {self.url} with {len(self.frames)} frames")
+        
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            
+    async def _handle_client(self, websocket, path: str = None):
+        """Wait for the subscription, then stream frames to one client"""
+        self.connections += 1
+        if self.connections > 1:
+            self._position += self.skip_on_reconnect
+            
+        try:
+            self.subscriptions.append(json.loads(await websocket.recv()))
+            
+            sent = 0
+            interval = 1.0 / self.rate if self.rate else 0.0
+            while self._position < len(self.frames) or self.loop_frames:
+                if self._position >= len(self.frames):
+                    self._position = 0
+                    
+                await websocket.send(self.frames[self._position])
+                self._position += 1
+                self.frames_sent += 1
+                sent += 1
+                
+                if self.disconnect_after is not None and sent >= self.disconnect_after:
+                    await websocket.close()
+                    return
+                    
+                if interval:
+                    await asyncio.sleep(interval)
+                elif sent % 256 == 0:
+                    await asyncio.sleep(0)
+                    
+            # Keep the socket open after the recording ends, like an idle feed
+            await websocket.wait_closed()
+        except websockets.ConnectionClosed:
+            pass
+
+async def main():
+    """Serve a recording from the command line"""
+    parser = argparse.ArgumentParser(description="Replay recorded exchange frames over a local websocket")
+    parser.add_argument('path', help="JSONL file with one raw exchange frame per line")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rate', type=float, default=None, help="Frames per second (default: as fast as possible)")
+    parser.add_argument('--disconnect-after', type=int, default=None)
+    parser.add_argument('--loop', action='store_true', help="Replay the recording forever")
+    args = parser.parse_args()
+    
+    server = LocalFeedServer(load_frames(args.path), args.host, args.port, args.rate,
+                             args.disconnect_after, loop_frames=args.loop)
+    await server.start()
+    print(f"🛰️ Serving {len(server.frames)} frames on {server.url}")
+    await asyncio.Future()
+
+if __name__ == "__main__":
+    asyncio.run(main())
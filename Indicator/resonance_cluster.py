@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Orion Rangi Sonic Engine - Resonance Cluster
+Multi-Node Proof-of-Resonance Consensus over Local Sockets
+
+W.J. McCrea - Reality Protocol LLC
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import multiprocessing
+import os
+import random
+import socket
+import time
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, asdict
+import logging
+
+from sensory_data_level import (
+    MarketDataPoint,
+    ConsensusResult,
+    HarmonicResonanceCalculator,
+    SonicStabilityCalculator,
+    VectorizedHarmonicResonanceCalculator,
+    VectorizedSonicStabilityCalculator,
+    CoinbaseTickerDecoder,
+    load_signing_key
+)
+
+logger = logging.getLogger(__name__)
+
+CLUSTER_SECRET_ENV = 'RESONANCE_CLUSTER_SECRET'
+
+def load_cluster_secret(secret: Optional[bytes] = None, key_path: Optional[str] = None) -> bytes:
+    """
+    The cluster secret nodes sign their votes with: `secret` if given, else
+    the key file at `key_path` (created on first use), else the hex value of
+    the RESONANCE_CLUSTER_SECRET environment variable. Without any of them a
+    fresh random secret is generated, valid for one run only.
+    """
+    if secret:
+        return secret
+    if key_path is not None:
+        return load_signing_key(key_path)
+    if os.environ.get(CLUSTER_SECRET_ENV):
+        return bytes.fromhex(os.environ[CLUSTER_SECRET_ENV])
+    return os.urandom(32)
+
+def node_key(secret: bytes, node_id: int) -> bytes:
+    """Derive a node's vote signing key from the cluster secret"""
+    return hmac.new(secret, f"node-{node_id}".encode(), hashlib.sha256).digest()
+
+def vote_payload(node_id: int, round_id: int, hri: float, sss: float, timestamp: float) -> bytes:
+    """Canonical bytes signed by a node for one vote"""
+    return f"{node_id}:{round_id}:{hri!r}:{sss!r}:{timestamp!r}".encode()
+
+def sign_vote(secret: bytes, node_id: int, round_id: int, hri: float, sss: float, timestamp: float) -> str:
+    return hmac.new(node_key(secret, node_id), vote_payload(node_id, round_id, hri, sss, timestamp),
+                    hashlib.sha256).hexdigest()
+
+def mad_inliers(values: np.ndarray, threshold: float = 3.5, min_deviation: float = 1.0) -> np.ndarray:
+    """
+    Boolean mask of values within `threshold` scaled MADs of the median.
+    
+    The MAD is scaled by 1.4826 to match a standard deviation for normal
+    data. With few nodes, or nodes that agree exactly, the MAD can be near
+    zero, so deviations up to `min_deviation` score points are always accepted.
+    """
+    median = np.median(values)
+    deviations = np.abs(values - median)
+    scale = 1.4826 * np.median(deviations)
+    return deviations <= max(threshold * scale, min_deviation)
+
+@dataclass
+class NodeConfig:
+    """Everything a node process needs to replay its view of the feed"""
+    node_id: int
+    host: str
+    port: int
+    secret: bytes
+    tick_path: Optional[str] = None
+    tick_count: int = 5000
+    symbol_count: int = 4
+    seed: int = 432
+    window_size: int = 50
+    round_ticks: int = 100
+    backend: str = 'vectorized'
+    base_frequency: float = 432.0
+    drop_rate: float = 0.0
+    bias: float = 0.0
+    tick_rate: Optional[float] = None
+
+def _load_node_ticks(config: NodeConfig) -> List[Any]:
+    """Load the shared tick stream (recording or synthetic) inside the node process"""
+    if config.tick_path:
+        from sensory_replay import read_ticks
+        return list(read_ticks(config.tick_path))
+        
+    from sensory_benchmarks import generate_ticks
+    return generate_ticks(config.tick_count, config.symbol_count, seed=config.seed)
+
+def run_node(config: NodeConfig):
+    """
+    Node process: replay the feed, compute HRI/SSS at every round boundary
+    and send a signed vote to the aggregator.
+    
+    Each node sees its own view of the feed: with `drop_rate` it misses a
+    random share of ticks (seeded per node), and `bias` shifts its HRI to
+    simulate a faulty or dishonest node.
+    """
+    logging.getLogger('sensory_data_level').setLevel(logging.WARNING)
+    ticks = _load_node_ticks(config)
+    rng = random.Random(config.seed * 1000 + config.node_id)
+    decoder = CoinbaseTickerDecoder()
+    
+    if config.backend == 'vectorized':
+        hri_calculator = VectorizedHarmonicResonanceCalculator(config.base_frequency)
+        sss_calculator = VectorizedSonicStabilityCalculator(config.base_frequency)
+    else:
+        hri_calculator = HarmonicResonanceCalculator(config.base_frequency)
+        sss_calculator = SonicStabilityCalculator(config.base_frequency)
+    window: deque = deque(maxlen=config.window_size)
+    
+    with socket.create_connection((config.host, config.port)) as connection:
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reader = connection.makefile('r')
+        
+        def send(message: Dict[str, Any]):
+            connection.sendall((json.dumps(message) + '\n').encode())
+            
+        # Wait for the aggregator to start every node together
+        send({'type': 'hello', 'node_id': config.node_id})
+        reader.readline()
+        
+        start = time.time()
+        for index, tick in enumerate(ticks):
+            if config.tick_rate:
+                delay = start + index / config.tick_rate - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                    
+            if isinstance(tick, dict):
+                tick = decoder.point_from_data(tick)
+                if tick is None:
+                    continue
+                    
+            if not (config.drop_rate and rng.random() < config.drop_rate):
+                window.append(tick)
+                
+            # Round boundaries follow the shared stream index, so rounds line up across nodes
+            if (index + 1) % config.round_ticks or len(window) < 2:
+                continue
+                
+            started_at = time.time()
+            market_data = list(window)
+            hri = float(hri_calculator.calculate_hri(market_data)) + config.bias
+            sss = float(sss_calculator.calculate_sss(market_data))
+            round_id = (index + 1) // config.round_ticks - 1
+            timestamp = tick.timestamp
+            send({
+                'type': 'vote',
+                'node_id': config.node_id,
+                'round': round_id,
+                'hri': hri,
+                'sss': sss,
+                'timestamp': timestamp,
+                'started_at': started_at,
+                'signature': sign_vote(config.secret, config.node_id, round_id, hri, sss, timestamp)
+            })
+            
+        send({'type': 'done', 'node_id': config.node_id})
+
+@dataclass
+class ClusterStats:
+    """Round latency and throughput of a cluster run"""
+    nodes: int
+    quorum: int
+    rounds: int
+    failed_rounds: int
+    votes: int
+    rejected_votes: int
+    invalid_signatures: int
+    late_votes: int
+    wall_seconds: float
+    rounds_per_second: float
+    votes_per_second: float
+    round_latency_p50_ms: float
+    round_latency_p99_ms: float
+    quorum_wait_p50_ms: float
+    quorum_wait_p99_ms: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class QuorumAggregator:
+    """
+    Collects node votes per round over a local TCP socket and combines them
+    into one signed ConsensusResult.
+    
+    A round closes once every node has voted, or `round_timeout` seconds
+    after its first vote. Votes more than `outlier_threshold` scaled MADs
+    from the median HRI or SSS are rejected; if at least `quorum` votes
+    remain, the result is their median, carrying their node signatures
+    followed by the aggregator's own signature.
+    
+    Results are passed to `on_result(round_id, result)` and, when a
+    SensoryDataLayer is given as `layer`, published through it so they are
+    logged, block-signed and fanned out like the layer's own results.
+    """
+    
+    def __init__(self, node_count: int, quorum: Optional[int] = None, secret: Optional[bytes] = None,
+                 outlier_threshold: float = 3.5, min_deviation: float = 1.0, round_timeout: float = 1.0,
+                 on_result=None, layer=None):
+        if not secret:
+            raise ValueError("QuorumAggregator needs the cluster secret its nodes sign with")
+        self.node_count = node_count
+        self.quorum = quorum or node_count // 2 + 1
+        self.secret = secret
+        self.outlier_threshold = outlier_threshold
+        self.min_deviation = min_deviation
+        self.round_timeout = round_timeout
+        self.on_result = on_result
+        self.layer = layer
+        self._publish_tasks = set()
+        
+        self.host = '127.0.0.1'
+        self.port = 0
+        self._server = None
+        self._writers: Dict[int, asyncio.StreamWriter] = {}
+        self._all_connected: Optional[asyncio.Event] = None
+        self._all_done: Optional[asyncio.Event] = None
+        self._done_nodes = set()
+        self._exited_nodes = set()
+        self._closed_streams = set()
+        self._unidentified_streams = 0
+        
+        # Open rounds: round id -> {'votes': {node_id: vote}, 'first_arrival': t, 'timer': handle}
+        self._rounds: Dict[int, Dict[str, Any]] = {}
+        self._closed_rounds = set()
+        self.results: List[ConsensusResult] = []
+        
+        # Metrics
+        self.started_at = 0.0
+        self.finished_at = 0.0
+        self.votes = 0
+        self.rejected_votes = 0
+        self.invalid_signatures = 0
+        self.late_votes = 0
+        self.failed_rounds = 0
+        self.round_latencies: List[float] = []
+        self.quorum_waits: List[float] = []
+        
+    async def start(self, host: str = '127.0.0.1', port: int = 0):
+        """Listen for nodes; with port=0 an ephemeral port is chosen"""
+        self._all_connected = asyncio.Event()
+        self._all_done = asyncio.Event()
+        self._server = await asyncio.start_server(self._handle_node, host, port)
+        self.host = host
+        self.port = self._server.sockets[0].getsockname()[1]
+        
+    async def stop(self):
+        for writer in self._writers.values():
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            
+    async def wait_for_nodes(self):
+        await self._all_connected.wait()
+        
+    def begin(self):
+        """Release every connected node at once"""
+        self.started_at = time.time()
+        for writer in self._writers.values():
+            writer.write(b'start\n')
+            
+    async def wait_done(self):
+        """Wait for every node to finish, then close any rounds still open"""
+        await self._all_done.wait()
+        for round_id in sorted(self._rounds):
+            self._close_round(round_id)
+        if self._publish_tasks:
+            await asyncio.gather(*self._publish_tasks)
+        self.finished_at = time.time()
+        
+    def node_exited(self, node_id: int):
+        """Stop waiting for a node process that exited, cleanly or not"""
+        self._exited_nodes.add(node_id)
+        self._check_nodes()
+        
+    def _finished_nodes(self) -> set:
+        """
+        Nodes with nothing left to read: those that sent 'done', and exited
+        nodes whose stream reached EOF (or that never connected at all).
+        Votes an exited node wrote before dying are still read first.
+        """
+        finished = self._done_nodes | (self._exited_nodes & self._closed_streams)
+        if not self._unidentified_streams:
+            finished |= self._exited_nodes - self._writers.keys()
+        return finished
+        
+    def _check_nodes(self):
+        if len(self._writers.keys() | self._exited_nodes) >= self.node_count:
+            self._all_connected.set()
+        if len(self._finished_nodes()) >= self.node_count:
+            self._all_done.set()
+            
+    async def _handle_node(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read newline-delimited JSON messages from one node"""
+        node_id = None
+        self._unidentified_streams += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                    
+                message = json.loads(line)
+                message_type = message.get('type')
+                if message_type == 'vote':
+                    self._add_vote(message)
+                elif message_type == 'hello':
+                    node_id = message['node_id']
+                    self._writers[node_id] = writer
+                    self._unidentified_streams -= 1
+                    self._check_nodes()
+                elif message_type == 'done':
+                    self._done_nodes.add(message['node_id'])
+                    self._check_nodes()
+        except Exception as e:
+            logger.error(f"Error reading from consensus node: {e}")
+        finally:
+            if node_id is None:
+                self._unidentified_streams -= 1
+            else:
+                self._closed_streams.add(node_id)
+            self._check_nodes()
+            
+    def _add_vote(self, vote: Dict[str, Any]):
+        """Verify a vote and add it to its round"""
+        self.votes += 1
+        node_id, round_id = vote['node_id'], vote['round']
+        expected = sign_vote(self.secret, node_id, round_id, vote['hri'], vote['sss'], vote['timestamp'])
+        if not hmac.compare_digest(expected, vote['signature']):
+            self.invalid_signatures += 1
+            return
+            
+        if round_id in self._closed_rounds:
+            self.late_votes += 1
+            return
+            
+        state = self._rounds.get(round_id)
+        if state is None:
+            state = self._rounds[round_id] = {'votes': {}, 'first_arrival': time.time(), 'timer': None}
+            if self.round_timeout is not None:
+                state['timer'] = asyncio.get_running_loop().call_later(
+                    self.round_timeout, self._close_round, round_id)
+        state['votes'][node_id] = vote
+        
+        if len(state['votes']) >= self.node_count:
+            self._close_round(round_id)
+            
+    def _close_round(self, round_id: int):
+        """Aggregate a round if it reached quorum; otherwise count it as failed"""
+        state = self._rounds.pop(round_id, None)
+        if state is None:
+            return
+        self._closed_rounds.add(round_id)
+        if state['timer'] is not None:
+            state['timer'].cancel()
+            
+        votes = list(state['votes'].values())
+        result = self.aggregate(votes) if len(votes) >= self.quorum else None
+        if result is None:
+            self.failed_rounds += 1
+            return
+            
+        closed_at = time.time()
+        self.round_latencies.append(closed_at - min(vote['started_at'] for vote in votes))
+        self.quorum_waits.append(closed_at - state['first_arrival'])
+        self.results.append(result)
+        
+        if self.on_result is not None:
+            self.on_result(round_id, result)
+        if self.layer is not None:
+            task = asyncio.get_running_loop().create_task(self.layer.publish_consensus_result(result))
+            self._publish_tasks.add(task)
+            task.add_done_callback(self._publish_tasks.discard)
+            
+    def aggregate(self, votes: List[Dict[str, Any]]) -> Optional[ConsensusResult]:
+        """Combine one round of votes by median with MAD outlier rejection, or None without a quorum"""
+        hri_values = np.array([vote['hri'] for vote in votes])
+        sss_values = np.array([vote['sss'] for vote in votes])
+        inliers = (mad_inliers(hri_values, self.outlier_threshold, self.min_deviation) &
+                   mad_inliers(sss_values, self.outlier_threshold, self.min_deviation))
+        self.rejected_votes += int(len(votes) - inliers.sum())
+        if inliers.sum() < self.quorum:
+            return None
+            
+        accepted = sorted((vote for vote, keep in zip(votes, inliers) if keep), key=lambda vote: vote['node_id'])
+        hri = float(np.median(hri_values[inliers]))
+        sss = float(np.median(sss_values[inliers]))
+        timestamp = float(np.median([vote['timestamp'] for vote in accepted]))
+        
+        signatures = [vote['signature'] for vote in accepted]
+        signatures.append(self._aggregate_signature(hri, sss, timestamp, signatures))
+        
+        return ConsensusResult(
+            hri_value=hri,
+            sss_value=sss,
+            harmonic_quality=((hri / 100.0) + ((100.0 - sss) / 100.0)) / 2.0 * 100.0,
+            consensus_timestamp=timestamp,
+            participating_nodes=len(accepted),
+            validation_signatures=signatures
+        )
+        
+    def _aggregate_signature(self, hri: float, sss: float, timestamp: float, node_signatures: List[str]) -> str:
+        payload = f"{hri!r}:{sss!r}:{timestamp!r}:{','.join(node_signatures)}".encode()
+        return hmac.new(self.secret, payload, hashlib.sha256).hexdigest()
+        
+    def verify(self, result: ConsensusResult) -> bool:
+        """
+        Check the aggregator signature of a result. It follows the
+        participating_nodes node signatures; a block signature appended by
+        a SensoryDataLayer afterwards is ignored.
+        """
+        signatures = result.validation_signatures
+        count = result.participating_nodes
+        if len(signatures) <= count:
+            return False
+        expected = self._aggregate_signature(result.hri_value, result.sss_value, result.consensus_timestamp,
+                                             signatures[:count])
+        return hmac.compare_digest(expected, signatures[count])
+        
+    def get_stats(self) -> ClusterStats:
+        """Summarize round latency and throughput"""
+        wall_seconds = max(self.finished_at - self.started_at, 1e-9)
+        latencies = np.array(self.round_latencies or [0.0]) * 1000
+        waits = np.array(self.quorum_waits or [0.0]) * 1000
+        return ClusterStats(
+            nodes=self.node_count,
+            quorum=self.quorum,
+            rounds=len(self.results),
+            failed_rounds=self.failed_rounds,
+            votes=self.votes,
+            rejected_votes=self.rejected_votes,
+            invalid_signatures=self.invalid_signatures,
+            late_votes=self.late_votes,
+            wall_seconds=wall_seconds,
+            rounds_per_second=len(self.results) / wall_seconds,
+            votes_per_second=self.votes / wall_seconds,
+            round_latency_p50_ms=float(np.percentile(latencies, 50)),
+            round_latency_p99_ms=float(np.percentile(latencies, 99)),
+            quorum_wait_p50_ms=float(np.percentile(waits, 50)),
+            quorum_wait_p99_ms=float(np.percentile(waits, 99))
+        )
+
+async def run_cluster(node_count: int, quorum: Optional[int] = None, faulty_nodes: int = 0,
+                      faulty_bias: float = 25.0, round_timeout: float = 1.0, on_result=None,
+                      secret: Optional[bytes] = None, layer=None, **node_options) -> ClusterStats:
+    """
+    Run `node_count` node processes against one aggregator and return the run statistics.
+    
+    The first `faulty_nodes` nodes add `faulty_bias` to their HRI; remaining
+    keyword arguments are NodeConfig fields shared by every node. The
+    aggregator and every node share `secret`, or one generated for this run
+    (see load_cluster_secret), and results are published through `layer`
+    when given. Node exits are watched by one joining thread per process, so this works
+    on any event loop (including the Windows proactor loop).
+    """
+    secret = load_cluster_secret(secret)
+    aggregator = QuorumAggregator(node_count, quorum, secret=secret, round_timeout=round_timeout,
+                                  on_result=on_result, layer=layer)
+    await aggregator.start()
+    
+    # Spawned (not forked) so nodes do not inherit the running event loop
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(
+            target=run_node,
+            args=(NodeConfig(node_id, aggregator.host, aggregator.port, secret,
+                             bias=faulty_bias if node_id < faulty_nodes else 0.0, **node_options),),
+            daemon=True
+        )
+        for node_id in range(node_count)
+    ]
+    loop = asyncio.get_running_loop()
+    watchers = ThreadPoolExecutor(max_workers=node_count, thread_name_prefix='node-watch')
+    for node_id, process in enumerate(processes):
+        process.start()
+        # A crashed node must not leave the aggregator waiting for its votes
+        exited = loop.run_in_executor(watchers, process.join)
+        exited.add_done_callback(lambda _, node_id=node_id: aggregator.node_exited(node_id))
+        
+    try:
+        await aggregator.wait_for_nodes()
+        aggregator.begin()
+        await aggregator.wait_done()
+    finally:
+        for process in processes:
+            await loop.run_in_executor(None, process.join, 10)
+        watchers.shutdown(wait=False)
+        await aggregator.stop()
+        
+    return aggregator.get_stats()
+
+async def main():
+    """Measure consensus round latency and throughput as the node count grows"""
+    parser = argparse.ArgumentParser(description="Run a local multi-process Proof-of-Resonance cluster")
+    parser.add_argument('--nodes', type=int, nargs='+', default=[1, 2, 4, 8], help="Node counts to sweep")
+    parser.add_argument('--quorum', type=int, default=None, help="Votes needed per round (default: majority)")
+    parser.add_argument('--faulty', type=int, default=0, help="Nodes that report a biased HRI")
+    parser.add_argument('--faulty-bias', type=float, default=25.0)
+    parser.add_argument('--path', default=None, help="Tick recording shared by every node (default: synthetic)")
+    parser.add_argument('--ticks', type=int, default=20000)
+    parser.add_argument('--symbols', type=int, default=4)
+    parser.add_argument('--window-size', type=int, default=50)
+    parser.add_argument('--round-ticks', type=int, default=100, help="Ticks between consensus rounds")
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="Share of ticks each node misses")
+    parser.add_argument('--tick-rate', type=float, default=None, help="Ticks per second (default: as fast as possible)")
+    parser.add_argument('--backend', choices=['python', 'vectorized'], default='vectorized')
+    parser.add_argument('--secret-file', default=None,
+                        help=f"Cluster secret file, created on first use (default: ${CLUSTER_SECRET_ENV} "
+                             f"as hex, else a fresh secret per run)")
+    args = parser.parse_args()
+    secret = load_cluster_secret(key_path=args.secret_file)
+    
+    print(f"{'nodes':>5} {'rounds':>7} {'rounds/s':>10} {'votes/s':>10} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'wait p99':>9} {'rejected':>9} {'failed':>7}")
+    for node_count in args.nodes:
+        stats = await run_cluster(
+            node_count, args.quorum, min(args.faulty, node_count),
+            faulty_bias=args.faulty_bias,
+            secret=secret,
+            tick_path=args.path,
+            tick_count=args.ticks,
+            symbol_count=args.symbols,
+            window_size=args.window_size,
+            round_ticks=args.round_ticks,
+            backend=args.backend,
+            drop_rate=args.drop_rate,
+            tick_rate=args.tick_rate
+        )
+        print(f"{stats.nodes:>5} {stats.rounds:>7} {stats.rounds_per_second:>10,.0f} {stats.votes_per_second:>10,.0f} "
+              f"{stats.round_latency_p50_ms:>8.2f} {stats.round_latency_p99_ms:>8.2f} {stats.quorum_wait_p99_ms:>9.2f} "
+              f"{stats.rejected_votes:>9} {stats.failed_rounds:>7}")
+    print("🌐 Cluster sweep complete")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Orion Rangi Sonic Engine - Sensory Benchmarks
+Hot-Path Benchmarks for the Sensory Data Layer
+
+W.J. McCrea - Reality Protocol LLC
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import numpy as np
+from typing import Dict, List, Callable, Any
+import logging
+
+from sensory_data_level import (
+    MarketDataPoint,
+    HarmonicResonanceCalculator,
+    SonicStabilityCalculator,
+    VectorizedHarmonicResonanceCalculator,
+    VectorizedSonicStabilityCalculator,
+    MarketDataIngestionEngine,
+    SensoryDataLayer
+)
+from sensory_replay import SimulatedClock
+
+DEFAULT_WINDOW_SIZES = [10, 50, 200]
+DEFAULT_SYMBOL_COUNTS = [1, 10, 300]
+DEFAULT_TICK_RATES = [10.0, 1000.0]
+
+def generate_ticks(count: int, symbol_count: int = 4, tick_rate: float = 100.0, seed: int = 432,
+                   start_time: float = 1_700_000_000.0) -> List[MarketDataPoint]:
+    """Generate a reproducible random-walk tick stream across `symbol_count` symbols"""
+    rng = random.Random(seed)
+    symbols = [f"SYM{index}" for index in range(symbol_count)]
+    prices = {symbol: rng.uniform(1.0, 50000.0) for symbol in symbols}
+    interval = 1.0 / tick_rate
+    ticks = []
+    
+    for index in range(count):
+        symbol = symbols[rng.randrange(symbol_count)]
+        prices[symbol] *= 1.0 + rng.gauss(0.0, 0.002)
+        ticks.append(MarketDataPoint(
+            symbol=symbol,
+            price=prices[symbol],
+            volume=rng.lognormvariate(8.0, 1.5),
+            change_24h=rng.uniform(-8.0, 8.0),
+            timestamp=start_time + index * interval + rng.uniform(0.0, interval * 0.1),
+            source='benchmark'
+        ))
+    return ticks
+
+def generate_coinbase_messages(ticks: List[MarketDataPoint]) -> List[Dict[str, Any]]:
+    """Turn ticks into decoded Coinbase ticker frames"""
+    return [
+        {
+            'type': 'ticker',
+            'product_id': f"{tick.symbol}-USD",
+            'price': f"{tick.price:.8f}",
+            'volume_24h': f"{tick.volume:.8f}"
+        }
+        for tick in ticks
+    ]
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, math.ceil(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+def summarize(samples_ns: List[int]) -> Dict[str, float]:
+    """Throughput and p50/p99 latency of per-call timings in nanoseconds"""
+    samples = sorted(samples_ns)
+    total_seconds = sum(samples) / 1e9
+    return {
+        'calls': len(samples),
+        'throughput_per_second': len(samples) / total_seconds if total_seconds > 0 else 0.0,
+        'p50_us': _percentile(samples, 0.50) / 1e3,
+        'p99_us': _percentile(samples, 0.99) / 1e3
+    }
+
+def time_calls(function: Callable, arguments: List[Any], warmup: int = 5) -> Dict[str, float]:
+    """Time one call per argument and summarize"""
+    for argument in arguments[:warmup]:
+        function(argument)
+        
+    samples = []
+    perf_counter_ns = time.perf_counter_ns
+    for argument in arguments:
+        start = perf_counter_ns()
+        function(argument)
+        samples.append(perf_counter_ns() - start)
+    return summarize(samples)
+
+def _sliding_windows(ticks: List[MarketDataPoint], window_size: int, count: int) -> List[List[MarketDataPoint]]:
+    """The `count` last full windows of a tick stream"""
+    last_start = len(ticks) - window_size
+    return [ticks[start:start + window_size] for start in range(max(0, last_start - count + 1), last_start + 1)]
+
+def bench_calculators(window_size: int, symbol_count: int, tick_rate: float, iterations: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark calculate_hri/calculate_sss for both backends on sliding windows"""
+    ticks = generate_ticks(window_size + iterations, symbol_count, tick_rate)
+    windows = _sliding_windows(ticks, window_size, iterations)
+    
+    return {
+        'calculate_hri[python]': time_calls(HarmonicResonanceCalculator().calculate_hri, windows),
+        'calculate_sss[python]': time_calls(SonicStabilityCalculator().calculate_sss, windows),
+        'calculate_hri[vectorized]': time_calls(VectorizedHarmonicResonanceCalculator().calculate_hri, windows),
+        'calculate_sss[vectorized]': time_calls(VectorizedSonicStabilityCalculator().calculate_sss, windows)
+    }
+
+def bench_buffer(window_size: int, symbol_count: int, tick_rate: float, iterations: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark get_recent_data and get_recent_window on full deque and columnar buffers"""
+    ticks = generate_ticks(max(2000, iterations), symbol_count, tick_rate)
+    results = {}
+    
+    for label, columnar in (('deque', False), ('columnar', True)):
+        engine = MarketDataIngestionEngine(columnar=columnar)
+        for tick in ticks:
+            if columnar:
+                engine.tick_buffer.append_point(tick)
+            else:
+                engine.data_buffer.append(tick)
+            engine._index_market_data(tick)
+            
+        symbols = [ticks[index % len(ticks)].symbol for index in range(iterations)]
+        results[f'get_recent_data[{label}]'] = time_calls(
+            lambda _: engine.get_recent_data(limit=window_size), symbols)
+        results[f'get_recent_data[{label},symbol]'] = time_calls(
+            lambda symbol: engine.get_recent_data(symbol=symbol, limit=window_size), symbols)
+        results[f'get_recent_window[{label}]'] = time_calls(
+            lambda _: engine.get_recent_window(limit=window_size), symbols)
+    return results
+
+def bench_parse(symbol_count: int, iterations: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark _parse_coinbase_data on decoded ticker frames"""
+    engine = MarketDataIngestionEngine()
+    messages = generate_coinbase_messages(generate_ticks(iterations, symbol_count))
+    return {'_parse_coinbase_data': time_calls(engine._parse_coinbase_data, messages)}
+
+def bench_update_path(window_size: int, symbol_count: int, tick_rate: float, iterations: int,
+                      backend: str = 'python') -> Dict[str, Dict[str, float]]:
+    """Benchmark a tick through _process_market_data and _on_market_data_update end to end"""
+    ticks = generate_ticks(window_size + iterations, symbol_count, tick_rate)
+    clock = SimulatedClock(ticks[0].timestamp)
+    layer = SensoryDataLayer(window_size=window_size, backend=backend,
+                             columnar_buffer=(backend == 'vectorized'), clock=clock)
+    layer.use_deferred_timer = False
+    engine = layer.ingestion_engine
+    
+    async def run() -> List[int]:
+        samples = []
+        perf_counter_ns = time.perf_counter_ns
+        for index, tick in enumerate(ticks):
+            clock.advance_to(tick.timestamp)
+            start = perf_counter_ns()
+            await engine._process_market_data(tick)
+            if index >= window_size:
+                samples.append(perf_counter_ns() - start)
+        return samples
+        
+    return {f'on_market_data_update[{backend}]': summarize(asyncio.run(run()))}
+
+def run_suite(window_sizes: List[int], symbol_counts: List[int], tick_rates: List[float],
+              iterations: int) -> Dict[str, Dict[str, float]]:
+    """Run every benchmark over the parameter sweep, keyed by benchmark and parameters"""
+    results: Dict[str, Dict[str, float]] = {}
+    
+    def record(group: Dict[str, Dict[str, float]], **params):
+        suffix = ','.join(f"{name}={value:g}" for name, value in params.items())
+        for name, summary in group.items():
+            results[f"{name}({suffix})" if suffix else name] = summary
+            
+    for symbol_count in symbol_counts:
+        record(bench_parse(symbol_count, iterations), symbols=symbol_count)
+        for window_size in window_sizes:
+            record(bench_buffer(window_size, symbol_count, tick_rates[0], iterations),
+                   window=window_size, symbols=symbol_count)
+            for tick_rate in tick_rates:
+                params = dict(window=window_size, symbols=symbol_count, rate=tick_rate)
+                record(bench_calculators(window_size, symbol_count, tick_rate, iterations), **params)
+                for backend in ('python', 'vectorized'):
+                    record(bench_update_path(window_size, symbol_count, tick_rate, iterations, backend), **params)
+    return results
+
+def compare_to_baseline(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                        tolerance: float) -> List[str]:
+    """List benchmarks whose p50 or p99 latency grew by more than `tolerance` (fractional)"""
+    regressions = []
+    for name, summary in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        for metric in ('p50_us', 'p99_us'):
+            if reference[metric] > 0 and summary[metric] > reference[metric] * (1.0 + tolerance):
+                regressions.append(
+                    f"{name} {metric}: {summary[metric]:.1f}us vs baseline {reference[metric]:.1f}us"
+                )
+    return regressions
+
+def print_results(results: Dict[str, Dict[str, float]]):
+    """Print a fixed-width results table"""
+    print(f"{'benchmark':<72} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10}")
+    for name, summary in results.items():
+        print(f"{name:<72} {summary['throughput_per_second']:>12,.0f} "
+              f"{summary['p50_us']:>10.1f} {summary['p99_us']:>10.1f}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Sensory Data Layer hot paths")
+    parser.add_argument('--window-sizes', type=int, nargs='+', default=DEFAULT_WINDOW_SIZES)
+    parser.add_argument('--symbol-counts', type=int, nargs='+', default=DEFAULT_SYMBOL_COUNTS)
+    parser.add_argument('--tick-rates', type=float, nargs='+', default=DEFAULT_TICK_RATES)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--quick', action='store_true', help="Small sweep for smoke runs")
+    parser.add_argument('--save-baseline', metavar='PATH', help="Write results as the new baseline")
+    parser.add_argument('--baseline', metavar='PATH', help="Compare against a stored baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed latency growth before failing")
+    args = parser.parse_args()
+    
+    # Per-update INFO logging would be measured along with the consensus path
+    logging.getLogger('sensory_data_level').setLevel(logging.WARNING)
+    
+    if args.quick:
+        args.window_sizes, args.symbol_counts, args.tick_rates, args.iterations = [50], [4], [100.0], 50
+        
+    results = run_suite(args.window_sizes, args.symbol_counts, args.tick_rates, args.iterations)
+    print_results(results)
+    
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as handle:
+            json.dump({'numpy': np.__version__, 'python': sys.version.split()[0], 'results': results},
+                      handle, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved to {args.save_baseline}")
+        
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)['results']
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("⚠️ Regressions against baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("✅ No regressions against baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,24 +7,59 @@ W.J. McCrea - Reality Protocol LLC
 Patent Pending: US2025/STYRD
 """
 
+import abc
 import asyncio
+import bisect
+import hashlib
+import hmac
 import json
+import os
+import struct
+import sys
 import time
 import math
+import random
+import threading
+import multiprocessing
 import numpy as np
 import websockets
 import requests
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
-from collections import deque
+from typing import Dict, List, Tuple, Iterable, Optional, Any
+from dataclasses import dataclass
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
 import logging
 
+try:
+    import orjson  # Optional fast JSON backend for exchange feeds
+except ImportError:
+    orjson = None
+
+try:
+    # Optional Ed25519 signing of consensus block roots (cryptography>=40, for public_bytes_raw)
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+    from cryptography.exceptions import InvalidSignature
+    if not hasattr(Ed25519PublicKey, 'public_bytes_raw'):
+        raise ImportError("cryptography>=40 is required")
+except ImportError:
+    Ed25519PrivateKey = Ed25519PublicKey = InvalidSignature = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+def dumps_json(value: Any) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+# Records are slotted: no per-instance __dict__, and to_dict() builds the
+# dict directly instead of the recursive deep copy of dataclasses.asdict
+
+@dataclass(slots=True)
 class MarketDataPoint:
     """Structured market data with harmonic properties"""
     symbol: str
@@ -36,9 +71,20 @@ class MarketDataPoint:
     harmonic_signature: str = ""
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'symbol': self.symbol,
+            'price': self.price,
+            'volume': self.volume,
+            'change_24h': self.change_24h,
+            'timestamp': self.timestamp,
+            'source': self.source,
+            'harmonic_signature': self.harmonic_signature
+        }
+        
+    def to_json(self) -> bytes:
+        return dumps_json(self.to_dict())
 
-@dataclass
+@dataclass(slots=True)
 class HarmonicAnalysis:
     """Harmonic analysis results for market data"""
     fundamental_freq: float
@@ -49,9 +95,19 @@ class HarmonicAnalysis:
     timestamp: float
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'fundamental_freq': self.fundamental_freq,
+            'harmonic_series': list(self.harmonic_series),
+            'amplitude': self.amplitude,
+            'phase': self.phase,
+            'quality_score': self.quality_score,
+            'timestamp': self.timestamp
+        }
+        
+    def to_json(self) -> bytes:
+        return dumps_json(self.to_dict())
 
-@dataclass
+@dataclass(slots=True)
 class ConsensusResult:
     """Proof-of-Resonance consensus result"""
     hri_value: float
@@ -59,14 +115,57 @@ class ConsensusResult:
     harmonic_quality: float
     consensus_timestamp: float
     participating_nodes: int
-    validation_signatures: List[str]
+    validation_signatures: List[str]  # The block root signature is appended when the signing block seals
+    inclusion_proof: Optional[Dict[str, Any]] = None  # Filled in when the signing block seals
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        proof = self.inclusion_proof
+        return {
+            'hri_value': self.hri_value,
+            'sss_value': self.sss_value,
+            'harmonic_quality': self.harmonic_quality,
+            'consensus_timestamp': self.consensus_timestamp,
+            'participating_nodes': self.participating_nodes,
+            'validation_signatures': list(self.validation_signatures),
+            'inclusion_proof': dict(proof, path=list(proof['path'])) if proof is not None else None
+        }
+        
+    def to_json(self) -> bytes:
+        return dumps_json(self.to_dict())
+
+# Fixed-width tick record shared by binary (.npy) recordings and the tick log
+TICK_RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('price', '<f8'),
+    ('volume', '<f8'),
+    ('change_24h', '<f8'),
+    ('symbol', 'S16'),
+    ('source', 'S16')
+])
+
+# Column names and dtypes of a columnar consensus history export
+CONSENSUS_COLUMNS = (
+    ('consensus_timestamp', np.float64),
+    ('hri_value', np.float64),
+    ('sss_value', np.float64),
+    ('harmonic_quality', np.float64),
+    ('participating_nodes', np.int32)
+)
+
+def consensus_columns(results: List[ConsensusResult]) -> Dict[str, np.ndarray]:
+    """Export consensus results as one NumPy array per numeric field"""
+    count = len(results)
+    return {
+        name: np.fromiter((getattr(result, name) for result in results), dtype=dtype, count=count)
+        for name, dtype in CONSENSUS_COLUMNS
+    }
 
 class HarmonicResonanceCalculator:
     """Advanced HRI calculation with multiple market factors"""
     
+    # Price ratios treated as perfectly harmonic
+    PERFECT_RATIOS = (1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0)
+    
     def __init__(self, base_frequency: float = 432.0):
         self.base_frequency = base_frequency
         self.harmonic_weights = {
@@ -94,6 +193,16 @@ class HarmonicResonanceCalculator:
         volatility_harmonic = self._calculate_volatility_harmonic(market_data)
         momentum_harmonic = self._calculate_momentum_harmonic(market_data)
         
+        # Calculate resonance amplification
+        resonance_factor = self._calculate_resonance_amplification(market_data)
+        
+        return self._combine_components(price_harmonic, volume_harmonic, volatility_harmonic,
+                                        momentum_harmonic, resonance_factor)
+                                        
+    def _combine_components(self, price_harmonic: float, volume_harmonic: float,
+                            volatility_harmonic: float, momentum_harmonic: float,
+                            resonance_factor: float) -> float:
+        """Weight the harmonic components, amplify and clamp to the HRI range"""
         # Apply weighted combination
         weighted_hri = (
             price_harmonic * self.harmonic_weights['price'] +
@@ -103,12 +212,11 @@ class HarmonicResonanceCalculator:
         )
         
         # Apply resonance amplification
-        resonance_factor = self._calculate_resonance_amplification(market_data)
         final_hri = weighted_hri * resonance_factor
         
         # Normalize to 0-100 range
         return max(0.0, min(100.0, final_hri))
-    
+        
     def _calculate_price_harmonic(self, market_data: List[MarketDataPoint]) -> float:
         """Calculate harmonic component from price relationships"""
         if len(market_data) < 2:
@@ -120,21 +228,21 @@ class HarmonicResonanceCalculator:
         
         for i in range(len(market_data)):
             for j in range(i + 1, len(market_data)):
-                price_ratio = market_data[i].price / market_data[j].price
-                
-                # Convert ratio to harmonic frequency
-                harmonic_freq = self.base_frequency * (price_ratio % 10)
-                
-                # Calculate harmonic quality (closer to perfect ratios = higher quality)
-                perfect_ratios = [1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0]
-                min_distance = min(abs(price_ratio - ratio) for ratio in perfect_ratios)
-                harmonic_quality = 1.0 / (1.0 + min_distance)
-                
-                total_harmonic += harmonic_quality * 100
+                total_harmonic += self._pair_price_harmonic(market_data[i].price, market_data[j].price)
                 pair_count += 1
-        
+                
         return total_harmonic / pair_count if pair_count > 0 else 50.0
-    
+        
+    def _pair_price_harmonic(self, price_i: float, price_j: float) -> float:
+        """Harmonic contribution of a single (earlier, later) price pair"""
+        price_ratio = price_i / price_j
+        
+        # Calculate harmonic quality (closer to perfect ratios = higher quality)
+        min_distance = min(abs(price_ratio - ratio) for ratio in self.PERFECT_RATIOS)
+        harmonic_quality = 1.0 / (1.0 + min_distance)
+        
+        return harmonic_quality * 100
+        
     def _calculate_volume_harmonic(self, market_data: List[MarketDataPoint]) -> float:
         """Calculate harmonic component from volume patterns"""
         if not market_data:
@@ -155,7 +263,7 @@ class HarmonicResonanceCalculator:
         stability_factor = 1.0 / (1.0 + (volume_std / (volume_mean + 1)))
         
         return stability_factor * 100
-    
+        
     def _calculate_volatility_harmonic(self, market_data: List[MarketDataPoint]) -> float:
         """Calculate harmonic component from price volatility"""
         if len(market_data) < 2:
@@ -166,7 +274,7 @@ class HarmonicResonanceCalculator:
         for i in range(1, len(market_data)):
             change = abs(market_data[i].price - market_data[i-1].price) / market_data[i-1].price
             price_changes.append(change)
-        
+            
         if not price_changes:
             return 50.0
             
@@ -182,7 +290,7 @@ class HarmonicResonanceCalculator:
         harmonic_quality = 1.0 / (1.0 + volatility_distance * 50)
         
         return harmonic_quality * 100
-    
+        
     def _calculate_momentum_harmonic(self, market_data: List[MarketDataPoint]) -> float:
         """Calculate harmonic component from market momentum"""
         if len(market_data) < 3:
@@ -198,7 +306,7 @@ class HarmonicResonanceCalculator:
             # Calculate acceleration (momentum)
             acceleration = v2 - v1
             momentum_values.append(acceleration)
-        
+            
         if not momentum_values:
             return 50.0
             
@@ -211,7 +319,7 @@ class HarmonicResonanceCalculator:
         consistency_factor = 1.0 / (1.0 + momentum_std * 1000)
         
         return consistency_factor * 100
-    
+        
     def _calculate_resonance_amplification(self, market_data: List[MarketDataPoint]) -> float:
         """Calculate resonance amplification factor based on market harmony"""
         if len(market_data) < 2:
@@ -221,19 +329,92 @@ class HarmonicResonanceCalculator:
         correlations = []
         for i in range(len(market_data)):
             for j in range(i + 1, len(market_data)):
-                # Calculate price change correlation
-                change_i = market_data[i].change_24h
-                change_j = market_data[j].change_24h
+                correlations.append(self._pair_correlation(market_data[i].change_24h, market_data[j].change_24h))
                 
-                # Correlation strength (similar movements = higher correlation)
-                correlation = 1.0 - abs(change_i - change_j) / 100
-                correlations.append(max(0.0, correlation))
-        
         # Average correlation becomes resonance amplification
         avg_correlation = np.mean(correlations) if correlations else 0.5
         
         # Amplification factor ranges from 0.5 to 2.0
         return 0.5 + (avg_correlation * 1.5)
+        
+    def _pair_correlation(self, change_i: float, change_j: float) -> float:
+        """Correlation strength of a single price change pair (similar movements = higher correlation)"""
+        correlation = 1.0 - abs(change_i - change_j) / 100
+        return max(0.0, correlation)
+
+class IncrementalHarmonicResonanceCalculator(HarmonicResonanceCalculator):
+    """
+    Sliding-window HRI that keeps the pairwise aggregates up to date as ticks
+    enter and leave the window instead of rebuilding every pair per tick.
+    
+    Each point in the window owns a row sum over its pairs with every later
+    point, so a new tick adds one term per row and an evicted tick drops its
+    whole row. Updates cost O(window) and match the batch path.
+    """
+    
+    def __init__(self, base_frequency: float = 432.0, window_size: int = 50):
+        super().__init__(base_frequency)
+        self.window_size = window_size
+        self.window: deque = deque()
+        self.current_hri = 0.0
+        
+        # Row sums of the pairwise price harmonic and change correlation terms
+        self._price_rows: List[float] = []
+        self._correlation_rows: List[float] = []
+        
+    def update(self, market_data: MarketDataPoint) -> float:
+        """Slide the window forward by one tick and return the updated HRI"""
+        if len(self.window) >= self.window_size:
+            self.window.popleft()
+            self._price_rows.pop(0)
+            self._correlation_rows.pop(0)
+            
+        # Add the pairs formed by the new tick with every point already in the window
+        for index, data in enumerate(self.window):
+            self._price_rows[index] += self._pair_price_harmonic(data.price, market_data.price)
+            self._correlation_rows[index] += self._pair_correlation(data.change_24h, market_data.change_24h)
+            
+        self.window.append(market_data)
+        self._price_rows.append(0.0)
+        self._correlation_rows.append(0.0)
+        
+        self.current_hri = self._calculate_current_hri()
+        return self.current_hri
+        
+    def extend(self, market_data: List[MarketDataPoint]) -> float:
+        """Feed several ticks in order and return the resulting HRI"""
+        for data in market_data:
+            self.update(data)
+        return self.current_hri
+        
+    def reset(self):
+        """Clear the window and all running aggregates"""
+        self.window.clear()
+        self._price_rows.clear()
+        self._correlation_rows.clear()
+        self.current_hri = 0.0
+        
+    def _calculate_current_hri(self) -> float:
+        """Combine the running pair aggregates with the linear components"""
+        window = list(self.window)
+        if not window:
+            return 0.0
+            
+        pair_count = len(window) * (len(window) - 1) // 2
+        if pair_count > 0:
+            price_harmonic = sum(self._price_rows) / pair_count
+            resonance_factor = 0.5 + (sum(self._correlation_rows) / pair_count) * 1.5
+        else:
+            price_harmonic = 50.0
+            resonance_factor = 1.0
+            
+        return self._combine_components(
+            price_harmonic,
+            self._calculate_volume_harmonic(window),
+            self._calculate_volatility_harmonic(window),
+            self._calculate_momentum_harmonic(window),
+            resonance_factor
+        )
 
 class SonicStabilityCalculator:
     """Advanced SSS calculation with spectral analysis"""
@@ -278,7 +459,7 @@ class SonicStabilityCalculator:
         sss_score = (1.0 - combined_stability) * 100
         
         return max(0.0, min(100.0, sss_score))
-    
+        
     def _extract_frequency_components(self, market_data: List[MarketDataPoint]) -> List[Tuple[float, float]]:
         """Extract frequency components from market data"""
         components = []
@@ -291,9 +472,9 @@ class SonicStabilityCalculator:
             amplitude = math.log10(data.volume + 1) / 10
             
             components.append((frequency, amplitude))
-        
+            
         return components
-    
+        
     def _calculate_spectral_stability(self, frequency_components: List[Tuple[float, float]]) -> float:
         """Calculate stability based on frequency spectrum analysis"""
         if len(frequency_components) < 2:
@@ -319,7 +500,7 @@ class SonicStabilityCalculator:
         stability = 1.0 / (1.0 + spectral_variance / 1000)
         
         return stability
-    
+        
     def _calculate_temporal_stability(self, market_data: List[MarketDataPoint]) -> float:
         """Calculate stability based on temporal consistency"""
         if len(market_data) < 3:
@@ -330,7 +511,7 @@ class SonicStabilityCalculator:
         for i in range(1, len(market_data)):
             interval = market_data[i].timestamp - market_data[i-1].timestamp
             time_intervals.append(interval)
-        
+            
         # Calculate interval consistency
         if not time_intervals:
             return 1.0
@@ -342,7 +523,7 @@ class SonicStabilityCalculator:
         temporal_stability = 1.0 / (1.0 + (interval_std / (mean_interval + 1)))
         
         return temporal_stability
-    
+        
     def _calculate_amplitude_stability(self, market_data: List[MarketDataPoint]) -> float:
         """Calculate stability based on amplitude (volume) consistency"""
         if not market_data:
@@ -362,256 +543,3285 @@ class SonicStabilityCalculator:
         
         return amplitude_stability
 
-class MarketDataIngestionEngine:
-    """Real-time market data ingestion with multiple sources"""
+def market_data_arrays(market_data: List[MarketDataPoint]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Split market data points into price, volume, change and timestamp arrays"""
+    count = len(market_data)
+    prices = np.fromiter((data.price for data in market_data), dtype=np.float64, count=count)
+    volumes = np.fromiter((data.volume for data in market_data), dtype=np.float64, count=count)
+    changes = np.fromiter((data.change_24h for data in market_data), dtype=np.float64, count=count)
+    timestamps = np.fromiter((data.timestamp for data in market_data), dtype=np.float64, count=count)
+    return prices, volumes, changes, timestamps
+
+class VectorizedHarmonicResonanceCalculator(HarmonicResonanceCalculator):
+    """HRI calculation over price/volume/change arrays in a few NumPy passes"""
     
-    def __init__(self):
-        self.data_sources = {
-            'coinbase': 'wss://ws-feed.pro.coinbase.com',
-            'binance': 'wss://stream.binance.com:9443/ws',
-            'kraken': 'wss://ws.kraken.com'
-        }
-        self.active_connections = {}
-        self.data_buffer = deque(maxlen=1000)
-        self.callbacks = []
+    def __init__(self, base_frequency: float = 432.0):
+        super().__init__(base_frequency)
+        self._perfect_ratios = np.array(self.PERFECT_RATIOS)
+        self._pair_count = -1
+        self._pair_indices: Optional[Tuple[np.ndarray, np.ndarray]] = None
         
-    async def start_ingestion(self, symbols: List[str]):
-        """Start real-time data ingestion for specified symbols"""
-        logger.info(f"Starting market data ingestion for symbols: {symbols}")
+    def calculate_hri(self, market_data: List[MarketDataPoint]) -> float:
+        """Calculate HRI for a list of market data points using the vectorized backend"""
+        prices, volumes, changes, _ = market_data_arrays(market_data)
+        return self.calculate_hri_arrays(prices, volumes, changes)
         
-        # Start connections to all data sources
-        tasks = []
-        for source, url in self.data_sources.items():
-            task = asyncio.create_task(self._connect_to_source(source, url, symbols))
-            tasks.append(task)
+    def calculate_hri_arrays(self, prices: np.ndarray, volumes: np.ndarray, changes: np.ndarray) -> float:
+        """Calculate HRI directly from aligned price, volume and 24h change arrays"""
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        changes = np.asarray(changes, dtype=np.float64)
         
-        # Wait for all connections to establish
-        await asyncio.gather(*tasks, return_exceptions=True)
+        if len(prices) == 0:
+            return 0.0
+            
+        return self._combine_components(
+            self._price_harmonic_array(prices),
+            self._volume_harmonic_array(volumes),
+            self._volatility_harmonic_array(prices),
+            self._momentum_harmonic_array(prices),
+            self._resonance_amplification_array(changes)
+        )
         
-    async def _connect_to_source(self, source: str, url: str, symbols: List[str]):
-        """Connect to a specific data source"""
-        try:
-            if source == 'coinbase':
-                await self._connect_coinbase(url, symbols)
-            elif source == 'binance':
-                await self._connect_binance(url, symbols)
-            elif source == 'kraken':
-                await self._connect_kraken(url, symbols)
-                
-        except Exception as e:
-            logger.error(f"Failed to connect to {source}: {e}")
-    
-    async def _connect_coinbase(self, url: str, symbols: List[str]):
-        """Connect to Coinbase Pro WebSocket"""
-        subscribe_message = {
-            "type": "subscribe",
-            "product_ids": [f"{symbol}-USD" for symbol in symbols],
-            "channels": ["ticker"]
-        }
+    def _pairs(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (i, j) index arrays for every pair with i < j. Only the latest count
+        is kept: a full window reuses it on every tick, while caching each
+        size seen during warm-up would hold O(window^3) bytes.
+        """
+        if count != self._pair_count:
+            self._pair_indices = np.triu_indices(count, k=1)
+            self._pair_count = count
+        return self._pair_indices
         
-        async with websockets.connect(url) as websocket:
-            await websocket.send(json.dumps(subscribe_message))
-            logger.info("Connected to Coinbase Pro WebSocket")
+    def _price_harmonic_array(self, prices: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_price_harmonic"""
+        if len(prices) < 2:
+            return 50.0
             
-            async for message in websocket:
-                try:
-                    data = json.loads(message)
-                    if data.get('type') == 'ticker':
-                        market_data = self._parse_coinbase_data(data)
-                        if market_data:
-                            await self._process_market_data(market_data)
-                except Exception as e:
-                    logger.error(f"Error processing Coinbase data: {e}")
-    
-    async def _connect_binance(self, url: str, symbols: List[str]):
-        """Connect to Binance WebSocket"""
-        # Simplified Binance connection (would need full implementation)
-        logger.info("Binance connection placeholder - would implement full WebSocket here")
+        i, j = self._pairs(len(prices))
+        price_ratios = prices[i] / prices[j]
+        min_distance = np.abs(price_ratios[:, None] - self._perfect_ratios).min(axis=1)
+        harmonic_quality = 1.0 / (1.0 + min_distance)
         
-    async def _connect_kraken(self, url: str, symbols: List[str]):
-        """Connect to Kraken WebSocket"""
-        # Simplified Kraken connection (would need full implementation)
-        logger.info("Kraken connection placeholder - would implement full WebSocket here")
-    
-    def _parse_coinbase_data(self, data: Dict[str, Any]) -> Optional[MarketDataPoint]:
-        """Parse Coinbase ticker data into MarketDataPoint"""
-        try:
-            symbol = data.get('product_id', '').replace('-USD', '')
-            price = float(data.get('price', 0))
-            volume = float(data.get('volume_24h', 0))
+        return float(np.mean(harmonic_quality * 100))
+        
+    def _volume_harmonic_array(self, volumes: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_volume_harmonic"""
+        volume_std = np.std(volumes) if len(volumes) > 1 else 0
+        volume_mean = np.mean(volumes)
+        
+        stability_factor = 1.0 / (1.0 + (volume_std / (volume_mean + 1)))
+        
+        return float(stability_factor * 100)
+        
+    def _volatility_harmonic_array(self, prices: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_volatility_harmonic"""
+        if len(prices) < 2:
+            return 50.0
             
-            # Calculate 24h change (simplified - would need historical data)
-            change_24h = 0.0  # Would calculate from historical data
+        price_changes = np.abs(np.diff(prices)) / prices[:-1]
+        volatility_distance = abs(np.mean(price_changes) - 0.02)
+        harmonic_quality = 1.0 / (1.0 + volatility_distance * 50)
+        
+        return float(harmonic_quality * 100)
+        
+    def _momentum_harmonic_array(self, prices: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_momentum_harmonic"""
+        if len(prices) < 3:
+            return 50.0
             
-            return MarketDataPoint(
-                symbol=symbol,
-                price=price,
-                volume=volume,
-                change_24h=change_24h,
-                timestamp=time.time(),
-                source='coinbase'
-            )
-        except Exception as e:
-            logger.error(f"Error parsing Coinbase data: {e}")
-            return None
-    
-    async def _process_market_data(self, market_data: MarketDataPoint):
-        """Process incoming market data"""
-        # Add to buffer
-        self.data_buffer.append(market_data)
+        velocities = np.diff(prices) / prices[:-1]
+        momentum_std = np.std(np.diff(velocities))
+        consistency_factor = 1.0 / (1.0 + momentum_std * 1000)
         
-        # Notify all callbacks
-        for callback in self.callbacks:
-            try:
-                await callback(market_data)
-            except Exception as e:
-                logger.error(f"Error in market data callback: {e}")
-    
-    def add_callback(self, callback):
-        """Add callback for market data updates"""
-        self.callbacks.append(callback)
-    
-    def get_recent_data(self, symbol: str = None, limit: int = 100) -> List[MarketDataPoint]:
-        """Get recent market data from buffer"""
-        if symbol:
-            return [data for data in list(self.data_buffer)[-limit:] if data.symbol == symbol]
-        return list(self.data_buffer)[-limit:]
-
-class SensoryDataLayer:
-    """Main sensory data layer orchestrating all components"""
-    
-    def __init__(self, base_frequency: float = 432.0):
-        self.base_frequency = base_frequency
-        self.hri_calculator = HarmonicResonanceCalculator(base_frequency)
-        self.sss_calculator = SonicStabilityCalculator(base_frequency)
-        self.ingestion_engine = MarketDataIngestionEngine()
+        return float(consistency_factor * 100)
         
-        # Consensus state
-        self.current_hri = 0.0
-        self.current_sss = 0.0
-        self.consensus_history = deque(maxlen=1000)
+    def _resonance_amplification_array(self, changes: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_resonance_amplification"""
+        if len(changes) < 2:
+            return 1.0
+            
+        i, j = self._pairs(len(changes))
+        correlations = np.maximum(0.0, 1.0 - np.abs(changes[i] - changes[j]) / 100)
         
-        # Callbacks for external systems
-        self.consensus_callbacks = []
+        return float(0.5 + (np.mean(correlations) * 1.5))
         
-        # Setup market data callback
-        self.ingestion_engine.add_callback(self._on_market_data_update)
+    def calculate_hri_batch(self, prices: np.ndarray, volumes: np.ndarray, changes: np.ndarray,
+                            chunk_size: int = 256) -> np.ndarray:
+        """
+        Calculate HRI for many baskets at once.
         
-    async def initialize(self, symbols: List[str] = None):
-        """Initialize the sensory data layer"""
-        if symbols is None:
-            symbols = ['BTC', 'ETH', 'SOL', 'ADA']
+        Each argument is a (baskets, points) matrix with one aligned series per
+        row; the result holds one HRI per row. Pairwise terms are evaluated as
+        matrix operations over `chunk_size` rows at a time to bound memory.
+        """
+        prices = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+        volumes = np.atleast_2d(np.asarray(volumes, dtype=np.float64))
+        changes = np.atleast_2d(np.asarray(changes, dtype=np.float64))
+        
+        basket_count, point_count = prices.shape
+        if point_count == 0:
+            return np.zeros(basket_count)
             
-        logger.info("Initializing Orion Rangi Sensory Data Layer")
+        results = np.empty(basket_count)
+        for start in range(0, basket_count, chunk_size):
+            rows = slice(start, start + chunk_size)
+            results[rows] = self._hri_batch_chunk(prices[rows], volumes[rows], changes[rows])
+        return results
         
-        # Start market data ingestion
-        await self.ingestion_engine.start_ingestion(symbols)
+    def _hri_batch_chunk(self, prices: np.ndarray, volumes: np.ndarray, changes: np.ndarray) -> np.ndarray:
+        """Row-wise HRI for one chunk of baskets"""
+        basket_count, point_count = prices.shape
         
-        logger.info("Sensory Data Layer initialized successfully")
-    
-    async def _on_market_data_update(self, market_data: MarketDataPoint):
-        """Handle market data updates and trigger consensus calculations"""
-        try:
-            # Get recent market data for analysis
-            recent_data = self.ingestion_engine.get_recent_data(limit=50)
+        if point_count >= 2:
+            i, j = self._pairs(point_count)
             
-            if len(recent_data) >= 2:
-                # Calculate HRI and SSS
-                hri = self.hri_calculator.calculate_hri(recent_data)
-                sss = self.sss_calculator.calculate_sss(recent_data)
-                
-                # Update current values
-                self.current_hri = hri
-                self.current_sss = sss
-                
-                # Create consensus result
-                consensus_result = ConsensusResult(
-                    hri_value=hri,
-                    sss_value=sss,
-                    harmonic_quality=self._calculate_harmonic_quality(hri, sss),
-                    consensus_timestamp=time.time(),
-                    participating_nodes=1,  # Single node for Genesis Prototype
-                    validation_signatures=[self._generate_validation_signature(hri, sss)]
-                )
-                
-                # Add to history
-                self.consensus_history.append(consensus_result)
-                
-                # Notify callbacks
-                await self._notify_consensus_callbacks(consensus_result)
-                
-                logger.info(f"Consensus Update: HRI={hri:.2f}, SSS={sss:.2f}, Quality={consensus_result.harmonic_quality:.2f}")
-                
-        except Exception as e:
-            logger.error(f"Error processing market data update: {e}")
-    
-    def _calculate_harmonic_quality(self, hri: float, sss: float) -> float:
-        """Calculate overall harmonic quality score"""
-        # Higher HRI and lower SSS indicate better harmonic quality
-        hri_quality = hri / 100.0
-        sss_quality = (100.0 - sss) / 100.0
+            # Price harmonic: distance of every pairwise ratio to the nearest perfect ratio
+            price_ratios = prices[:, i] / prices[:, j]
+            min_distance = np.abs(price_ratios - self._perfect_ratios[0])
+            for ratio in self._perfect_ratios[1:]:
+                np.minimum(min_distance, np.abs(price_ratios - ratio), out=min_distance)
+            price_harmonic = np.mean((1.0 / (1.0 + min_distance)) * 100, axis=1)
+            
+            # Volatility harmonic from relative price steps
+            relative_steps = np.diff(prices, axis=1) / prices[:, :-1]
+            volatility_distance = np.abs(np.mean(np.abs(relative_steps), axis=1) - 0.02)
+            volatility_harmonic = (1.0 / (1.0 + volatility_distance * 50)) * 100
+            
+            # Resonance amplification from pairwise change correlation
+            correlations = np.maximum(0.0, 1.0 - np.abs(changes[:, i] - changes[:, j]) / 100)
+            resonance_factor = 0.5 + np.mean(correlations, axis=1) * 1.5
+        else:
+            relative_steps = None
+            price_harmonic = np.full(basket_count, 50.0)
+            volatility_harmonic = np.full(basket_count, 50.0)
+            resonance_factor = np.ones(basket_count)
+            
+        if point_count >= 3:
+            momentum_std = np.std(np.diff(relative_steps, axis=1), axis=1)
+            momentum_harmonic = (1.0 / (1.0 + momentum_std * 1000)) * 100
+        else:
+            momentum_harmonic = np.full(basket_count, 50.0)
+            
+        volume_std = np.std(volumes, axis=1) if point_count > 1 else np.zeros(basket_count)
+        volume_harmonic = (1.0 / (1.0 + (volume_std / (np.mean(volumes, axis=1) + 1)))) * 100
         
-        return (hri_quality + sss_quality) / 2.0 * 100.0
-    
-    def _generate_validation_signature(self, hri: float, sss: float) -> str:
-        """Generate validation signature for consensus result"""
-        # Simplified signature generation (would use proper cryptography in production)
-        signature_data = f"{hri:.6f}_{sss:.6f}_{self.base_frequency}_{time.time()}"
-        return str(hash(signature_data))
-    
-    async def _notify_consensus_callbacks(self, consensus_result: ConsensusResult):
-        """Notify all consensus callbacks"""
-        for callback in self.consensus_callbacks:
-            try:
-                await callback(consensus_result)
-            except Exception as e:
-                logger.error(f"Error in consensus callback: {e}")
-    
-    def add_consensus_callback(self, callback):
-        """Add callback for consensus updates"""
-        self.consensus_callbacks.append(callback)
-    
-    def get_current_consensus(self) -> Dict[str, Any]:
-        """Get current consensus state"""
-        return {
-            'hri_value': self.current_hri,
-            'sss_value': self.current_sss,
-            'harmonic_quality': self._calculate_harmonic_quality(self.current_hri, self.current_sss),
-            'timestamp': time.time(),
-            'base_frequency': self.base_frequency
-        }
-    
-    def get_consensus_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get consensus history"""
-        return [result.to_dict() for result in list(self.consensus_history)[-limit:]]
+        weighted_hri = (
+            price_harmonic * self.harmonic_weights['price'] +
+            volume_harmonic * self.harmonic_weights['volume'] +
+            volatility_harmonic * self.harmonic_weights['volatility'] +
+            momentum_harmonic * self.harmonic_weights['momentum']
+        )
+        
+        return np.clip(weighted_hri * resonance_factor, 0.0, 100.0)
+
+class VectorizedSonicStabilityCalculator(SonicStabilityCalculator):
+    """SSS calculation over volume/change/timestamp arrays in a few NumPy passes"""
     
-    def get_market_data_summary(self) -> Dict[str, Any]:
-        """Get summary of current market data"""
-        recent_data = self.ingestion_engine.get_recent_data(limit=10)
+    def calculate_sss(self, market_data: List[MarketDataPoint]) -> float:
+        """Calculate SSS for a list of market data points using the vectorized backend"""
+        _, volumes, changes, timestamps = market_data_arrays(market_data)
+        return self.calculate_sss_arrays(volumes, changes, timestamps)
         
-        if not recent_data:
-            return {'status': 'no_data'}
+    def calculate_sss_arrays(self, volumes: np.ndarray, changes: np.ndarray, timestamps: np.ndarray) -> float:
+        """Calculate SSS directly from aligned volume, 24h change and timestamp arrays"""
+        volumes = np.asarray(volumes, dtype=np.float64)
+        changes = np.asarray(changes, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
         
-        # Calculate summary statistics
-        symbols = list(set(data.symbol for data in recent_data))
-        summary = {
-            'symbols': symbols,
-            'data_points': len(recent_data),
-            'latest_timestamp': max(data.timestamp for data in recent_data),
-            'assets': {}
-        }
+        if len(volumes) == 0:
+            return 0.0
+            
+        # Convert price changes to frequencies and volumes to amplitudes
+        frequencies = self.base_frequency * (1 + changes / 100)
+        amplitudes = np.log10(volumes + 1) / 10
         
-        for symbol in symbols:
-            symbol_data = [data for data in recent_data if data.symbol == symbol]
-            if symbol_data:
-                latest = symbol_data[-1]
-                summary['assets'][symbol] = {
-                    'price': latest.price,
+        combined_stability = (
+            self._spectral_stability_array(frequencies, amplitudes) * 0.5 +
+            self._temporal_stability_array(timestamps) * 0.3 +
+            self._amplitude_stability_array(volumes) * 0.2
+        )
+        
+        sss_score = (1.0 - combined_stability) * 100
+        
+        return max(0.0, min(100.0, float(sss_score)))
+        
+    def _spectral_stability_array(self, frequencies: np.ndarray, amplitudes: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_spectral_stability"""
+        if len(frequencies) < 2:
+            return 1.0
+            
+        total_amplitude = np.sum(amplitudes)
+        if total_amplitude == 0:
+            return 1.0
+            
+        weighted_mean_freq = np.dot(frequencies, amplitudes) / total_amplitude
+        spectral_variance = np.dot((frequencies - weighted_mean_freq) ** 2, amplitudes) / total_amplitude
+        
+        return float(1.0 / (1.0 + spectral_variance / 1000))
+        
+    def _temporal_stability_array(self, timestamps: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_temporal_stability"""
+        if len(timestamps) < 3:
+            return 1.0
+            
+        time_intervals = np.diff(timestamps)
+        
+        return float(1.0 / (1.0 + (np.std(time_intervals) / (np.mean(time_intervals) + 1))))
+        
+    def _amplitude_stability_array(self, volumes: np.ndarray) -> float:
+        """Vectorized equivalent of _calculate_amplitude_stability"""
+        if len(volumes) < 2:
+            return 1.0
+            
+        return float(1.0 / (1.0 + (np.std(volumes) / (np.mean(volumes) + 1))))
+        
+    def calculate_sss_batch(self, volumes: np.ndarray, changes: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Calculate SSS for many baskets at once.
+        
+        Each argument is a (baskets, points) matrix with one aligned series per
+        row; the result holds one SSS per row.
+        """
+        volumes = np.atleast_2d(np.asarray(volumes, dtype=np.float64))
+        changes = np.atleast_2d(np.asarray(changes, dtype=np.float64))
+        timestamps = np.atleast_2d(np.asarray(timestamps, dtype=np.float64))
+        
+        basket_count, point_count = volumes.shape
+        if point_count == 0:
+            return np.zeros(basket_count)
+            
+        spectral_stability = np.ones(basket_count)
+        temporal_stability = np.ones(basket_count)
+        amplitude_stability = np.ones(basket_count)
+        
+        if point_count >= 2:
+            # Amplitude-weighted spectral variance per row (rows with no amplitude stay stable)
+            frequencies = self.base_frequency * (1 + changes / 100)
+            amplitudes = np.log10(volumes + 1) / 10
+            total_amplitude = np.sum(amplitudes, axis=1)
+            weighted = total_amplitude != 0
+            safe_total = np.where(weighted, total_amplitude, 1.0)
+            weighted_mean_freq = np.sum(frequencies * amplitudes, axis=1) / safe_total
+            spectral_variance = np.sum(((frequencies - weighted_mean_freq[:, None]) ** 2) * amplitudes, axis=1) / safe_total
+            spectral_stability = np.where(weighted, 1.0 / (1.0 + spectral_variance / 1000), 1.0)
+            
+            amplitude_stability = 1.0 / (1.0 + (np.std(volumes, axis=1) / (np.mean(volumes, axis=1) + 1)))
+            
+        if point_count >= 3:
+            time_intervals = np.diff(timestamps, axis=1)
+            temporal_stability = 1.0 / (1.0 + (np.std(time_intervals, axis=1) / (np.mean(time_intervals, axis=1) + 1)))
+            
+        combined_stability = (
+            spectral_stability * 0.5 +
+            temporal_stability * 0.3 +
+            amplitude_stability * 0.2
+        )
+        
+        return np.clip((1.0 - combined_stability) * 100, 0.0, 100.0)
+
+@dataclass
+class TickWindow:
+    """Zero-copy column views over the most recent ticks of a ColumnarTickBuffer"""
+    price: np.ndarray
+    volume: np.ndarray
+    change_24h: np.ndarray
+    timestamp: np.ndarray
+    symbol_code: np.ndarray
+    source_code: np.ndarray
+    symbols: List[str]
+    sources: List[str]
+    
+    def __len__(self) -> int:
+        return len(self.price)
+        
+    def to_market_data(self) -> List[MarketDataPoint]:
+        """Materialize the window as MarketDataPoint objects"""
+        return [
+            MarketDataPoint(
+                symbol=self.symbols[symbol_code],
+                price=price,
+                volume=volume,
+                change_24h=change_24h,
+                timestamp=timestamp,
+                source=self.sources[source_code]
+            )
+            for price, volume, change_24h, timestamp, symbol_code, source_code in zip(
+                self.price.tolist(), self.volume.tolist(), self.change_24h.tolist(),
+                self.timestamp.tolist(), self.symbol_code.tolist(), self.source_code.tolist()
+            )
+        ]
+
+class ColumnarTickBuffer:
+    """
+    Fixed-capacity struct-of-arrays ring buffer for market ticks.
+    
+    Every column is stored twice back to back (slot i and slot i + capacity),
+    so the most recent N ticks are always one contiguous slice and windows
+    are returned as views without copying. The mirror doubles the memory of
+    every column.
+    
+    Views point into the live ring: a window of n ticks stays valid for the
+    next capacity - n appends and is overwritten after that. Pass copy=True
+    for a window that is kept around.
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.price = np.zeros(2 * capacity, dtype=np.float64)
+        self.volume = np.zeros(2 * capacity, dtype=np.float64)
+        self.change_24h = np.zeros(2 * capacity, dtype=np.float64)
+        self.timestamp = np.zeros(2 * capacity, dtype=np.float64)
+        self.symbol_code = np.zeros(2 * capacity, dtype=np.int32)
+        self.source_code = np.zeros(2 * capacity, dtype=np.int16)
+        
+        # Interned symbol and source names
+        self.symbols: List[str] = []
+        self.sources: List[str] = []
+        self._symbol_codes: Dict[str, int] = {}
+        self._source_codes: Dict[str, int] = {}
+        
+        self._head = 0  # Next slot to write, in [0, capacity)
+        self._size = 0
+        self.total_appended = 0
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def symbol_code_for(self, symbol: str) -> int:
+        """Return the integer code for a symbol, interning it on first use"""
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            code = len(self.symbols)
+            self.symbols.append(symbol)
+            self._symbol_codes[symbol] = code
+        return code
+        
+    def source_code_for(self, source: str) -> int:
+        """Return the integer code for a data source, interning it on first use"""
+        code = self._source_codes.get(source)
+        if code is None:
+            code = len(self.sources)
+            self.sources.append(source)
+            self._source_codes[source] = code
+        return code
+        
+    def append(self, symbol: str, price: float, volume: float, change_24h: float,
+               timestamp: float, source: str):
+        """Append one tick in O(1), overwriting the oldest tick when full"""
+        lower = self._head
+        upper = lower + self.capacity
+        
+        self.price[lower] = self.price[upper] = price
+        self.volume[lower] = self.volume[upper] = volume
+        self.change_24h[lower] = self.change_24h[upper] = change_24h
+        self.timestamp[lower] = self.timestamp[upper] = timestamp
+        self.symbol_code[lower] = self.symbol_code[upper] = self.symbol_code_for(symbol)
+        self.source_code[lower] = self.source_code[upper] = self.source_code_for(source)
+        
+        self._head = (lower + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        self.total_appended += 1
+        
+    def append_point(self, market_data: MarketDataPoint):
+        """Append a MarketDataPoint"""
+        self.append(market_data.symbol, market_data.price, market_data.volume,
+                    market_data.change_24h, market_data.timestamp, market_data.source)
+                    
+    def append_arrays(self, symbol: str, source: str, price: np.ndarray, volume: np.ndarray,
+                      change_24h: np.ndarray, timestamp: np.ndarray):
+        """Append a run of ticks for one symbol and source; only the last `capacity` are kept"""
+        total = len(price)
+        count = min(total, self.capacity)
+        slots = (self._head + np.arange(count)) % self.capacity
+        mirror = slots + self.capacity
+        
+        for column, values in ((self.price, price), (self.volume, volume),
+                               (self.change_24h, change_24h), (self.timestamp, timestamp)):
+            column[slots] = column[mirror] = values[total - count:]
+        self.symbol_code[slots] = self.symbol_code[mirror] = self.symbol_code_for(symbol)
+        self.source_code[slots] = self.source_code[mirror] = self.source_code_for(source)
+        
+        self._head = (self._head + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+        self.total_appended += total
+        
+    def window(self, limit: Optional[int] = None, copy: bool = False) -> TickWindow:
+        """Return views (or copies) of the most recent `limit` ticks, oldest first"""
+        count = self._size if limit is None else max(0, min(limit, self._size))
+        end = self._head + self.capacity
+        window_slice = slice(end - count, end)
+        take = (lambda column: column[window_slice].copy()) if copy else (lambda column: column[window_slice])
+        
+        return TickWindow(
+            price=take(self.price),
+            volume=take(self.volume),
+            change_24h=take(self.change_24h),
+            timestamp=take(self.timestamp),
+            symbol_code=take(self.symbol_code),
+            source_code=take(self.source_code),
+            symbols=list(self.symbols) if copy else self.symbols,
+            sources=list(self.sources) if copy else self.sources
+        )
+        
+    def clear(self):
+        """Drop all buffered ticks, keeping the interned names"""
+        self._head = 0
+        self._size = 0
+        self.total_appended = 0
+
+class RollingMoments:
+    """
+    Weighted running mean/variance (Welford) with O(1) add and remove.
+    
+    With `decay` set, every add first fades the existing weight by
+    (1 - decay), giving exponentially weighted moments instead of a window.
+    """
+    
+    def __init__(self, decay: Optional[float] = None):
+        self.decay = decay
+        self.reset()
+        
+    def reset(self):
+        """Forget every observation"""
+        self.weight = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        
+    def add(self, value: float, weight: float = 1.0):
+        """Add an observation"""
+        if self.decay is not None:
+            self.weight *= (1.0 - self.decay)
+            self.m2 *= (1.0 - self.decay)
+            
+        if weight <= 0.0:
+            return
+            
+        self.weight += weight
+        delta = value - self.mean
+        self.mean += delta * weight / self.weight
+        self.m2 += weight * delta * (value - self.mean)
+        
+    def remove(self, value: float, weight: float = 1.0):
+        """Remove an observation previously added (fixed-window mode only)"""
+        if weight <= 0.0:
+            return
+            
+        remaining = self.weight - weight
+        if remaining <= 0.0:
+            self.reset()
+            return
+            
+        delta = value - self.mean
+        self.mean -= delta * weight / remaining
+        self.m2 -= weight * delta * (value - self.mean)
+        self.weight = remaining
+        
+    @property
+    def variance(self) -> float:
+        """Population (weighted) variance"""
+        if self.weight <= 0.0:
+            return 0.0
+        return max(0.0, self.m2 / self.weight)
+        
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+class StreamingSonicStabilityCalculator(SonicStabilityCalculator):
+    """
+    SSS maintained with online moments so each tick costs O(1).
+    
+    In window mode the interval, volume and amplitude-weighted spectral
+    moments are kept with Welford add/remove over the last `window_size`
+    ticks and match calculate_sss on the same window. With `decay` set the
+    moments are exponentially weighted instead and nothing is removed.
+    """
+    
+    def __init__(self, base_frequency: float = 432.0, window_size: int = 50,
+                 decay: Optional[float] = None, resync_interval: int = 10000):
+        super().__init__(base_frequency)
+        self.window_size = window_size
+        self.decay = decay
+        self.resync_interval = resync_interval
+        
+        # Window of (frequency, amplitude, volume, timestamp) and its intervals
+        self.window: deque = deque()
+        self.intervals: deque = deque()
+        self.count = 0
+        self.nonzero_amplitudes = 0
+        self.last_timestamp = None
+        self._updates_since_resync = 0
+        
+        self.spectral_moments = RollingMoments(decay)
+        self.volume_moments = RollingMoments(decay)
+        self.interval_moments = RollingMoments(decay)
+        
+    def update(self, market_data: MarketDataPoint) -> float:
+        """Add one tick and return the updated SSS"""
+        frequency = self.base_frequency * (1 + market_data.change_24h / 100)
+        amplitude = math.log10(market_data.volume + 1) / 10
+        
+        if self.decay is None and len(self.window) >= self.window_size:
+            self._evict_oldest()
+            
+        if self.last_timestamp is not None:
+            interval = market_data.timestamp - self.last_timestamp
+            self.interval_moments.add(interval)
+            if self.decay is None:
+                self.intervals.append(interval)
+        self.last_timestamp = market_data.timestamp
+        
+        self.spectral_moments.add(frequency, amplitude)
+        self.volume_moments.add(market_data.volume)
+        if amplitude > 0.0:
+            self.nonzero_amplitudes += 1
+        self.count += 1
+        
+        if self.decay is None:
+            self.window.append((frequency, amplitude, market_data.volume, market_data.timestamp))
+            self._updates_since_resync += 1
+            if self._updates_since_resync >= self.resync_interval:
+                self.resync()
+                
+        return self.current_sss
+        
+    def _evict_oldest(self):
+        """Remove the oldest tick and its interval from the running moments"""
+        frequency, amplitude, volume, _ = self.window.popleft()
+        self.spectral_moments.remove(frequency, amplitude)
+        self.volume_moments.remove(volume)
+        if amplitude > 0.0:
+            self.nonzero_amplitudes -= 1
+        self.count -= 1
+        
+        if self.intervals:
+            self.interval_moments.remove(self.intervals.popleft())
+            
+    def resync(self):
+        """Rebuild the window moments from scratch to shed accumulated rounding error"""
+        self._updates_since_resync = 0
+        self.spectral_moments.reset()
+        self.volume_moments.reset()
+        self.interval_moments.reset()
+        
+        for frequency, amplitude, volume, _ in self.window:
+            self.spectral_moments.add(frequency, amplitude)
+            self.volume_moments.add(volume)
+        for interval in self.intervals:
+            self.interval_moments.add(interval)
+            
+    def reset(self):
+        """Clear the window and all running moments"""
+        self.window.clear()
+        self.intervals.clear()
+        self.count = 0
+        self.nonzero_amplitudes = 0
+        self.last_timestamp = None
+        self._updates_since_resync = 0
+        self.spectral_moments.reset()
+        self.volume_moments.reset()
+        self.interval_moments.reset()
+        
+    @property
+    def current_sss(self) -> float:
+        """SSS for the current window, computed from the running moments"""
+        if self.count == 0:
+            return 0.0
+            
+        # Spectral stability from the amplitude-weighted frequency variance
+        if self.count < 2 or self.nonzero_amplitudes == 0:
+            spectral_stability = 1.0
+        else:
+            spectral_stability = 1.0 / (1.0 + self.spectral_moments.variance / 1000)
+            
+        # Temporal stability from interval consistency
+        if self.count < 3:
+            temporal_stability = 1.0
+        else:
+            temporal_stability = 1.0 / (1.0 + (self.interval_moments.std / (self.interval_moments.mean + 1)))
+            
+        # Amplitude stability from volume consistency
+        if self.count < 2:
+            amplitude_stability = 1.0
+        else:
+            amplitude_stability = 1.0 / (1.0 + (self.volume_moments.std / (self.volume_moments.mean + 1)))
+            
+        combined_stability = (
+            spectral_stability * 0.5 +
+            temporal_stability * 0.3 +
+            amplitude_stability * 0.2
+        )
+        
+        sss_score = (1.0 - combined_stability) * 100
+        
+        return max(0.0, min(100.0, sss_score))
+
+class RollingChangeTracker:
+    """
+    Per-symbol rolling 24h price change from a ring of time buckets.
+    
+    Each symbol keeps `window_seconds / bucket_seconds` buckets (1440 one
+    minute buckets by default) holding the first price seen in that bucket.
+    A tick overwrites its bucket and compares against the open of the
+    oldest bucket still inside the window, so an update is O(1) (amortized
+    over the buckets it skips) and memory per symbol is fixed. Changes are
+    exact to bucket resolution; until a symbol has a full window of history
+    they are measured from its oldest tracked price.
+    
+    Rings are keyed by (source, symbol), so prices from one exchange never
+    move the change reported for another.
+    """
+    
+    def __init__(self, window_seconds: float = 86400.0, bucket_seconds: float = 60.0):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.bucket_count = max(1, int(round(window_seconds / bucket_seconds)))
+        
+        # (source, symbol) -> [bucket indices, bucket opens, latest bucket, oldest bucket in window]
+        self._rings: Dict[Tuple[str, str], List[Any]] = {}
+        self.updates = 0
+        
+    def _ring(self, key: Tuple[str, str], bucket: int) -> List[Any]:
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = [np.full(self.bucket_count, -1, dtype=np.int64),
+                                       np.zeros(self.bucket_count, dtype=np.float64), -1, bucket]
+        return ring
+        
+    def update(self, source: str, symbol: str, price: float, timestamp: float) -> float:
+        """Record a tick and return the symbol's change on that source over the window in percent"""
+        bucket = int(timestamp // self.bucket_seconds)
+        ring = self._ring((source, symbol), bucket)
+        buckets, opens, latest, oldest = ring
+        count = self.bucket_count
+        self.updates += 1
+        
+        if bucket > latest:
+            slot = bucket % count
+            buckets[slot] = bucket
+            opens[slot] = price
+            ring[2] = bucket
+            
+            # Slide the oldest pointer into the window and past empty buckets
+            oldest = max(oldest, bucket - count + 1)
+            while buckets[oldest % count] != oldest:
+                oldest += 1
+            ring[3] = oldest
+            
+        reference = opens[oldest % count]
+        return (price - reference) / reference * 100 if reference else 0.0
+        
+    def change(self, source: str, symbol: str, price: float) -> float:
+        """Change of `price` against the symbol's window open without recording a tick"""
+        ring = self._rings.get((source, symbol))
+        if ring is None:
+            return 0.0
+        reference = ring[1][ring[3] % self.bucket_count]
+        return (price - reference) / reference * 100 if reference else 0.0
+        
+    def seed(self, market_data: Iterable[MarketDataPoint], source: Optional[str] = None) -> int:
+        """Replay historical ticks (in time order) into the rings, under `source` when given"""
+        count = 0
+        for data in market_data:
+            self.update(source or data.source, data.symbol, data.price, data.timestamp)
+            count += 1
+        return count
+        
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'symbols': len(self._rings),
+            'buckets_per_symbol': self.bucket_count,
+            'bucket_seconds': self.bucket_seconds,
+            'updates': self.updates,
+            'bytes': len(self._rings) * self.bucket_count * 16
+        }
+
+class MessageDecoder(abc.ABC):
+    """
+    Base decoder turning raw exchange frames into ticks.
+    
+    Frames that cannot be relevant are rejected by a substring check before
+    any JSON parsing, and parsing uses orjson when it is installed (or when
+    json_backend='orjson'), falling back to the standard library.
+    
+    Feeds that number their frames (sequence_from_data) are checked for
+    out-of-order frames; gaps are only counted when the numbers advance by
+    exactly one per frame on the subscribed channel (contiguous_sequences).
+    None of the shipped ticker feeds qualifies: Coinbase's sequence is
+    feed-wide and Binance and Kraken ticker frames carry none, so for them
+    the gap counters stay at zero.
+    
+    Subclasses describe one exchange schema and must implement
+    fields_from_data.
+    """
+    
+    source = 'unknown'
+    type_marker: Optional[str] = None  # Substring every relevant frame contains
+    contiguous_sequences = True
+    gap_log_interval = 10.0  # Seconds between sequence gap warnings
+    
+    def __init__(self, json_backend: str = 'auto', clock=time.time):
+        if json_backend == 'orjson' and orjson is None:
+            raise ImportError("orjson is not installed")
+        if json_backend not in ('auto', 'orjson', 'json'):
+            raise ValueError(f"Unknown JSON backend: {json_backend}")
+            
+        self.json_backend = 'orjson' if orjson is not None and json_backend != 'json' else 'json'
+        self.loads = orjson.loads if self.json_backend == 'orjson' else json.loads
+        self.clock = clock
+        self._marker_bytes = self.type_marker.encode() if self.type_marker else None
+        
+        # Counters
+        self.messages_seen = 0
+        self.messages_skipped = 0
+        self.decode_errors = 0
+        
+        # Sequence gap detection per stream key
+        self.last_sequences: Dict[str, int] = {}
+        self.sequence_gaps = 0
+        self.missed_messages = 0
+        self.out_of_order = 0
+        self._last_gap_log = None
+        
+    def subscribe_messages(self, symbols: List[str]) -> List[Any]:
+        """Subscription frames for one combined multi-symbol stream"""
+        return []
+        
+    def sequence_from_data(self, data: Any) -> Optional[Tuple[str, int]]:
+        """(stream key, sequence number) of a parsed frame, for feeds that carry one"""
+        return None
+        
+    def _check_sequence(self, data: Any):
+        """Count gaps and out-of-order frames in a stream's sequence numbers"""
+        sequence = self.sequence_from_data(data)
+        if sequence is None:
+            return
+            
+        key, number = sequence
+        last = self.last_sequences.get(key)
+        if last is not None:
+            if number <= last:
+                self.out_of_order += 1
+                return
+            if self.contiguous_sequences and number > last + 1:
+                self.sequence_gaps += 1
+                self.missed_messages += number - last - 1
+                self._log_gap(key, last, number)
+        self.last_sequences[key] = number
+        
+    def _log_gap(self, key: str, last: int, number: int):
+        """Warn about sequence gaps at most once per gap_log_interval seconds"""
+        now = time.monotonic()
+        if self._last_gap_log is not None and now - self._last_gap_log < self.gap_log_interval:
+            logger.debug(f"{self.source} sequence gap on {key}: {last} -> {number}")
+            return
+        self._last_gap_log = now
+        logger.warning(f"{self.source} sequence gap on {key}: {last} -> {number} "
+                       f"({self.sequence_gaps} gaps, {self.missed_messages} missed messages so far)")
+                       
+    def is_candidate(self, message) -> bool:
+        """Cheap pre-parse check that a frame may carry a tick"""
+        if self.type_marker is None:
+            return True
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            return self._marker_bytes in bytes(message)
+        return self.type_marker in message
+        
+    def is_relevant(self, data: Any) -> bool:
+        """Check a parsed frame is a tick message"""
+        return True
+        
+    @abc.abstractmethod
+    def fields_from_data(self, data: Any) -> Optional[Tuple[str, float, float, float, float]]:
+        """Extract (symbol, price, volume, change_24h, timestamp) from a parsed frame"""
+        
+    def point_from_data(self, data: Any) -> Optional[MarketDataPoint]:
+        """Build a MarketDataPoint from an already parsed frame"""
+        fields = self.fields_from_data(data)
+        if fields is None:
+            return None
+        symbol, price, volume, change_24h, timestamp = fields
+        return MarketDataPoint(symbol, price, volume, change_24h, timestamp, self.source)
+        
+    def _parse(self, message) -> Optional[Any]:
+        """Pre-filter and parse one frame, returning None for skipped frames"""
+        self.messages_seen += 1
+        if not self.is_candidate(message):
+            self.messages_skipped += 1
+            return None
+            
+        data = self.loads(message)
+        if not self.is_relevant(data):
+            self.messages_skipped += 1
+            return None
+            
+        self._check_sequence(data)
+        return data
+        
+    def decode_point(self, message) -> Optional[MarketDataPoint]:
+        """Decode one raw frame into a MarketDataPoint, or None if it is not a tick"""
+        try:
+            data = self._parse(message)
+            return self.point_from_data(data) if data is not None else None
+        except Exception as e:
+            self.decode_errors += 1
+            logger.error(f"Error decoding {self.source} message: {e}")
+            return None
+            
+    def decode_batch(self, messages: List[Any]) -> List[MarketDataPoint]:
+        """Decode a batch of raw frames, dropping non-tick frames"""
+        points = []
+        for message in messages:
+            market_data = self.decode_point(message)
+            if market_data is not None:
+                points.append(market_data)
+        return points
+        
+    def decode_into(self, message, buffer: 'ColumnarTickBuffer') -> bool:
+        """Decode one raw frame straight into a columnar buffer without building a MarketDataPoint"""
+        try:
+            data = self._parse(message)
+            fields = self.fields_from_data(data) if data is not None else None
+        except Exception as e:
+            self.decode_errors += 1
+            logger.error(f"Error decoding {self.source} message: {e}")
+            return False
+            
+        if fields is None:
+            return False
+        symbol, price, volume, change_24h, timestamp = fields
+        buffer.append(symbol, price, volume, change_24h, timestamp, self.source)
+        return True
+        
+    def decode_batch_into(self, messages: List[Any], buffer: 'ColumnarTickBuffer') -> int:
+        """Decode a batch of raw frames into a columnar buffer, returning the number of ticks written"""
+        return sum(1 for message in messages if self.decode_into(message, buffer))
+        
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'json_backend': self.json_backend,
+            'messages_seen': self.messages_seen,
+            'messages_skipped': self.messages_skipped,
+            'decode_errors': self.decode_errors,
+            'sequence_gaps': self.sequence_gaps,
+            'missed_messages': self.missed_messages,
+            'out_of_order': self.out_of_order
+        }
+
+class CoinbaseTickerDecoder(MessageDecoder):
+    """
+    Decoder for Coinbase ticker channel frames.
+    
+    The 24h change comes from the frame's open_24h when present, otherwise
+    from a RollingChangeTracker fed with every decoded tick.
+    """
+    
+    source = 'coinbase'
+    type_marker = '"ticker"'
+    # Ticker frames carry the product's feed-wide sequence, which also advances
+    # for order book messages, so only their ordering is meaningful here
+    contiguous_sequences = False
+    
+    def __init__(self, json_backend: str = 'auto', clock=time.time,
+                 change_tracker: Optional[RollingChangeTracker] = None):
+        super().__init__(json_backend, clock)
+        self.change_tracker = change_tracker or RollingChangeTracker()
+        
+    def subscribe_messages(self, symbols: List[str]) -> List[Any]:
+        return [{
+            "type": "subscribe",
+            "product_ids": [f"{symbol}-USD" for symbol in symbols],
+            "channels": ["ticker"]
+        }]
+        
+    def is_relevant(self, data: Any) -> bool:
+        return data.get('type') == 'ticker'
+        
+    def sequence_from_data(self, data: Any) -> Optional[Tuple[str, int]]:
+        sequence = data.get('sequence')
+        if sequence is None:
+            return None
+        return data.get('product_id', ''), int(sequence)
+        
+    def fields_from_data(self, data: Any) -> Optional[Tuple[str, float, float, float, float]]:
+        symbol = data.get('product_id', '').replace('-USD', '')
+        price = float(data.get('price', 0))
+        volume = float(data.get('volume_24h', 0))
+        timestamp = self.clock()
+        
+        # The tracker records every tick, even when the frame reports its own
+        # open, so it already has history if a later frame arrives without one
+        change_24h = self.change_tracker.update(self.source, symbol, price, timestamp)
+        open_24h = float(data.get('open_24h') or 0)
+        if open_24h:
+            change_24h = (price - open_24h) / open_24h * 100
+            
+        return symbol, price, volume, change_24h, timestamp
+
+class BinanceTickerDecoder(MessageDecoder):
+    """Decoder for Binance combined-stream 24hr ticker frames"""
+    
+    source = 'binance'
+    type_marker = '"24hrTicker"'
+    quote_currency = 'USDT'
+    streams_per_message = 200  # Binance caps the params of a single SUBSCRIBE request
+    
+    def subscribe_messages(self, symbols: List[str]) -> List[Any]:
+        streams = [f"{symbol.lower()}{self.quote_currency.lower()}@ticker" for symbol in symbols]
+        return [
+            {"method": "SUBSCRIBE", "params": streams[start:start + self.streams_per_message], "id": index + 1}
+            for index, start in enumerate(range(0, len(streams), self.streams_per_message))
+        ]
+        
+    def is_relevant(self, data: Any) -> bool:
+        # Combined streams wrap each event as {"stream": ..., "data": {...}}
+        payload = data.get('data', data) if isinstance(data, dict) else None
+        return isinstance(payload, dict) and payload.get('e') == '24hrTicker'
+        
+    def fields_from_data(self, data: Any) -> Optional[Tuple[str, float, float, float, float]]:
+        payload = data.get('data', data)
+        symbol = payload.get('s', '')
+        if symbol.endswith(self.quote_currency):
+            symbol = symbol[:-len(self.quote_currency)]
+            
+        return (
+            symbol,
+            float(payload.get('c', 0)),
+            float(payload.get('v', 0)),
+            float(payload.get('P', 0)),
+            self.clock()
+        )
+
+class KrakenTickerDecoder(MessageDecoder):
+    """Decoder for Kraken (v1) ticker channel frames"""
+    
+    source = 'kraken'
+    type_marker = '"ticker"'
+    quote_currency = 'USD'
+    
+    # Kraken uses legacy asset codes for a few symbols
+    SYMBOL_ALIASES = {'BTC': 'XBT', 'DOGE': 'XDG'}
+    
+    def __init__(self, json_backend: str = 'auto', clock=time.time):
+        super().__init__(json_backend, clock)
+        self._reverse_aliases = {alias: symbol for symbol, alias in self.SYMBOL_ALIASES.items()}
+        
+    def subscribe_messages(self, symbols: List[str]) -> List[Any]:
+        pairs = [f"{self.SYMBOL_ALIASES.get(symbol, symbol)}/{self.quote_currency}" for symbol in symbols]
+        return [{"event": "subscribe", "pair": pairs, "subscription": {"name": "ticker"}}]
+        
+    def is_relevant(self, data: Any) -> bool:
+        # Ticker updates are arrays: [channel_id, payload, "ticker", pair]; events are objects
+        return isinstance(data, list) and len(data) >= 4 and data[-2] == 'ticker'
+        
+    def fields_from_data(self, data: Any) -> Optional[Tuple[str, float, float, float, float]]:
+        payload = data[1]
+        base = data[-1].split('/')[0]
+        symbol = self._reverse_aliases.get(base, base)
+        
+        price = float(payload['c'][0])
+        volume = float(payload['v'][1])
+        open_24h = float(payload['o'][1])
+        change_24h = (price - open_24h) / open_24h * 100 if open_24h else 0.0
+        
+        return symbol, price, volume, change_24h, self.clock()
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (seconds) with O(log buckets) observe"""
+    
+    # 1us .. 1s in 1-2.5-5 steps, plus an overflow bucket
+    BOUNDS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+              1e-3, 2.5e-3, 5e-3, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+              
+    def __init__(self, bounds: Tuple[float, ...] = BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+            
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile by interpolating inside the bucket that holds it"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= target:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+                return lower + (upper - lower) * (target - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+        
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean_us': (self.sum / self.count * 1e6) if self.count else 0.0,
+            'p50_us': self.quantile(0.50) * 1e6,
+            'p99_us': self.quantile(0.99) * 1e6,
+            'max_us': self.max * 1e6
+        }
+
+class PipelineMetrics:
+    """
+    Per-stage latency histograms and hot-path counters for the sensory pipeline.
+    
+    Stages: parse (frame decode), buffer (tick buffering/indexing/logging),
+    hri_update and sss_update (per-tick incremental/streaming updates),
+    hri_window and sss_window (full window calculations), consensus_job
+    (worker pool round trip), sign, fanout (consensus callbacks and
+    subscribers), tick_fanout (market data subscribers) and
+    tick_to_consensus (latest tick arrival to result published). Counters
+    kept elsewhere (decoder, connection, subscriber and scheduler stats)
+    are collected only when a snapshot is taken.
+    """
+    
+    STAGES = ('parse', 'buffer', 'hri_update', 'hri_window', 'sss_update', 'sss_window', 'consensus_job', 'sign',
+              'fanout', 'tick_fanout', 'tick_to_consensus')
+              
+    def __init__(self):
+        self.histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+        self.counters = {'ticks_in': 0, 'consensus_results': 0}
+        self.tick_started = 0.0
+        
+    def observe(self, stage: str, seconds: float):
+        self.histograms[stage].observe(seconds)
+        
+    def increment(self, counter: str, amount: int = 1):
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+        
+    def snapshot(self, counters: Dict[str, float] = None, gauges: Dict[str, float] = None) -> Dict[str, Any]:
+        """Stage latency summaries plus own and collected counters and gauges"""
+        merged = dict(self.counters)
+        merged.update(counters or {})
+        return {
+            'stages': {stage: histogram.snapshot() for stage, histogram in self.histograms.items()},
+            'counters': merged,
+            'gauges': dict(gauges or {})
+        }
+        
+    def render_prometheus(self, counters: Dict[str, float] = None, gauges: Dict[str, float] = None,
+                          prefix: str = 'orion') -> str:
+        """Render histograms, counters and gauges in the Prometheus text exposition format"""
+        name = f"{prefix}_stage_latency_seconds"
+        lines = [f"# HELP {name} Sensory pipeline stage latency", f"# TYPE {name} histogram"]
+        for stage, histogram in self.histograms.items():
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.bounds, histogram.counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum:.9f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+            
+        merged = dict(self.counters)
+        merged.update(counters or {})
+        for counter, value in merged.items():
+            lines.append(f"# TYPE {prefix}_{counter}_total counter")
+            lines.append(f"{prefix}_{counter}_total {value}")
+        for gauge, value in (gauges or {}).items():
+            lines.append(f"# TYPE {prefix}_{gauge} gauge")
+            lines.append(f"{prefix}_{gauge} {value}")
+        return '\n'.join(lines) + '\n'
+
+class MetricsServer:
+    """Minimal asyncio HTTP endpoint serving Prometheus text at /metrics"""
+    
+    def __init__(self, render, host: str = '127.0.0.1', port: int = 9108):
+        self.render = render
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._server = None
+        
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+        
+    async def start(self):
+        """Start listening; with port=0 an ephemeral port is chosen"""
+        self._server = await asyncio.start_server(self._handle_request, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            
+    async def _handle_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            # Skip headers up to the blank line
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+                
+            self.requests += 1
+            if len(request_line) >= 2 and request_line[0] == 'GET' and request_line[1].split('?')[0] == '/metrics':
+                status, content_type, body = '200 OK', 'text/plain; version=0.0.4; charset=utf-8', self.render().encode()
+            else:
+                status, content_type, body = '404 Not Found', 'text/plain', b'Not Found\n'
+                
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+            await writer.drain()
+        except Exception as e:
+            logger.error(f"Error serving metrics: {e}")
+        finally:
+            writer.close()
+
+class ExchangeConnection:
+    """
+    Managed websocket connection shared by all exchange connectors.
+    
+    Carries one combined multi-symbol stream, reconnects with jittered
+    exponential backoff and resubscribes after every reconnect. Sequence
+    state survives reconnects, so a decoder with contiguous sequences
+    counts the frames lost while disconnected as gaps. The shipped ticker
+    decoders have none (see MessageDecoder), so there a reconnect can
+    lose ticks without any gap being reported.
+    """
+    
+    def __init__(self, url: str, decoder: MessageDecoder, symbols: List[str], on_tick,
+                 initial_backoff: float = 0.5, max_backoff: float = 30.0, jitter: float = 0.5,
+                 max_reconnects: Optional[int] = None, connect=None, metrics: Optional[PipelineMetrics] = None):
+        self.url = url
+        self.decoder = decoder
+        self.symbols = list(symbols)
+        self.on_tick = on_tick
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_reconnects = max_reconnects
+        self.connect = connect or websockets.connect
+        self.metrics = metrics
+        
+        self.connected = False
+        self.reconnects = 0
+        self.ticks_received = 0
+        self._stopped = False
+        self._websocket = None
+        
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter, so many clients do not reconnect in lockstep"""
+        delay = min(self.max_backoff, self.initial_backoff * (2 ** attempt))
+        return delay * (1.0 - self.jitter * random.random())
+        
+    async def run(self):
+        """Connect, subscribe and stream until stopped, reconnecting on failure"""
+        attempt = 0
+        while not self._stopped:
+            try:
+                async with self.connect(self.url) as websocket:
+                    self._websocket = websocket
+                    self.connected = True
+                    attempt = 0
+                    
+                    for message in self.decoder.subscribe_messages(self.symbols):
+                        await websocket.send(json.dumps(message))
+                    logger.info(f"Connected to {self.decoder.source} ({len(self.symbols)} symbols)")
+                    
+                    async for message in websocket:
+                        started = time.perf_counter()
+                        market_data = self.decoder.decode_point(message)
+                        if self.metrics is not None:
+                            self.metrics.observe('parse', time.perf_counter() - started)
+                        if market_data:
+                            self.ticks_received += 1
+                            await self.on_tick(market_data)
+                            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{self.decoder.source} connection error: {e}")
+            finally:
+                self.connected = False
+                self._websocket = None
+                
+            if self._stopped or (self.max_reconnects is not None and self.reconnects >= self.max_reconnects):
+                break
+                
+            delay = self.backoff_delay(attempt)
+            attempt += 1
+            self.reconnects += 1
+            logger.info(f"Reconnecting to {self.decoder.source} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            
+    async def stop(self):
+        """Stop streaming and close the socket"""
+        self._stopped = True
+        if self._websocket is not None:
+            await self._websocket.close()
+            
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.decoder.get_stats()
+        stats.update({
+            'url': self.url,
+            'symbols': len(self.symbols),
+            'connected': self.connected,
+            'reconnects': self.reconnects,
+            'ticks_received': self.ticks_received
+        })
+        return stats
+
+class Subscription:
+    """
+    One downstream consumer with its own bounded queue and delivery task.
+    
+    Drop policies when the queue is full:
+    - 'drop_oldest': discard the oldest queued item to make room
+    - 'drop_newest': discard the incoming item
+    - 'conflate': keep only the latest item per key (e.g. per symbol)
+    - 'block': make the publisher wait (backpressure); nothing is dropped,
+      and close() delivers what is still queued
+    """
+    
+    POLICIES = ('drop_oldest', 'drop_newest', 'conflate', 'block')
+    
+    def __init__(self, consumer, maxsize: int = 1000, policy: str = 'drop_oldest', key=None, name: str = None):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown drop policy: {policy}")
+            
+        self.consumer = consumer
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key or (lambda item: getattr(item, 'symbol', None))
+        self.name = name or getattr(consumer, '__name__', 'consumer')
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._latest: 'OrderedDict[Any, Tuple[Any, float]]' = OrderedDict()
+        self._ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        # Metrics
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._total_lag = 0.0
+        
+    def start(self):
+        """Start the delivery task on the running event loop"""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._ready = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._deliver())
+            
+    @property
+    def depth(self) -> int:
+        if self.policy == 'conflate':
+            return len(self._latest)
+        return self._queue.qsize() if self._queue is not None else 0
+        
+    def offer(self, item: Any):
+        """Enqueue without waiting, applying the drop policy when full"""
+        self.start()
+        self.published += 1
+        entry = (item, time.perf_counter())
+        
+        if self.policy == 'conflate':
+            key = self.key(item)
+            if key in self._latest:
+                self.conflated += 1
+            elif len(self._latest) >= self.maxsize:
+                self._latest.popitem(last=False)
+                self.dropped += 1
+            self._latest[key] = entry
+            self._ready.set()
+        elif self._queue.full():
+            if self.policy == 'drop_newest':
+                self.dropped += 1
+                return
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped += 1
+            self._queue.put_nowait(entry)
+        else:
+            self._queue.put_nowait(entry)
+            
+        self.max_depth = max(self.max_depth, self.depth)
+        
+    async def put(self, item: Any):
+        """Enqueue, waiting for space under the 'block' policy"""
+        if self.policy != 'block':
+            self.offer(item)
+            return
+            
+        self.start()
+        self.published += 1
+        await self._queue.put((item, time.perf_counter()))
+        self.max_depth = max(self.max_depth, self.depth)
+        
+    async def _next_entry(self) -> Tuple[Any, float]:
+        if self.policy != 'conflate':
+            return await self._queue.get()
+            
+        while not self._latest:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._latest.popitem(last=False)[1]
+        
+    async def _deliver(self):
+        """Hand queued items to the consumer one at a time"""
+        while True:
+            item, enqueued_at = await self._next_entry()
+            
+            lag = time.perf_counter() - enqueued_at
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self._total_lag += lag
+            
+            try:
+                await self.consumer(item)
+                self.delivered += 1
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error in subscriber {self.name}: {e}")
+            finally:
+                if self.policy != 'conflate':
+                    self._queue.task_done()
+                    
+    async def drain(self):
+        """Wait until every queued item has been handed to the consumer"""
+        if self._task is not None and self.policy != 'conflate':
+            await self._queue.join()
+            
+    async def close(self):
+        """Stop delivering; queued items are discarded except under the 'block' policy"""
+        if self.policy == 'block':
+            await self.drain()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'policy': self.policy,
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'published': self.published,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'errors': self.errors,
+            'last_lag_ms': self.last_lag * 1000,
+            'max_lag_ms': self.max_lag * 1000,
+            'avg_lag_ms': (self._total_lag / self.delivered * 1000) if self.delivered else 0.0
+        }
+
+class SubscriberFanout:
+    """Publishes items to every subscription without waiting on slow consumers"""
+    
+    def __init__(self):
+        self.subscriptions: List[Subscription] = []
+        
+    def subscribe(self, consumer, maxsize: int = 1000, policy: str = 'drop_oldest', key=None,
+                  name: str = None) -> Subscription:
+        """Attach a consumer with its own bounded queue and drop policy"""
+        subscription = Subscription(consumer, maxsize, policy, key, name)
+        self.subscriptions.append(subscription)
+        return subscription
+        
+    async def unsubscribe(self, subscription: Subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+        await subscription.close()
+        
+    async def publish(self, item: Any):
+        """Offer an item to every subscription; only 'block' subscriptions can make this wait"""
+        for subscription in self.subscriptions:
+            if subscription.policy == 'block':
+                await subscription.put(item)
+            else:
+                subscription.offer(item)
+                
+    async def close(self):
+        for subscription in self.subscriptions:
+            await subscription.close()
+        self.subscriptions.clear()
+        
+    def get_stats(self) -> List[Dict[str, Any]]:
+        return [subscription.get_stats() for subscription in self.subscriptions]
+
+class MarketDataIngestionEngine:
+    """Real-time market data ingestion with multiple sources"""
+    
+    def __init__(self, buffer_size: int = 1000, columnar: bool = False, symbol_buffer_size: int = 1000,
+                 clock=time.time, json_backend: str = 'auto'):
+        self.clock = clock
+        
+        # Rolling 24h change for feeds that do not report one
+        self.change_tracker = RollingChangeTracker()
+        self.decoders: Dict[str, MessageDecoder] = {
+            'coinbase': CoinbaseTickerDecoder(json_backend, clock, self.change_tracker),
+            'binance': BinanceTickerDecoder(json_backend, clock),
+            'kraken': KrakenTickerDecoder(json_backend, clock)
+        }
+        
+        # Managed connections per source; symbols are split across sockets above this size
+        self.symbols_per_connection = 1000
+        self.connections: Dict[str, List[ExchangeConnection]] = {}
+        
+        # Stage latencies and counters, shared with the layer
+        self.metrics = PipelineMetrics()
+        
+        # Queued subscribers that never stall ingestion
+        self.fanout = SubscriberFanout()
+        self.data_sources = {
+            'coinbase': 'wss://ws-feed.pro.coinbase.com',
+            'binance': 'wss://stream.binance.com:9443/stream',
+            'kraken': 'wss://ws.kraken.com'
+        }
+        self.active_connections = {}
+        self.buffer_size = buffer_size
+        
+        # Columnar mode keeps ticks in preallocated arrays instead of one object per tick
+        self.tick_buffer = ColumnarTickBuffer(buffer_size) if columnar else None
+        self.data_buffer = None if columnar else deque(maxlen=buffer_size)
+        
+        # Per-symbol sub-buffers and latest quote table
+        self.columnar = columnar
+        self.symbol_buffer_size = symbol_buffer_size
+        self.symbol_buffers: Dict[str, Any] = {}
+        self.latest_quotes: Dict[str, MarketDataPoint] = {}
+        self.latest_timestamp = 0.0
+        self.callbacks = []
+        
+        # Optional append-only tick log (see sensory_log.TickLog)
+        self.tick_log = None
+        
+    async def start_ingestion(self, symbols: List[str]):
+        """Start real-time data ingestion for specified symbols"""
+        logger.info(f"Starting market data ingestion for symbols: {symbols}")
+        
+        # Start connections to all data sources
+        tasks = []
+        for source, url in self.data_sources.items():
+            task = asyncio.create_task(self._connect_to_source(source, url, symbols))
+            tasks.append(task)
+            
+        # Wait for all connections to establish
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+    async def _connect_to_source(self, source: str, url: str, symbols: List[str]):
+        """Connect to a specific data source"""
+        try:
+            if source == 'coinbase':
+                await self._connect_coinbase(url, symbols)
+            elif source == 'binance':
+                await self._connect_binance(url, symbols)
+            elif source == 'kraken':
+                await self._connect_kraken(url, symbols)
+                
+        except Exception as e:
+            logger.error(f"Failed to connect to {source}: {e}")
+            
+    async def _connect_coinbase(self, url: str, symbols: List[str]):
+        """Connect to Coinbase Pro WebSocket"""
+        await self._run_connections('coinbase', url, symbols)
+        
+    async def _connect_binance(self, url: str, symbols: List[str]):
+        """Connect to Binance combined-stream WebSocket"""
+        await self._run_connections('binance', url, symbols)
+        
+    async def _connect_kraken(self, url: str, symbols: List[str]):
+        """Connect to Kraken WebSocket"""
+        await self._run_connections('kraken', url, symbols)
+        
+    async def _run_connections(self, source: str, url: str, symbols: List[str], **connection_options):
+        """Run managed combined-stream connections for a source until they stop"""
+        connections = [
+            ExchangeConnection(url, self.decoders[source], symbols[start:start + self.symbols_per_connection],
+                               self._process_market_data, metrics=self.metrics, **connection_options)
+            for start in range(0, len(symbols), self.symbols_per_connection)
+        ]
+        self.connections[source] = connections
+        await asyncio.gather(*(connection.run() for connection in connections))
+        
+    async def stop_ingestion(self):
+        """Stop every managed connection"""
+        for connections in self.connections.values():
+            for connection in connections:
+                await connection.stop()
+                
+    def get_connection_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get connection, reconnect and sequence gap counters per source"""
+        return {
+            source: [connection.get_stats() for connection in connections]
+            for source, connections in self.connections.items()
+        }
+        
+    def _parse_coinbase_data(self, data: Dict[str, Any]) -> Optional[MarketDataPoint]:
+        """Parse Coinbase ticker data into MarketDataPoint"""
+        started = time.perf_counter()
+        try:
+            return self.decoders['coinbase'].point_from_data(data)
+        except Exception as e:
+            logger.error(f"Error parsing Coinbase data: {e}")
+            return None
+        finally:
+            self.metrics.observe('parse', time.perf_counter() - started)
+            
+    async def ingest_messages(self, source: str, messages: List[Any]) -> int:
+        """Decode a batch of raw frames from one source and process the resulting ticks"""
+        points = self.decoders[source].decode_batch(messages)
+        for market_data in points:
+            await self._process_market_data(market_data)
+        return len(points)
+        
+    def load_messages(self, source: str, messages: List[Any]) -> int:
+        """
+        Bulk-load raw frames from one source into the buffers without
+        callbacks, subscribers or logging (e.g. a recorded backlog before
+        going live), returning the number of ticks loaded.
+        
+        In columnar mode frames are decoded straight into the tick buffer
+        (decode_batch_into) and routed to the symbol buffers as arrays, so
+        only the latest quote of each symbol becomes a MarketDataPoint.
+        """
+        decoder = self.decoders[source]
+        if self.tick_buffer is None:
+            points = decoder.decode_batch(messages)
+            for market_data in points:
+                self.data_buffer.append(market_data)
+                self._index_market_data(market_data)
+            return len(points)
+            
+        # Chunks no larger than the ring, so every decoded row is still buffered when it is routed
+        buffer = self.tick_buffer
+        loaded = 0
+        for start in range(0, len(messages), buffer.capacity):
+            count = decoder.decode_batch_into(messages[start:start + buffer.capacity], buffer)
+            self._index_window(buffer.window(count), decoder.source)
+            loaded += count
+        return loaded
+        
+    def _index_window(self, window: TickWindow, source: str):
+        """Route rows just decoded into the tick buffer to the symbol buffers and latest quote table"""
+        if not len(window):
+            return
+        for code in np.unique(window.symbol_code).tolist():
+            rows = np.flatnonzero(window.symbol_code == code)
+            symbol = window.symbols[code]
+            symbol_buffer = self.symbol_buffers.get(symbol)
+            if symbol_buffer is None:
+                symbol_buffer = self.symbol_buffers[symbol] = ColumnarTickBuffer(self.symbol_buffer_size)
+            symbol_buffer.append_arrays(symbol, source, window.price[rows], window.volume[rows],
+                                        window.change_24h[rows], window.timestamp[rows])
+                                        
+            last = int(rows[-1])
+            self.latest_quotes[symbol] = MarketDataPoint(symbol, float(window.price[last]), float(window.volume[last]),
+                                                         float(window.change_24h[last]),
+                                                         float(window.timestamp[last]), source)
+        self.latest_timestamp = max(self.latest_timestamp, float(window.timestamp.max()))
+        
+    async def _process_market_data(self, market_data: MarketDataPoint):
+        """Process incoming market data"""
+        metrics = self.metrics
+        started = metrics.tick_started = time.perf_counter()
+        metrics.counters['ticks_in'] += 1
+        
+        # Add to buffer
+        if self.tick_buffer is not None:
+            self.tick_buffer.append_point(market_data)
+        else:
+            self.data_buffer.append(market_data)
+        self._index_market_data(market_data)
+        if self.tick_log is not None:
+            self.tick_log.append_point(market_data)
+        metrics.observe('buffer', time.perf_counter() - started)
+        
+        # Inline callbacks run in order (the layer's consensus trigger is one of them),
+        # so every tick waits for all of them; other consumers are queued subscribers
+        for callback in self.callbacks:
+            try:
+                await callback(market_data)
+            except Exception as e:
+                logger.error(f"Error in market data callback: {e}")
+                
+        # Hand off to queued subscribers
+        if self.fanout.subscriptions:
+            started = time.perf_counter()
+            await self.fanout.publish(market_data)
+            metrics.observe('tick_fanout', time.perf_counter() - started)
+            
+    def _index_market_data(self, market_data: MarketDataPoint):
+        """Route a tick into its symbol's sub-buffer and the latest quote table"""
+        symbol_buffer = self.symbol_buffers.get(market_data.symbol)
+        if symbol_buffer is None:
+            if self.columnar:
+                symbol_buffer = ColumnarTickBuffer(self.symbol_buffer_size)
+            else:
+                symbol_buffer = deque(maxlen=self.symbol_buffer_size)
+            self.symbol_buffers[market_data.symbol] = symbol_buffer
+            
+        if self.columnar:
+            symbol_buffer.append_point(market_data)
+        else:
+            symbol_buffer.append(market_data)
+            
+        self.latest_quotes[market_data.symbol] = market_data
+        if market_data.timestamp > self.latest_timestamp:
+            self.latest_timestamp = market_data.timestamp
+            
+    def restore(self, market_data: List[MarketDataPoint]):
+        """Refill the buffers from saved ticks without callbacks, subscribers or logging"""
+        for data in market_data:
+            if self.tick_buffer is not None:
+                self.tick_buffer.append_point(data)
+            else:
+                self.data_buffer.append(data)
+            self._index_market_data(data)
+            self.change_tracker.update(data.source, data.symbol, data.price, data.timestamp)
+            
+    def add_callback(self, callback, inline: bool = False) -> Optional[Subscription]:
+        """
+        Add callback for market data updates. It is delivered every tick in
+        order through a 'block' subscription, so a slow callback only holds
+        up ingestion once its queue is full. With inline=True it is awaited
+        on every tick before the tick is handed on instead.
+        """
+        if inline:
+            self.callbacks.append(callback)
+            return None
+        return self.subscribe(callback, policy='block')
+        
+    def subscribe(self, consumer, maxsize: int = 1000, policy: str = 'drop_oldest', name: str = None) -> Subscription:
+        """Subscribe a consumer to ticks through its own bounded queue (conflation is per symbol)"""
+        return self.fanout.subscribe(consumer, maxsize, policy, name=name)
+        
+    def get_recent_data(self, symbol: str = None, limit: int = 100) -> List[MarketDataPoint]:
+        """
+        Get recent market data from buffer, or the last `limit` ticks of one symbol.
+        
+        In columnar mode this builds a MarketDataPoint per tick, roughly 12x
+        slower than reading the same ticks with get_recent_window.
+        """
+        if symbol:
+            symbol_buffer = self.symbol_buffers.get(symbol)
+            if symbol_buffer is None:
+                return []
+            if self.columnar:
+                return symbol_buffer.window(limit).to_market_data()
+            return self._deque_tail(symbol_buffer, limit)
+            
+        if self.tick_buffer is not None:
+            return self.tick_buffer.window(limit).to_market_data()
+        return self._deque_tail(self.data_buffer, limit)
+        
+    def snapshot(self) -> List[MarketDataPoint]:
+        """
+        Copy every buffered tick as MarketDataPoints, oldest first.
+        
+        This is O(buffer_size) and, in columnar mode, allocates one object per
+        tick; it is meant for inspection and persistence, not the update path.
+        """
+        if self.tick_buffer is not None:
+            return self.tick_buffer.window().to_market_data()
+        return list(self.data_buffer)
+        
+    def get_recent_window(self, symbol: str = None, limit: int = 100, copy: bool = False) -> TickWindow:
+        """
+        Get the most recent ticks as column arrays. In columnar mode these are
+        views into the live ring (see ColumnarTickBuffer) unless copy is set.
+        """
+        if symbol:
+            symbol_buffer = self.symbol_buffers.get(symbol)
+            if self.columnar and symbol_buffer is not None:
+                return symbol_buffer.window(limit, copy)
+            source_data = self._deque_tail(symbol_buffer, limit) if symbol_buffer is not None else []
+        elif self.tick_buffer is not None:
+            return self.tick_buffer.window(limit, copy)
+        else:
+            source_data = self._deque_tail(self.data_buffer, limit)
+            
+        buffer = ColumnarTickBuffer(max(1, len(source_data)))
+        for data in source_data:
+            buffer.append_point(data)
+        return buffer.window()
+        
+    def _deque_tail(self, buffer: deque, limit: int) -> List[MarketDataPoint]:
+        """Copy only the last `limit` entries of a deque"""
+        if limit >= len(buffer):
+            return list(buffer)
+        tail = [buffer[-index] for index in range(1, limit + 1)]
+        tail.reverse()
+        return tail
+        
+    def get_latest_quote(self, symbol: str) -> Optional[MarketDataPoint]:
+        """Get the most recent tick for a symbol in O(1)"""
+        return self.latest_quotes.get(symbol)
+        
+    def get_tracked_symbols(self) -> List[str]:
+        """Get every symbol that has received at least one tick"""
+        return list(self.latest_quotes)
+        
+    def get_buffered_count(self) -> int:
+        """Number of ticks currently held in the shared buffer"""
+        if self.tick_buffer is not None:
+            return len(self.tick_buffer)
+        return len(self.data_buffer)
+
+class ConsensusScheduler:
+    """
+    Decides which ticks trigger a consensus recomputation.
+    
+    With no options set every tick recomputes. Otherwise a recomputation is
+    due after `tick_interval` new ticks or when a symbol's price moves by
+    `price_move_threshold` (fractional) since the last run, and `max_rate_hz`
+    caps how often any recomputation may run.
+    
+    Each recomputation (immediate or deferred) serves every tick that
+    arrived since the previous one; all but the latest of them are counted
+    as coalesced when it runs, so ticks_seen always equals recomputations
+    + ticks_coalesced + pending_ticks.
+    """
+    
+    def __init__(self, max_rate_hz: Optional[float] = None, tick_interval: Optional[int] = None,
+                 price_move_threshold: Optional[float] = None, clock=time.monotonic):
+        self.max_rate_hz = max_rate_hz
+        self.tick_interval = tick_interval
+        self.price_move_threshold = price_move_threshold
+        self.clock = clock
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        
+        # Scheduling state
+        self.pending_ticks = 0
+        self.deferred = False
+        self.last_run = None
+        self.reference_prices: Dict[str, float] = {}
+        
+        # Counters
+        self.ticks_seen = 0
+        self.recomputations = 0
+        self.ticks_coalesced = 0
+        self.deferred_runs = 0
+        
+    def on_tick(self, market_data: MarketDataPoint) -> bool:
+        """Register a tick and return True if consensus should be recomputed now"""
+        self.ticks_seen += 1
+        self.pending_ticks += 1
+        
+        if self._is_triggered(market_data):
+            self.deferred = True
+            
+        if self.deferred and self.time_until_allowed() <= 0:
+            self._mark_run()
+            return True
+        return False
+        
+    def claim_deferred(self, force: bool = False) -> bool:
+        """Claim a recomputation that was held back by the rate limit"""
+        if not self.deferred or (not force and self.time_until_allowed() > 0):
+            return False
+        self.deferred_runs += 1
+        self._mark_run()
+        return True
+        
+    def restore(self, market_data: List[MarketDataPoint], last_run_timestamp: Optional[float] = None):
+        """
+        Rebuild the trigger state after a restart: ticks newer than the last
+        recomputation are pending again and re-arm the tick-count and
+        price-move triggers. The rate limit runs on this scheduler's own
+        clock and starts fresh.
+        """
+        self.pending_ticks = 0
+        self.deferred = False
+        self.reference_prices.clear()
+        for data in market_data:
+            if last_run_timestamp is not None and data.timestamp <= last_run_timestamp:
+                continue
+            self.pending_ticks += 1
+            if self._is_triggered(data):
+                self.deferred = True
+                
+    def time_until_allowed(self) -> float:
+        """Seconds until the rate limit allows the next recomputation"""
+        if self.last_run is None or not self.min_interval:
+            return 0.0
+        return max(0.0, self.last_run + self.min_interval - self.clock())
+        
+    def _is_triggered(self, market_data: MarketDataPoint) -> bool:
+        """Check the tick-count and price-move triggers"""
+        if self.tick_interval is None and self.price_move_threshold is None:
+            return True
+            
+        if self.tick_interval is not None and self.pending_ticks >= self.tick_interval:
+            return True
+            
+        if self.price_move_threshold is not None:
+            reference = self.reference_prices.get(market_data.symbol)
+            if reference is None:
+                self.reference_prices[market_data.symbol] = market_data.price
+            elif reference and abs(market_data.price / reference - 1.0) >= self.price_move_threshold:
+                return True
+                
+        return False
+        
+    def _mark_run(self):
+        """Reset the trigger state after a recomputation is scheduled"""
+        self.recomputations += 1
+        self.ticks_coalesced += max(0, self.pending_ticks - 1)
+        self.pending_ticks = 0
+        self.deferred = False
+        self.last_run = self.clock()
+        self.reference_prices.clear()
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler counters"""
+        return {
+            'ticks_seen': self.ticks_seen,
+            'recomputations': self.recomputations,
+            'ticks_coalesced': self.ticks_coalesced,
+            'deferred_runs': self.deferred_runs,
+            'pending_ticks': self.pending_ticks
+        }
+
+class ConsensusRollup:
+    """
+    Fixed-capacity ring of time buckets with min/max/sum/last of HRI, SSS
+    and harmonic quality.
+    
+    Bucket n covers [n * resolution, (n + 1) * resolution) and lives in
+    slot n % capacity, so adding a result is O(1) and late results still
+    land in their own bucket while it is inside the ring. The bucket being
+    filled is kept as a Python list and written back when another bucket
+    is touched or the ring is read.
+    """
+    
+    METRICS = ('hri', 'sss', 'quality')
+    STATS = ('min', 'max', 'sum', 'last')
+    
+    def __init__(self, resolution: float, capacity: int):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.bucket_ids = np.full(capacity, -1, dtype=np.int64)
+        self.counts = np.zeros(capacity, dtype=np.int64)
+        self.last_times = np.zeros(capacity, dtype=np.float64)
+        # One row per slot: (min, max, sum, last) for each metric in METRICS order
+        self.values = np.zeros((capacity, len(self.METRICS) * len(self.STATS)), dtype=np.float64)
+        
+        # Write-back row of the bucket being filled: [count, last_time, *values]
+        self._open_bucket = -1
+        self._open: List[float] = []
+        
+    def _flush_open(self):
+        """Write the open bucket back into the ring"""
+        if self._open_bucket >= 0:
+            slot = self._open_bucket % self.capacity
+            self.bucket_ids[slot] = self._open_bucket
+            self.counts[slot] = self._open[0]
+            self.last_times[slot] = self._open[1]
+            self.values[slot] = self._open[2:]
+            
+    def add(self, timestamp: float, hri: float, sss: float, quality: float):
+        """Fold one consensus result into its bucket"""
+        bucket = int(timestamp // self.resolution)
+        if bucket != self._open_bucket:
+            self._flush_open()
+            slot = bucket % self.capacity
+            current = self.bucket_ids[slot]
+            if bucket < current:
+                return  # Older than the ring horizon
+                
+            self._open_bucket = bucket
+            if bucket != current:
+                self._open = [1, timestamp, hri, hri, hri, hri, sss, sss, sss, sss, quality, quality, quality, quality]
+                return
+            self._open = [int(self.counts[slot]), float(self.last_times[slot])] + self.values[slot].tolist()
+            
+        row = self._open
+        row[0] += 1
+        is_latest = timestamp >= row[1]
+        if is_latest:
+            row[1] = timestamp
+        for offset, value in ((2, hri), (6, sss), (10, quality)):
+            if value < row[offset]:
+                row[offset] = value
+            if value > row[offset + 1]:
+                row[offset + 1] = value
+            row[offset + 2] += value
+            if is_latest:
+                row[offset + 3] = value
+                
+    def add_arrays(self, timestamps: np.ndarray, hri: np.ndarray, sss: np.ndarray, quality: np.ndarray):
+        """Fold many results at once (e.g. when rebuilding from the consensus log)"""
+        if len(timestamps) == 0:
+            return
+        self._flush_open()
+        self._open_bucket = -1
+        
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = np.asarray(timestamps, dtype=np.float64)[order]
+        columns = [np.asarray(values, dtype=np.float64)[order] for values in (hri, sss, quality)]
+        
+        # Only the newest `capacity` buckets fit in the ring
+        buckets = (timestamps // self.resolution).astype(np.int64)
+        keep = buckets > buckets[-1] - self.capacity
+        timestamps, buckets = timestamps[keep], buckets[keep]
+        columns = [values[keep] for values in columns]
+        
+        # Reduce each run of equal bucket ids
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(buckets)] - 1
+        group_buckets = buckets[starts]
+        counts = ends - starts + 1
+        last_times = timestamps[ends]
+        rows = np.empty((len(starts), self.values.shape[1]), dtype=np.float64)
+        for index, values in enumerate(columns):
+            offset = index * 4
+            rows[:, offset] = np.minimum.reduceat(values, starts)
+            rows[:, offset + 1] = np.maximum.reduceat(values, starts)
+            rows[:, offset + 2] = np.add.reduceat(values, starts)
+            rows[:, offset + 3] = values[ends]
+            
+        # Merge with buckets already in the ring
+        slots = group_buckets % self.capacity
+        existing = self.bucket_ids[slots] == group_buckets
+        if existing.any():
+            old_rows = self.values[slots[existing]]
+            merged = rows[existing]
+            newer = (self.last_times[slots[existing]] > last_times[existing])[:, None]
+            for offset in (0, 4, 8):
+                merged[:, offset] = np.minimum(merged[:, offset], old_rows[:, offset])
+                merged[:, offset + 1] = np.maximum(merged[:, offset + 1], old_rows[:, offset + 1])
+                merged[:, offset + 2] += old_rows[:, offset + 2]
+            merged[:, 3::4] = np.where(newer, old_rows[:, 3::4], merged[:, 3::4])
+            rows[existing] = merged
+            counts[existing] += self.counts[slots[existing]]
+            last_times[existing] = np.maximum(last_times[existing], self.last_times[slots[existing]])
+            
+        writable = self.bucket_ids[slots] <= group_buckets
+        slots = slots[writable]
+        self.bucket_ids[slots] = group_buckets[writable]
+        self.counts[slots] = counts[writable]
+        self.last_times[slots] = last_times[writable]
+        self.values[slots] = rows[writable]
+        
+    def covers(self, start_time: float, end_time: float) -> bool:
+        """Check whether the ring still holds buckets back to start_time"""
+        return int(start_time // self.resolution) > int(end_time // self.resolution) - self.capacity
+        
+    def query(self, start_time: float, end_time: float, group: int = 1) -> Dict[str, np.ndarray]:
+        """Non-empty buckets in [start_time, end_time], merged `group` buckets at a time"""
+        self._flush_open()
+        last = int(end_time // self.resolution)
+        first = max(int(start_time // self.resolution), last - self.capacity + 1)
+        bucket_ids = np.arange(first, last + 1, dtype=np.int64)
+        slots = bucket_ids % self.capacity
+        present = self.bucket_ids[slots] == bucket_ids
+        bucket_ids, slots = bucket_ids[present], slots[present]
+        
+        rows = self.values[slots]
+        counts = self.counts[slots]
+        if group > 1 and len(bucket_ids):
+            # Merge neighbouring buckets so the result fits the point budget
+            grouped = bucket_ids // group
+            starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+            ends = np.r_[starts[1:], len(grouped)] - 1
+            merged = np.empty((len(starts), rows.shape[1]), dtype=np.float64)
+            merged[:, 0::4] = np.minimum.reduceat(rows[:, 0::4], starts, axis=0)
+            merged[:, 1::4] = np.maximum.reduceat(rows[:, 1::4], starts, axis=0)
+            merged[:, 2::4] = np.add.reduceat(rows[:, 2::4], starts, axis=0)
+            merged[:, 3::4] = rows[ends, 3::4]
+            rows, counts = merged, np.add.reduceat(counts, starts)
+            bucket_ids = grouped[starts] * group
+            
+        result = {
+            'bucket_start': bucket_ids * self.resolution,
+            'count': counts
+        }
+        for index, metric in enumerate(self.METRICS):
+            offset = index * 4
+            result[f'{metric}_min'] = rows[:, offset]
+            result[f'{metric}_max'] = rows[:, offset + 1]
+            result[f'{metric}_mean'] = rows[:, offset + 2] / np.maximum(counts, 1)
+            result[f'{metric}_last'] = rows[:, offset + 3]
+        return result
+
+class ConsensusRollups:
+    """Downsampled consensus history at several resolutions, updated as results arrive"""
+    
+    # (bucket seconds, buckets kept): one day of seconds, one week of minutes, one year of hours
+    DEFAULT_RESOLUTIONS = ((1.0, 86400), (60.0, 10080), (3600.0, 8760))
+    
+    def __init__(self, resolutions: Tuple[Tuple[float, int], ...] = DEFAULT_RESOLUTIONS):
+        self.rollups = [ConsensusRollup(resolution, capacity) for resolution, capacity in sorted(resolutions)]
+        self.latest_timestamp = 0.0
+        
+    def add(self, consensus_result: ConsensusResult):
+        timestamp = consensus_result.consensus_timestamp
+        for rollup in self.rollups:
+            rollup.add(timestamp, consensus_result.hri_value, consensus_result.sss_value,
+                       consensus_result.harmonic_quality)
+        if timestamp > self.latest_timestamp:
+            self.latest_timestamp = timestamp
+            
+    def add_arrays(self, timestamps: np.ndarray, hri: np.ndarray, sss: np.ndarray, quality: np.ndarray):
+        if len(timestamps) == 0:
+            return
+        for rollup in self.rollups:
+            rollup.add_arrays(timestamps, hri, sss, quality)
+        self.latest_timestamp = max(self.latest_timestamp, float(np.max(timestamps)))
+        
+    def save(self, path: str, log_records: int = 0):
+        """Write every ring to an .npz snapshot covering the first `log_records` logged results"""
+        arrays = {
+            'resolutions': np.array([(rollup.resolution, rollup.capacity) for rollup in self.rollups]),
+            'latest_timestamp': np.array(self.latest_timestamp),
+            'log_records': np.array(log_records)
+        }
+        for index, rollup in enumerate(self.rollups):
+            rollup._flush_open()
+            arrays.update({f'bucket_ids_{index}': rollup.bucket_ids, f'counts_{index}': rollup.counts,
+                           f'last_times_{index}': rollup.last_times, f'values_{index}': rollup.values})
+                           
+        # Written aside and renamed, so a crash mid-write leaves the previous snapshot intact
+        with open(path + '.tmp', 'wb') as handle:
+            np.savez(handle, **arrays)
+        os.replace(path + '.tmp', path)
+        
+    @classmethod
+    def load(cls, path: str) -> Tuple['ConsensusRollups', int]:
+        """Read a snapshot written by save(), returning the rollups and the logged results they cover"""
+        with np.load(path) as arrays:
+            rollups = cls(tuple((float(resolution), int(capacity)) for resolution, capacity in arrays['resolutions']))
+            for index, rollup in enumerate(rollups.rollups):
+                rollup.bucket_ids[:] = arrays[f'bucket_ids_{index}']
+                rollup.counts[:] = arrays[f'counts_{index}']
+                rollup.last_times[:] = arrays[f'last_times_{index}']
+                rollup.values[:] = arrays[f'values_{index}']
+            rollups.latest_timestamp = float(arrays['latest_timestamp'])
+            return rollups, int(arrays['log_records'])
+            
+    def query(self, start_time: Optional[float] = None, end_time: Optional[float] = None,
+              max_points: int = 500) -> Dict[str, Any]:
+        """
+        Rolled-up history for a time range in at most `max_points` buckets.
+        
+        Picks the finest resolution that still covers the range within the
+        budget; if even the coarsest covering resolution has too many
+        buckets, neighbouring buckets are merged down to the budget.
+        """
+        if end_time is None:
+            end_time = self.latest_timestamp
+        if start_time is None:
+            start_time = end_time - 3600.0
+        max_points = max(1, max_points)
+        
+        covering = [rollup for rollup in self.rollups if rollup.covers(start_time, end_time)] or self.rollups[-1:]
+        chosen = covering[0]
+        for rollup in covering:
+            chosen = rollup
+            if (end_time - start_time) / rollup.resolution < max_points:
+                break
+                
+        span_buckets = int(end_time // chosen.resolution) - int(start_time // chosen.resolution) + 1
+        group = max(1, -(-span_buckets // max_points))
+        columns = chosen.query(start_time, end_time, group)
+        
+        result: Dict[str, Any] = {
+            'resolution': chosen.resolution * group,
+            'start_time': start_time,
+            'end_time': end_time,
+            'points': len(columns['count'])
+        }
+        result.update({name: values.tolist() for name, values in columns.items()})
+        return result
+
+def consensus_leaf(consensus_result: ConsensusResult) -> bytes:
+    """Deterministic SHA-256 leaf digest of a consensus result's values"""
+    payload = struct.pack('<4di', consensus_result.hri_value, consensus_result.sss_value,
+                          consensus_result.harmonic_quality, consensus_result.consensus_timestamp,
+                          consensus_result.participating_nodes)
+    return hashlib.sha256(b'\x00' + payload).digest()
+
+def _merkle_parent(left: bytes, right: bytes) -> bytes:
+    # Leaves and inner nodes use different prefixes so one cannot pose as the other
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+def merkle_levels(leaves: List[bytes]) -> List[List[bytes]]:
+    """All tree levels from the leaves up to the root; an unpaired last node is promoted unchanged"""
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [_merkle_parent(level[index], level[index + 1]) for index in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+def merkle_path(levels: List[List[Any]], index: int) -> List[Tuple[str, str]]:
+    """Sibling hashes (hex) from a leaf to the root, each tagged 'L' or 'R' for its side"""
+    path = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            node = level[sibling]
+            path.append((node if isinstance(node, str) else node.hex(), 'L' if sibling < index else 'R'))
+        index //= 2
+    return path
+
+def merkle_root_from_path(leaf: bytes, path: List[Tuple[str, str]]) -> bytes:
+    """Recompute the root from a leaf and its sibling path"""
+    node = leaf
+    for sibling_hex, side in path:
+        sibling = bytes.fromhex(sibling_hex)
+        node = _merkle_parent(sibling, node) if side == 'L' else _merkle_parent(node, sibling)
+    return node
+
+def load_signing_key(path: str) -> bytes:
+    """Read a 32-byte signing key, creating it (readable by the owner only) on first use"""
+    try:
+        with open(path, 'rb') as handle:
+            key = handle.read()
+    except FileNotFoundError:
+        key = os.urandom(32)
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(descriptor, 'wb') as handle:
+            handle.write(key)
+        return key
+        
+    if len(key) != 32:
+        raise ValueError(f"{path} does not hold a 32-byte signing key")
+    return key
+
+class MerkleBlockSigner:
+    """
+    Signs consensus results in blocks: one hash per result, one signature per block.
+    
+    Results are collected until `block_size` is reached or the open block
+    is `max_block_age` seconds old (checked as results arrive; the layer
+    also arms a timer so a quiet feed still seals). Sealing builds a SHA-256 Merkle tree,
+    signs the root (HMAC-SHA256, or Ed25519 when the optional
+    `cryptography` package is installed), and attaches to every result an
+    inclusion proof with its sibling path and the signed root; the root
+    signature is appended to its validation_signatures. Every function in
+    `seal_callbacks` is then called with the block and its results.
+    
+    A key is required, either directly or through `key_path`, where one is
+    created on first use and reused afterwards, so proofs can still be
+    verified after a restart.
+    """
+    
+    ALGORITHMS = ('hmac', 'ed25519')
+    
+    def __init__(self, key: Optional[bytes] = None, algorithm: str = 'hmac', block_size: int = 256,
+                 max_block_age: float = 1.0, clock=time.time, key_path: Optional[str] = None):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown signing algorithm: {algorithm}")
+        if algorithm == 'ed25519' and Ed25519PrivateKey is None:
+            raise ImportError("Ed25519 signing requires the 'cryptography' package")
+            
+        self.algorithm = algorithm
+        self.block_size = block_size
+        self.max_block_age = max_block_age
+        self.clock = clock
+        
+        if key is None and key_path is not None:
+            key = load_signing_key(key_path)
+        if not key:
+            raise ValueError("MerkleBlockSigner needs a key or a key_path to keep one in")
+        self.key = key
+        self._private_key = None
+        self._public_key = None
+        if algorithm == 'ed25519':
+            self._private_key = Ed25519PrivateKey.from_private_bytes(self.key)
+            self._public_key = self._private_key.public_key()
+            
+        self._pending: List[ConsensusResult] = []
+        self._leaves: List[bytes] = []
+        self._block_opened = 0.0
+        self.next_block_id = 0
+        self.blocks = deque(maxlen=1000)
+        self.seal_callbacks = []
+        
+        # Metrics
+        self.results_signed = 0
+        self.blocks_sealed = 0
+        self.seal_time = 0.0
+        
+    def public_key(self) -> Optional[bytes]:
+        """Raw Ed25519 public key for external verifiers (None for HMAC)"""
+        if self._public_key is None:
+            return None
+        return self._public_key.public_bytes_raw()
+        
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+        
+    def seal_block(self, block_id: int):
+        """Seal block `block_id` if it is still the open block"""
+        if block_id == self.next_block_id:
+            self.seal()
+            
+    def add(self, consensus_result: ConsensusResult) -> str:
+        """Queue a result for the open block and return its leaf digest (hex)"""
+        leaf = consensus_leaf(consensus_result)
+        if not self._pending:
+            self._block_opened = self.clock()
+        self._pending.append(consensus_result)
+        self._leaves.append(leaf)
+        
+        if len(self._pending) >= self.block_size or self.clock() - self._block_opened >= self.max_block_age:
+            self.seal()
+        return leaf.hex()
+        
+    def _root_message(self, block_id: int, size: int, root: bytes) -> bytes:
+        # The block id and size are signed with the root so blocks cannot be swapped or truncated
+        return struct.pack('<QI', block_id, size) + root
+        
+    def _sign(self, message: bytes) -> str:
+        if self.algorithm == 'ed25519':
+            return self._private_key.sign(message).hex()
+        return hmac.new(self.key, message, hashlib.sha256).hexdigest()
+        
+    def seal(self) -> Optional[Dict[str, Any]]:
+        """Close the open block, sign its root and attach inclusion proofs"""
+        if not self._pending:
+            return None
+            
+        start = time.perf_counter()
+        block_id = self.next_block_id
+        self.next_block_id += 1
+        levels = merkle_levels(self._leaves)
+        root = levels[-1][0]
+        size = len(self._leaves)
+        root_hex = root.hex()
+        signature = self._sign(self._root_message(block_id, size, root))
+        
+        # Hex-encode every tree node once rather than once per proof that uses it
+        hex_levels = [[node.hex() for node in level] for level in levels]
+        for index, consensus_result in enumerate(self._pending):
+            consensus_result.inclusion_proof = {
+                'block_id': block_id,
+                'block_size': size,
+                'leaf_index': index,
+                'path': merkle_path(hex_levels, index),
+                'root': root_hex,
+                'root_signature': signature,
+                'algorithm': self.algorithm
+            }
+            consensus_result.validation_signatures.append(signature)
+            
+        block = {'block_id': block_id, 'size': size, 'root': root_hex, 'signature': signature,
+                 'algorithm': self.algorithm, 'sealed_at': self.clock()}
+        results = self._pending
+        self.blocks.append(block)
+        self.results_signed += size
+        self.blocks_sealed += 1
+        self._pending = []
+        self._leaves = []
+        self.seal_time += time.perf_counter() - start
+        
+        for callback in self.seal_callbacks:
+            try:
+                callback(block, results)
+            except Exception as e:
+                logger.error(f"Error in block seal callback: {e}")
+        return block
+        
+    def verify_root(self, block_id: int, size: int, root_hex: str, signature: str) -> bool:
+        """Check one block root signature"""
+        message = self._root_message(block_id, size, bytes.fromhex(root_hex))
+        if self.algorithm == 'ed25519':
+            try:
+                self._public_key.verify(bytes.fromhex(signature), message)
+                return True
+            except InvalidSignature:
+                return False
+        return hmac.compare_digest(self._sign(message), signature)
+        
+    def verify_results(self, results: List[ConsensusResult]) -> List[bool]:
+        """
+        Verify many results at once: each block root signature is checked once,
+        then every result costs one leaf hash plus its sibling path.
+        """
+        verified_roots: Dict[Tuple[int, int, str, str], bool] = {}
+        outcomes = []
+        for consensus_result in results:
+            proof = consensus_result.inclusion_proof
+            if not proof:
+                outcomes.append(False)
+                continue
+                
+            root_key = (proof['block_id'], proof['block_size'], proof['root'], proof['root_signature'])
+            if root_key not in verified_roots:
+                verified_roots[root_key] = self.verify_root(*root_key)
+            outcomes.append(
+                verified_roots[root_key] and
+                merkle_root_from_path(consensus_leaf(consensus_result), proof['path']).hex() == proof['root']
+            )
+        return outcomes
+        
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'algorithm': self.algorithm,
+            'results_signed': self.results_signed,
+            'blocks_sealed': self.blocks_sealed,
+            'pending': len(self._pending),
+            'avg_seal_ms': (self.seal_time / self.blocks_sealed * 1000) if self.blocks_sealed else 0.0
+        }
+
+# Calculators reused by each worker thread or worker process across consensus jobs
+_worker_state = threading.local()
+
+def _worker_calculators(base_frequency: float, backend: str = 'vectorized') -> Tuple[HarmonicResonanceCalculator, SonicStabilityCalculator]:
+    """Get this worker's calculators for a backend, creating them on first use"""
+    calculators = getattr(_worker_state, 'calculators', None)
+    if calculators is None or calculators[0] != (backend, base_frequency):
+        if backend == 'vectorized':
+            pair = (VectorizedHarmonicResonanceCalculator(base_frequency),
+                    VectorizedSonicStabilityCalculator(base_frequency))
+        else:
+            pair = (HarmonicResonanceCalculator(base_frequency), SonicStabilityCalculator(base_frequency))
+        calculators = _worker_state.calculators = ((backend, base_frequency),) + pair
+    return calculators[1], calculators[2]
+
+def compute_window_values(columns: np.ndarray, base_frequency: float = 432.0,
+                          backend: str = 'vectorized') -> Tuple[float, float]:
+    """Calculate (HRI, SSS) from a (4, n) block of price, volume, change and timestamp rows"""
+    hri_calculator, sss_calculator = _worker_calculators(base_frequency, backend)
+    prices, volumes, changes, timestamps = columns
+    if backend == 'python':
+        # The pure Python calculators only read these four fields
+        market_data = [MarketDataPoint('', price, volume, change_24h, timestamp, '')
+                       for price, volume, change_24h, timestamp in zip(*columns.tolist())]
+        return (float(hri_calculator.calculate_hri(market_data)),
+                float(sss_calculator.calculate_sss(market_data)))
+    return (float(hri_calculator.calculate_hri_arrays(prices, volumes, changes)),
+            float(sss_calculator.calculate_sss_arrays(volumes, changes, timestamps)))
+
+def _attach_shared_memory(segment_name: str) -> shared_memory.SharedMemory:
+    """Attach to a segment owned by the parent without registering it with the resource tracker"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=segment_name, track=False)
+        
+    # Before 3.13 attaching always registers. The tracker is shared with the parent,
+    # so unregistering afterwards would drop the parent's entry too: skip the call instead
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=segment_name)
+    finally:
+        resource_tracker.register = register
+
+def _compute_shared_window(segment_name: str, capacity: int, count: int, base_frequency: float,
+                           backend: str = 'vectorized') -> Tuple[float, float]:
+    """Worker process entry point: read a window in place from shared memory and compute (HRI, SSS)"""
+    segments = getattr(_worker_state, 'segments', None)
+    if segments is None:
+        segments = _worker_state.segments = {}
+        
+    # Segments are attached once per worker and reused for every job in that slot
+    segment = segments.get(segment_name)
+    if segment is None:
+        segment = segments[segment_name] = _attach_shared_memory(segment_name)
+        
+    columns = np.ndarray((4, capacity), dtype=np.float64, buffer=segment.buf)[:, :count]
+    return compute_window_values(columns, base_frequency, backend)
+
+class ConsensusExecutor:
+    """
+    Runs window HRI/SSS jobs off the event loop and hands results back in submission order.
+    
+    - 'thread': a thread pool; cheap to start, but the GIL is only released
+      inside larger NumPy operations
+    - 'process': a process pool; each in-flight job owns a shared-memory slot
+      holding its window columns, so only the slot name and length are pickled
+      
+    Jobs may finish out of order across workers; results are held back and
+    passed to `on_result(context, values)` strictly in submission order.
+    Failed jobs are skipped. `on_capacity()` runs after every emitted or
+    skipped job, so callers can refill the pipeline even when a job fails.
+    
+    Workers use the same calculators as the inline path for `backend`
+    ('python' or 'vectorized'), so results match it for the same window.
+    """
+    
+    MODES = ('thread', 'process')
+    
+    def __init__(self, on_result, mode: str = 'process', workers: Optional[int] = None,
+                 window_size: int = 50, base_frequency: float = 432.0,
+                 max_pending: Optional[int] = None, mp_context: Optional[str] = None,
+                 backend: str = 'vectorized', on_capacity=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown consensus executor mode: {mode}")
+        if backend not in ('python', 'vectorized'):
+            raise ValueError(f"Unknown calculation backend: {backend}")
+            
+        self.on_result = on_result
+        self.on_capacity = on_capacity
+        self.backend = backend
+        self.mode = mode
+        # Leave one core for the event loop by default
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.window_size = window_size
+        self.base_frequency = base_frequency
+        self.max_pending = max_pending or self.workers * 2
+        self.mp_context = mp_context
+        
+        self._pool = None
+        self._segments: List[shared_memory.SharedMemory] = []
+        self._slot_columns: List[np.ndarray] = []
+        self._free_slots: deque = deque()
+        self._tasks = set()
+        
+        # Re-sequencing state
+        self._next_sequence = 0
+        self._next_emit = 0
+        self._completed: Dict[int, Tuple[Any, Optional[Tuple[float, float]]]] = {}
+        self._emitting = False
+        
+        # Metrics
+        self.metrics: Optional[PipelineMetrics] = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.reordered = 0
+        self.coalesced = 0
+        self.max_in_flight = 0
+        self.total_job_time = 0.0
+        
+    @property
+    def in_flight(self) -> int:
+        """Jobs submitted but not yet emitted (running or waiting to be re-sequenced)"""
+        return self._next_sequence - self._next_emit
+        
+    def has_capacity(self) -> bool:
+        return self.in_flight < self.max_pending
+        
+    def start(self):
+        """Create the worker pool and, in process mode, the shared-memory window slots"""
+        if self._pool is not None:
+            return
+            
+        if self.mode == 'thread':
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='consensus')
+            return
+            
+        context = multiprocessing.get_context(self.mp_context) if self.mp_context else None
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        for slot in range(self.max_pending):
+            segment = shared_memory.SharedMemory(create=True, size=4 * self.window_size * 8)
+            self._segments.append(segment)
+            self._slot_columns.append(np.ndarray((4, self.window_size), dtype=np.float64, buffer=segment.buf))
+            self._free_slots.append(slot)
+            
+    def submit(self, prices: np.ndarray, volumes: np.ndarray, changes: np.ndarray,
+               timestamps: np.ndarray, context: Any = None) -> bool:
+        """Queue a window for computation; returns False if `max_pending` jobs are already in flight"""
+        if not self.has_capacity():
+            return False
+            
+        count = len(prices)
+        if count > self.window_size:
+            raise ValueError(f"Window of {count} ticks exceeds executor window size {self.window_size}")
+            
+        self.start()
+        loop = asyncio.get_running_loop()
+        
+        # The window is copied once at submit time, so later ticks cannot change it
+        if self.mode == 'process':
+            slot = self._free_slots.popleft()
+            columns = self._slot_columns[slot]
+            columns[0, :count] = prices
+            columns[1, :count] = volumes
+            columns[2, :count] = changes
+            columns[3, :count] = timestamps
+            future = loop.run_in_executor(self._pool, _compute_shared_window, self._segments[slot].name,
+                                          self.window_size, count, self.base_frequency, self.backend)
+        else:
+            slot = None
+            future = loop.run_in_executor(self._pool, compute_window_values,
+                                          np.array((prices, volumes, changes, timestamps)), self.base_frequency,
+                                          self.backend)
+                                          
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self.submitted += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        
+        task = loop.create_task(self._complete(sequence, slot, context, future, time.perf_counter()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+        
+    async def _complete(self, sequence: int, slot: Optional[int], context: Any, future, submitted_at: float):
+        """Collect one job result and emit every result that is now next in sequence"""
+        try:
+            values = await future
+        except Exception as e:
+            self.failed += 1
+            values = None
+            logger.error(f"Error in consensus worker: {e}")
+        finally:
+            if slot is not None:
+                self._free_slots.append(slot)
+        job_time = time.perf_counter() - submitted_at
+        self.total_job_time += job_time
+        if self.metrics is not None:
+            self.metrics.observe('consensus_job', job_time)
+            
+        if sequence != self._next_emit:
+            self.reordered += 1
+        self._completed[sequence] = (context, values)
+        
+        # A single emitter drains in order, so on_result calls never interleave
+        if self._emitting:
+            return
+        self._emitting = True
+        try:
+            while self._next_emit in self._completed:
+                context, values = self._completed.pop(self._next_emit)
+                self._next_emit += 1
+                if values is not None:
+                    self.completed += 1
+                    try:
+                        await self.on_result(context, values)
+                    except Exception as e:
+                        logger.error(f"Error emitting consensus result: {e}")
+                if self.on_capacity is not None:
+                    try:
+                        self.on_capacity()
+                    except Exception as e:
+                        logger.error(f"Error refilling consensus executor: {e}")
+        finally:
+            self._emitting = False
+            
+    async def drain(self):
+        """Wait until every submitted job (including follow-up submissions) has been emitted"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+            
+    async def close(self):
+        """Drain outstanding jobs, stop the workers and release shared memory"""
+        await self.drain()
+        if self._pool is not None:
+            # Joining the workers blocks, so it runs off the event loop
+            pool, self._pool = self._pool, None
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown, True)
+            
+        self._slot_columns.clear()
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments.clear()
+        self._free_slots.clear()
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job, re-sequencing and backpressure counters"""
+        return {
+            'mode': self.mode,
+            'backend': self.backend,
+            'workers': self.workers,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'reordered': self.reordered,
+            'coalesced': self.coalesced,
+            'avg_job_ms': (self.total_job_time / (self.completed + self.failed) * 1000)
+                          if (self.completed + self.failed) else 0.0
+        }
+
+class SensoryDataLayer:
+    """Main sensory data layer orchestrating all components"""
+    
+    def __init__(self, base_frequency: float = 432.0, hri_mode: str = 'batch', window_size: int = 50,
+                 backend: str = 'python', buffer_size: int = 1000, columnar_buffer: bool = False,
+                 symbol_buffer_size: int = 1000, scheduler: Optional[ConsensusScheduler] = None,
+                 sss_mode: str = 'batch', sss_decay: Optional[float] = None, clock=time.time,
+                 executor: str = 'inline', executor_workers: Optional[int] = None,
+                 tick_log=None, consensus_log=None,
+                 rollup_resolutions: Optional[Tuple[Tuple[float, int], ...]] = ConsensusRollups.DEFAULT_RESOLUTIONS,
+                 signer: Optional[MerkleBlockSigner] = None, log_consensus_updates: bool = True,
+                 change_history: Optional[Iterable[MarketDataPoint]] = None):
+        self.base_frequency = base_frequency
+        self.clock = clock
+        self.hri_mode = hri_mode
+        self.window_size = window_size
+        self.backend = backend
+        if backend not in ('python', 'vectorized'):
+            raise ValueError(f"Unknown calculation backend: {backend}")
+            
+        # Incremental HRI has no vectorized form: with backend='vectorized' it
+        # stays pure Python and the backend only applies to SSS and window reads
+        if hri_mode == 'incremental':
+            self.hri_calculator = IncrementalHarmonicResonanceCalculator(base_frequency, window_size)
+        elif hri_mode == 'batch' and backend == 'vectorized':
+            self.hri_calculator = VectorizedHarmonicResonanceCalculator(base_frequency)
+        elif hri_mode == 'batch':
+            self.hri_calculator = HarmonicResonanceCalculator(base_frequency)
+        else:
+            raise ValueError(f"Unknown HRI mode: {hri_mode}")
+            
+        self.sss_mode = sss_mode
+        self.sss_decay = sss_decay
+        if sss_mode == 'streaming':
+            self.sss_calculator = StreamingSonicStabilityCalculator(base_frequency, window_size, sss_decay)
+        elif sss_mode != 'batch':
+            raise ValueError(f"Unknown SSS mode: {sss_mode}")
+        elif backend == 'vectorized':
+            self.sss_calculator = VectorizedSonicStabilityCalculator(base_frequency)
+        else:
+            self.sss_calculator = SonicStabilityCalculator(base_frequency)
+            
+        # Streaming mode also keeps one O(1) SSS per symbol
+        self.symbol_sss_calculators: Dict[str, StreamingSonicStabilityCalculator] = {}
+        self.ingestion_engine = MarketDataIngestionEngine(buffer_size, columnar=columnar_buffer,
+                                                          symbol_buffer_size=symbol_buffer_size, clock=clock)
+        self.metrics = self.ingestion_engine.metrics
+        self.metrics_server: Optional[MetricsServer] = None
+        
+        # Seed 24h changes from past ticks (e.g. sensory_replay.read_change_history)
+        # so they are meaningful from the first tick
+        if change_history is not None:
+            self.ingestion_engine.change_tracker.seed(change_history)
+            
+        # Per-update INFO logging is a hot-path cost at high consensus rates
+        self.log_consensus_updates = log_consensus_updates
+        
+        # Consensus state
+        self.current_hri = 0.0
+        self.current_sss = 0.0
+        self.consensus_history = deque(maxlen=1000)
+        
+        # Optional append-only logs for warm restarts and long history queries
+        self.ingestion_engine.tick_log = tick_log
+        self.consensus_log = consensus_log
+        
+        # Downsampled history for charting long ranges (None disables)
+        self.rollups = ConsensusRollups(rollup_resolutions) if rollup_resolutions else None
+        # Rollups only match the consensus log once warm_start() has folded in what it held
+        self._rollups_match_log = consensus_log is not None and len(consensus_log) == 0
+        
+        # Block signer for consensus results. The default HMAC key is kept next to the
+        # consensus log so logged proofs stay verifiable; without a log, history only
+        # lives in this process and a per-process key is enough
+        if signer is None:
+            if consensus_log is not None:
+                signer = MerkleBlockSigner(clock=clock, key_path=consensus_log.path + '.key')
+            else:
+                signer = MerkleBlockSigner(os.urandom(32), clock=clock)
+        self.signer = signer
+        self.signer.seal_callbacks.append(self._on_block_sealed)
+        if consensus_log is not None:
+            # Continue the logged block numbering instead of reusing IDs from 0
+            signer.next_block_id = max(signer.next_block_id, consensus_log.blocks.next_block_id())
+            
+        # Callbacks for external systems
+        self.consensus_callbacks = []
+        self.consensus_fanout = SubscriberFanout()
+        self.proof_callbacks = []
+        self._proof_tasks = set()
+        
+        # Recomputation scheduling (every tick by default)
+        if scheduler is None:
+            scheduler = ConsensusScheduler() if clock is time.time else ConsensusScheduler(clock=clock)
+        self.scheduler = scheduler
+        self._deferred_task = None
+        
+        # Rate-limited recomputations are flushed by a timer; replays disable it
+        # and rely on later ticks or flush_pending_consensus() instead
+        self.use_deferred_timer = True
+        
+        # Window calculations run inline on the event loop or in a worker pool
+        if executor not in ('inline',) + ConsensusExecutor.MODES:
+            raise ValueError(f"Unknown consensus executor: {executor}")
+        self.executor = executor
+        self.consensus_executor = None
+        if executor != 'inline':
+            self.consensus_executor = ConsensusExecutor(self._on_executor_result, executor, executor_workers,
+                                                        window_size, base_frequency, backend=backend,
+                                                        on_capacity=self._on_executor_capacity)
+            self.consensus_executor.metrics = self.metrics
+        self._resubmit_pending = False
+        
+        # Setup market data callback; it runs inline so consensus sees every tick as it lands
+        self.ingestion_engine.add_callback(self._on_market_data_update, inline=True)
+        
+    async def initialize(self, symbols: List[str] = None):
+        """Initialize the sensory data layer"""
+        if symbols is None:
+            symbols = ['BTC', 'ETH', 'SOL', 'ADA']
+            
+        logger.info("Initializing Orion Rangi Sensory Data Layer")
+        
+        # Start market data ingestion
+        await self.ingestion_engine.start_ingestion(symbols)
+        
+        logger.info("Sensory Data Layer initialized successfully")
+        
+    async def _on_market_data_update(self, market_data: MarketDataPoint):
+        """Handle market data updates and trigger consensus calculations"""
+        try:
+            # Incremental HRI and streaming SSS track every tick, whether or not consensus runs
+            if self.hri_mode == 'incremental':
+                started = time.perf_counter()
+                self.hri_calculator.update(market_data)
+                self.metrics.observe('hri_update', time.perf_counter() - started)
+            if self.sss_mode == 'streaming':
+                started = time.perf_counter()
+                self._update_streaming_sss(market_data)
+                self.metrics.observe('sss_update', time.perf_counter() - started)
+                
+            if self.scheduler.on_tick(market_data):
+                await self._run_consensus()
+            elif self.scheduler.deferred and self.use_deferred_timer and self._deferred_task is None:
+                # Rate limited: run once more with the latest window when allowed
+                self._deferred_task = asyncio.get_running_loop().create_task(
+                    self._run_deferred_consensus(self.scheduler.time_until_allowed())
+                )
+                
+        except Exception as e:
+            logger.error(f"Error processing market data update: {e}")
+            
+    async def _run_deferred_consensus(self, delay: float):
+        """Run a rate-limited recomputation once the limit allows it"""
+        try:
+            await asyncio.sleep(delay)
+            self._deferred_task = None
+            if self.scheduler.claim_deferred():
+                await self._run_consensus()
+        except Exception as e:
+            self._deferred_task = None
+            logger.error(f"Error in deferred consensus update: {e}")
+            
+    async def flush_pending_consensus(self):
+        """Run any recomputation still held back by the scheduler, ignoring the rate limit"""
+        if self.scheduler.claim_deferred(force=True):
+            await self._run_consensus()
+        if self.consensus_executor is not None:
+            await self.consensus_executor.drain()
+        self.signer.seal()
+        await self._drain_proof_callbacks()
+        
+    async def _run_consensus(self):
+        """Recompute HRI/SSS over the latest window and publish a consensus result"""
+        # Incremental HRI with streaming SSS is already O(1), so only batch work is offloaded
+        if self.consensus_executor is not None and not (self.hri_mode == 'incremental' and self.sss_mode == 'streaming'):
+            self._submit_consensus_job()
+            return
+            
+        # Calculate HRI and SSS over the recent window
+        values = self._calculate_window_values()
+        
+        if values is not None:
+            await self._publish_consensus(values[0], values[1], self.clock())
+            
+    def _submit_consensus_job(self):
+        """Ship the latest window to the consensus executor, coalescing while it is saturated"""
+        executor = self.consensus_executor
+        if not executor.has_capacity():
+            # Submit once more with the freshest window when a job is emitted
+            self._resubmit_pending = True
+            executor.coalesced += 1
+            return
+            
+        columns = self._window_columns()
+        if columns is None:
+            return
+            
+        # Incremental/streaming values and the timestamp belong to the moment of submission
+        context = (
+            self.clock(),
+            self.hri_calculator.current_hri if self.hri_mode == 'incremental' else None,
+            self.sss_calculator.current_sss if self.sss_mode == 'streaming' else None
+        )
+        executor.submit(*columns, context=context)
+        
+    async def _on_executor_result(self, context: Tuple[float, Optional[float], Optional[float]],
+                                  values: Tuple[float, float]):
+        """Publish a worker result (called in submission order by the executor)"""
+        consensus_timestamp, hri, sss = context
+        await self._publish_consensus(values[0] if hri is None else hri,
+                                      values[1] if sss is None else sss, consensus_timestamp)
+                                      
+    def _on_executor_capacity(self):
+        """Submit the coalesced trigger once a job is emitted or has failed"""
+        if self._resubmit_pending and self.consensus_executor.has_capacity():
+            self._resubmit_pending = False
+            self._submit_consensus_job()
+            
+    def _window_columns(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """Price, volume, change and timestamp arrays of the analysis window, or None if too short"""
+        engine = self.ingestion_engine
+        if engine.tick_buffer is not None:
+            window = engine.get_recent_window(limit=self.window_size)
+            if len(window) < 2:
+                return None
+            return window.price, window.volume, window.change_24h, window.timestamp
+            
+        recent_data = engine.get_recent_data(limit=self.window_size)
+        if len(recent_data) < 2:
+            return None
+        return market_data_arrays(recent_data)
+        
+    async def _publish_consensus(self, hri: float, sss: float, consensus_timestamp: float):
+        """Record and publish this node's own consensus result for one HRI/SSS pair"""
+        await self.publish_consensus_result(ConsensusResult(
+            hri_value=hri,
+            sss_value=sss,
+            harmonic_quality=self._calculate_harmonic_quality(hri, sss),
+            consensus_timestamp=consensus_timestamp,
+            participating_nodes=1,
+            validation_signatures=[]
+        ))
+        
+    async def publish_consensus_result(self, consensus_result: ConsensusResult):
+        """
+        Record, sign and publish a consensus result. Results aggregated
+        elsewhere (e.g. by a resonance cluster) enter here with their own
+        participating_nodes and node signatures; the block signature is
+        appended to those when the block seals.
+        """
+        hri = consensus_result.hri_value
+        sss = consensus_result.sss_value
+        self.current_hri = hri
+        self.current_sss = sss
+        
+        # Add to history
+        self.consensus_history.append(consensus_result)
+        if self.consensus_log is not None:
+            self.consensus_log.append_result(consensus_result)
+        if self.rollups is not None:
+            self.rollups.add(consensus_result)
+            
+        # Queued for signing after it is logged, so a sealed block always covers the
+        # last logged results; the signature and proof follow when the block seals
+        started = time.perf_counter()
+        self.signer.add(consensus_result)
+        self.metrics.observe('sign', time.perf_counter() - started)
+        if self.signer.pending == 1 and self.use_deferred_timer:
+            asyncio.get_running_loop().call_later(self.signer.max_block_age, self.signer.seal_block,
+                                                  self.signer.next_block_id)
+                                                  
+        # Notify callbacks
+        started = time.perf_counter()
+        await self._notify_consensus_callbacks(consensus_result)
+        finished = time.perf_counter()
+        self.metrics.observe('fanout', finished - started)
+        self.metrics.observe('tick_to_consensus', finished - self.metrics.tick_started)
+        self.metrics.counters['consensus_results'] += 1
+        
+        if self.log_consensus_updates:
+            logger.info(f"Consensus Update: HRI={hri:.2f}, SSS={sss:.2f}, Quality={consensus_result.harmonic_quality:.2f}")
+            
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """Get consensus scheduling counters, including ticks coalesced into a later run"""
+        return self.scheduler.get_stats()
+        
+    def _collect_metrics(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Gather counters and gauges kept by decoders, connections, subscribers and workers"""
+        engine = self.ingestion_engine
+        decoders = [decoder.get_stats() for decoder in engine.decoders.values()]
+        connections = [stats for source in engine.get_connection_stats().values() for stats in source]
+        subscribers = self.get_subscriber_stats()
+        subscriptions = subscribers['market_data'] + subscribers['consensus']
+        executor = self.consensus_executor
+        
+        counters = {
+            'messages_seen': sum(stats['messages_seen'] for stats in decoders),
+            'messages_skipped': sum(stats['messages_skipped'] for stats in decoders),
+            'decode_errors': sum(stats['decode_errors'] for stats in decoders),
+            'sequence_gaps': sum(stats['sequence_gaps'] for stats in decoders),
+            'missed_messages': sum(stats['missed_messages'] for stats in decoders),
+            'reconnects': sum(stats['reconnects'] for stats in connections),
+            'subscriber_drops': sum(stats['dropped'] for stats in subscriptions),
+            'subscriber_conflated': sum(stats['conflated'] for stats in subscriptions),
+            'ticks_coalesced': self.scheduler.ticks_coalesced,
+            'consensus_jobs_coalesced': executor.coalesced if executor is not None else 0
+        }
+        gauges = {
+            'connections_up': sum(1 for stats in connections if stats['connected']),
+            'buffered_ticks': engine.get_buffered_count(),
+            'tracked_symbols': len(engine.latest_quotes),
+            'subscriber_queue_depth': sum(stats['depth'] for stats in subscriptions),
+            'subscriber_max_lag_seconds': max((stats['max_lag_ms'] for stats in subscriptions), default=0.0) / 1000,
+            'consensus_jobs_in_flight': executor.in_flight if executor is not None else 0,
+            'signer_pending': self.signer.pending
+        }
+        return counters, gauges
+        
+    def get_metrics_snapshot(self) -> Dict[str, Any]:
+        """Get per-stage latency summaries with pipeline counters and gauges"""
+        return self.metrics.snapshot(*self._collect_metrics())
+        
+    def render_metrics(self) -> str:
+        """Render pipeline metrics in the Prometheus text format"""
+        return self.metrics.render_prometheus(*self._collect_metrics())
+        
+    async def start_metrics_server(self, host: str = '127.0.0.1', port: int = 9108) -> MetricsServer:
+        """Serve render_metrics() over HTTP at /metrics"""
+        if self.metrics_server is None:
+            self.metrics_server = MetricsServer(self.render_metrics, host, port)
+            await self.metrics_server.start()
+        return self.metrics_server
+        
+    def get_executor_stats(self) -> Dict[str, Any]:
+        """Get worker pool counters (inline mode has none)"""
+        if self.consensus_executor is None:
+            return {'mode': 'inline'}
+        return self.consensus_executor.get_stats()
+        
+    async def close(self):
+        """Finish outstanding consensus jobs, release the worker pool and subscribers and flush the logs"""
+        await self.ingestion_engine.fanout.close()
+        if self.consensus_executor is not None:
+            await self.consensus_executor.close()
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+            self.metrics_server = None
+        self.signer.seal()
+        await self._drain_proof_callbacks()
+        await self.consensus_fanout.close()
+        if self.rollups is not None and self._rollups_match_log:
+            # The next warm start loads this and only folds in results logged after it
+            self.rollups.save(self.consensus_log.path + '.rollups', len(self.consensus_log))
+        for log in (self.ingestion_engine.tick_log, self.consensus_log):
+            if log is not None:
+                log.flush()
+                
+    def warm_start(self, tick_count: Optional[int] = None) -> Dict[str, Any]:
+        """Rebuild windows and consensus state from the log tails instead of starting cold"""
+        start = time.perf_counter()
+        engine = self.ingestion_engine
+        restored_ticks = []
+        
+        if engine.tick_log is not None:
+            restored_ticks = engine.tick_log.tail_points(tick_count or engine.buffer_size)
+            engine.restore(restored_ticks)
+            
+            # Incremental HRI and streaming SSS pick up from the restored window
+            if self.hri_mode == 'incremental':
+                self.hri_calculator.reset()
+                self.hri_calculator.extend(restored_ticks[-self.window_size:])
+            if self.sss_mode == 'streaming':
+                for data in restored_ticks:
+                    self._update_streaming_sss(data)
+                    
+        restored_results = []
+        if self.consensus_log is not None:
+            restored_results = self.consensus_log.tail_results(self.consensus_history.maxlen)
+            self.consensus_history.extend(restored_results)
+            if restored_results:
+                self.current_hri = restored_results[-1].hri_value
+                self.current_sss = restored_results[-1].sss_value
+                
+            if restored_results and self.rollups is not None:
+                self._restore_rollups()
+            self._rollups_match_log = True
+            
+        # Ticks that arrived after the last logged result still count towards the next trigger
+        self.scheduler.restore(restored_ticks, restored_results[-1].consensus_timestamp if restored_results else None)
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Warm start: {len(restored_ticks)} ticks and {len(restored_results)} consensus results in {elapsed_ms:.1f}ms")
+        return {'ticks': len(restored_ticks), 'consensus_results': len(restored_results),
+                'pending_ticks': self.scheduler.pending_ticks, 'elapsed_ms': elapsed_ms}
+                
+    def _restore_rollups(self):
+        """
+        Load the rollup snapshot saved by close() and fold in the results
+        logged after it. Without a usable snapshot (first start, other
+        resolutions, or a log shorter than the snapshot) each ring is
+        rebuilt from the log over its own horizon.
+        """
+        log = self.consensus_log
+        path = log.path + '.rollups'
+        resolutions = [(rollup.resolution, rollup.capacity) for rollup in self.rollups.rollups]
+        if os.path.exists(path):
+            try:
+                rollups, covered = ConsensusRollups.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable rollup snapshot {path}: {e}")
+            else:
+                if covered <= len(log) and [(rollup.resolution, rollup.capacity)
+                                            for rollup in rollups.rollups] == resolutions:
+                    records = log.read(covered)
+                    rollups.add_arrays(records['timestamp'], records['hri_value'], records['sss_value'],
+                                       records['harmonic_quality'])
+                    self.rollups = rollups
+                    return
+                    
+        latest = float(log.tail(1)['timestamp'][0])
+        for rollup in self.rollups.rollups:
+            records = log.time_range(latest - rollup.resolution * rollup.capacity)
+            rollup.add_arrays(records['timestamp'], records['hri_value'], records['sss_value'],
+                              records['harmonic_quality'])
+        self.rollups.latest_timestamp = max(self.rollups.latest_timestamp, latest)
+        
+    def _calculate_window_values(self) -> Optional[Tuple[float, float]]:
+        """Calculate (HRI, SSS) over the analysis window, or None if it is too short"""
+        engine = self.ingestion_engine
+        
+        # Vectorized calculators read the columnar buffer without building objects
+        if self.backend == 'vectorized' and engine.tick_buffer is not None:
+            window = engine.get_recent_window(limit=self.window_size)
+            if len(window) < 2:
+                return None
+                
+            if self.hri_mode == 'incremental':
+                hri = self.hri_calculator.current_hri
+            else:
+                started = time.perf_counter()
+                hri = self.hri_calculator.calculate_hri_arrays(window.price, window.volume, window.change_24h)
+                self.metrics.observe('hri_window', time.perf_counter() - started)
+            if self.sss_mode == 'streaming':
+                sss = self.sss_calculator.current_sss
+            else:
+                started = time.perf_counter()
+                sss = self.sss_calculator.calculate_sss_arrays(window.volume, window.change_24h, window.timestamp)
+                self.metrics.observe('sss_window', time.perf_counter() - started)
+            return hri, sss
+            
+        if min(engine.get_buffered_count(), self.window_size) < 2:
+            return None
+            
+        # Only the batch calculators need the window as MarketDataPoints
+        recent_data = None
+        if self.hri_mode != 'incremental' or self.sss_mode != 'streaming':
+            recent_data = engine.get_recent_data(limit=self.window_size)
+            
+        if self.hri_mode == 'incremental':
+            hri = self.hri_calculator.current_hri
+        else:
+            started = time.perf_counter()
+            hri = self.hri_calculator.calculate_hri(recent_data)
+            self.metrics.observe('hri_window', time.perf_counter() - started)
+        if self.sss_mode == 'streaming':
+            sss = self.sss_calculator.current_sss
+        else:
+            started = time.perf_counter()
+            sss = self.sss_calculator.calculate_sss(recent_data)
+            self.metrics.observe('sss_window', time.perf_counter() - started)
+        return hri, sss
+        
+    def _update_streaming_sss(self, market_data: MarketDataPoint):
+        """Feed a tick to the window-wide and per-symbol streaming SSS calculators"""
+        self.sss_calculator.update(market_data)
+        
+        symbol_calculator = self.symbol_sss_calculators.get(market_data.symbol)
+        if symbol_calculator is None:
+            symbol_calculator = StreamingSonicStabilityCalculator(self.base_frequency, self.window_size, self.sss_decay)
+            self.symbol_sss_calculators[market_data.symbol] = symbol_calculator
+        symbol_calculator.update(market_data)
+        
+    def evaluate_baskets(self, prices: np.ndarray, volumes: np.ndarray, changes: np.ndarray,
+                         timestamps: np.ndarray) -> Dict[str, np.ndarray]:
+        """Evaluate HRI/SSS for a matrix of aligned basket series (one basket per row)"""
+        hri_calculator = self.hri_calculator
+        if not isinstance(hri_calculator, VectorizedHarmonicResonanceCalculator):
+            hri_calculator = VectorizedHarmonicResonanceCalculator(self.base_frequency)
+        sss_calculator = self.sss_calculator
+        if not isinstance(sss_calculator, VectorizedSonicStabilityCalculator):
+            sss_calculator = VectorizedSonicStabilityCalculator(self.base_frequency)
+            
+        hri = hri_calculator.calculate_hri_batch(prices, volumes, changes)
+        sss = sss_calculator.calculate_sss_batch(volumes, changes, timestamps)
+        return {
+            'hri_values': hri,
+            'sss_values': sss,
+            'harmonic_quality': ((hri / 100.0) + ((100.0 - sss) / 100.0)) / 2.0 * 100.0
+        }
+        
+    def get_symbol_sss(self, symbol: str = None) -> Dict[str, float]:
+        """Get the streaming SSS per symbol (streaming SSS mode only)"""
+        if symbol:
+            calculator = self.symbol_sss_calculators.get(symbol)
+            return {symbol: calculator.current_sss} if calculator else {}
+        return {name: calculator.current_sss for name, calculator in self.symbol_sss_calculators.items()}
+        
+    def _calculate_harmonic_quality(self, hri: float, sss: float) -> float:
+        """Calculate overall harmonic quality score"""
+        # Higher HRI and lower SSS indicate better harmonic quality
+        hri_quality = hri / 100.0
+        sss_quality = (100.0 - sss) / 100.0
+        
+        return (hri_quality + sss_quality) / 2.0 * 100.0
+        
+    def verify_consensus(self, results: List[ConsensusResult]) -> List[bool]:
+        """Batch-verify inclusion proofs and block signatures of consensus results"""
+        return self.signer.verify_results(results)
+        
+    async def _notify_consensus_callbacks(self, consensus_result: ConsensusResult):
+        """Notify all consensus callbacks"""
+        for callback in self.consensus_callbacks:
+            try:
+                await callback(consensus_result)
+            except Exception as e:
+                logger.error(f"Error in consensus callback: {e}")
+                
+        if self.consensus_fanout.subscriptions:
+            await self.consensus_fanout.publish(consensus_result)
+            
+    def add_consensus_callback(self, callback, inline: bool = False) -> Optional[Subscription]:
+        """
+        Add callback for consensus updates. Every result is delivered in order
+        through a 'block' subscription; with inline=True the callback is
+        awaited when the result is published instead, delaying the tick that
+        triggered it.
+        """
+        if inline:
+            self.consensus_callbacks.append(callback)
+            return None
+        return self.subscribe_consensus(callback, maxsize=1000, policy='block')
+        
+    def add_proof_callback(self, callback):
+        """
+        Add callback(block, results) for sealed signing blocks. Results reach
+        consensus callbacks before their block seals; this is where they
+        arrive again with their inclusion proofs and root signature.
+        """
+        self.proof_callbacks.append(callback)
+        
+    def _on_block_sealed(self, block: Dict[str, Any], results: List[ConsensusResult]):
+        """Log a sealed block and hand its proven results to the proof callbacks"""
+        if self.consensus_log is not None:
+            self.consensus_log.append_block(block)
+        if not self.proof_callbacks:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(f"Block {block['block_id']} sealed outside the event loop; proof callbacks skipped")
+            return
+        task = loop.create_task(self._notify_proof_callbacks(block, results))
+        self._proof_tasks.add(task)
+        task.add_done_callback(self._proof_tasks.discard)
+        
+    async def _drain_proof_callbacks(self):
+        """Wait for proof callbacks of blocks sealed so far"""
+        while self._proof_tasks:
+            await asyncio.gather(*list(self._proof_tasks), return_exceptions=True)
+            
+    async def _notify_proof_callbacks(self, block: Dict[str, Any], results: List[ConsensusResult]):
+        """Notify all proof callbacks"""
+        for callback in self.proof_callbacks:
+            try:
+                await callback(block, results)
+            except Exception as e:
+                logger.error(f"Error in proof callback: {e}")
+                
+    def subscribe_consensus(self, consumer, maxsize: int = 100, policy: str = 'drop_oldest',
+                            name: str = None) -> Subscription:
+        """Subscribe a consumer to consensus results through its own bounded queue"""
+        # Consensus results have no symbol, so conflation keeps only the latest result
+        return self.consensus_fanout.subscribe(consumer, maxsize, policy, key=lambda result: None, name=name)
+        
+    def get_subscriber_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get queue depth, lag and drop metrics for every queued subscriber"""
+        return {
+            'market_data': self.ingestion_engine.fanout.get_stats(),
+            'consensus': self.consensus_fanout.get_stats()
+        }
+        
+    def get_current_consensus(self) -> Dict[str, Any]:
+        """Get current consensus state"""
+        return {
+            'hri_value': self.current_hri,
+            'sss_value': self.current_sss,
+            'harmonic_quality': self._calculate_harmonic_quality(self.current_hri, self.current_sss),
+            'timestamp': self.clock(),
+            'base_frequency': self.base_frequency
+        }
+        
+    def get_consensus_history(self, limit: int = 100, start_time: Optional[float] = None,
+                              end_time: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Get consensus history, served from the consensus log beyond the in-memory deque"""
+        if self.consensus_log is not None and (limit > len(self.consensus_history) or
+                                               start_time is not None or end_time is not None):
+            return self.consensus_log.history(limit, start_time, end_time)
+        return [result.to_dict() for result in list(self.consensus_history)[-limit:]]
+        
+    def get_consensus_history_json(self, limit: int = 100, start_time: Optional[float] = None,
+                                   end_time: Optional[float] = None) -> bytes:
+        """Get consensus history serialized as one JSON array"""
+        return dumps_json(self.get_consensus_history(limit, start_time, end_time))
+        
+    def export_consensus_history(self, limit: Optional[int] = None, start_time: Optional[float] = None,
+                                 end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Export consensus history as NumPy columns (see CONSENSUS_COLUMNS).
+        
+        With a consensus log the columns are sliced straight from its records,
+        so large exports never materialize ConsensusResult objects.
+        """
+        if self.consensus_log is not None:
+            return self.consensus_log.columns(limit, start_time, end_time)
+            
+        results = [
+            result for result in self.consensus_history
+            if (start_time is None or result.consensus_timestamp >= start_time) and
+            (end_time is None or result.consensus_timestamp <= end_time)
+        ]
+        return consensus_columns(results[-limit:] if limit else results)
+        
+    def get_consensus_rollup(self, start_time: Optional[float] = None, end_time: Optional[float] = None,
+                             max_points: int = 500) -> Dict[str, Any]:
+        """Get min/max/mean/last HRI, SSS and quality per bucket at a resolution fitting the point budget"""
+        if self.rollups is None:
+            return {'status': 'disabled'}
+        return self.rollups.query(start_time, end_time, max_points)
+        
+    def get_market_data_summary(self, symbols: List[str] = None) -> Dict[str, Any]:
+        """
+        Get summary of current market data from the latest quote table.
+        
+        Without `symbols` it covers the symbols of the last 10 ticks, as
+        before; `data_points` counts those recent ticks and `buffered_ticks`
+        the whole shared buffer.
+        """
+        engine = self.ingestion_engine
+        
+        if not engine.latest_quotes:
+            return {'status': 'no_data'}
+            
+        recent_data = engine.get_recent_data(limit=10)
+        if symbols is None:
+            symbols = list(dict.fromkeys(data.symbol for data in recent_data))
+            
+        summary = {
+            'symbols': symbols,
+            'data_points': len(recent_data),
+            'buffered_ticks': engine.get_buffered_count(),
+            'latest_timestamp': engine.latest_timestamp,
+            'assets': {}
+        }
+        
+        for symbol in symbols:
+            latest = engine.get_latest_quote(symbol)
+            if latest:
+                summary['assets'][symbol] = {
+                    'price': latest.price,
                     'volume': latest.volume,
                     'change_24h': latest.change_24h,
                     'source': latest.source
                 }
-        
+                
         return summary
 
 # Example usage and testing
@@ -623,7 +3833,7 @@ async def main():
     # Add consensus callback for monitoring
     async def consensus_monitor(consensus_result: ConsensusResult):
         print(f"🎵 Consensus: HRI={consensus_result.hri_value:.2f}, SSS={consensus_result.sss_value:.2f}")
-    
+        
     sensory_layer.add_consensus_callback(consensus_monitor)
     
     # Initialize with default symbols
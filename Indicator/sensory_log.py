@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Orion Rangi Sonic Engine - Sensory Log
+Append-Only Memory-Mapped Tick and Consensus Logs
+
+W.J. McCrea - Reality Protocol LLC
+"""
+
+import argparse
+import os
+import struct
+import time
+import numpy as np
+from typing import Dict, List, Tuple, Optional, Any
+import logging
+
+from sensory_data_level import (MarketDataPoint, ConsensusResult, CONSENSUS_COLUMNS, TICK_RECORD_DTYPE,
+                                consensus_leaf, merkle_levels, merkle_path)
+
+logger = logging.getLogger(__name__)
+
+# File header: magic, record size and record kind, padded to 16 bytes
+LOG_MAGIC = b'ORSLOG01'
+LOG_HEADER = struct.Struct('<8sII')
+
+TICK_LOG_DTYPE = TICK_RECORD_DTYPE
+
+# Fixed-width consensus record; only the first validation signature is kept
+CONSENSUS_LOG_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('hri_value', '<f8'),
+    ('sss_value', '<f8'),
+    ('harmonic_quality', '<f8'),
+    ('participating_nodes', '<i4'),
+    ('signature', 'S64')
+])
+
+# One record per sealed signing block; its results are the consensus records
+# [first_record, first_record + size) of the companion consensus log
+BLOCK_LOG_DTYPE = np.dtype([
+    ('timestamp', '<f8'),  # When the block was sealed
+    ('block_id', '<i8'),
+    ('first_record', '<i8'),
+    ('size', '<i4'),
+    ('algorithm', 'S8'),
+    ('root', 'S64'),
+    ('signature', 'S128')
+])
+
+class RecordLog:
+    """
+    Append-only file of fixed-size numpy records.
+    
+    Appends are staged in a preallocated batch and written with one
+    `write()` per batch (when it fills, after `flush_interval` seconds, or on
+    flush()/close()). Reads go through np.memmap over the flushed records
+    plus the staged batch, so tails and ranges never parse the whole file.
+    A partially written trailing record (e.g. after a crash) is truncated
+    when the log is reopened.
+    """
+    
+    KIND = 0
+    
+    def __init__(self, path: str, dtype: np.dtype, batch_size: int = 1024, flush_interval: float = 1.0,
+                 fsync: bool = False):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        
+        self._header_size = LOG_HEADER.size
+        self._flushed = self._open_file()
+        self._file = open(path, 'ab')
+        
+        self._batch = np.zeros(batch_size, dtype=self.dtype)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._map: Optional[np.memmap] = None
+        
+        # Metrics
+        self.appended = 0
+        self.flushes = 0
+        
+    def _open_file(self) -> int:
+        """Create or validate the header; return the count of complete records"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            with open(self.path, 'wb') as handle:
+                handle.write(LOG_HEADER.pack(LOG_MAGIC, self.dtype.itemsize, self.KIND))
+            return 0
+            
+        with open(self.path, 'rb') as handle:
+            magic, itemsize, kind = LOG_HEADER.unpack(handle.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC or itemsize != self.dtype.itemsize or kind != self.KIND:
+            raise ValueError(f"{self.path} is not a compatible sensory log")
+            
+        payload = os.path.getsize(self.path) - self._header_size
+        count, partial = divmod(payload, self.dtype.itemsize)
+        if partial:
+            logger.warning(f"Truncating {partial} bytes of a partial record from {self.path}")
+            os.truncate(self.path, self._header_size + count * self.dtype.itemsize)
+        return count
+        
+    def __len__(self) -> int:
+        return self._flushed + self._pending
+        
+    def append_record(self, record: Tuple):
+        """Stage one record (a tuple in dtype field order)"""
+        self._batch[self._pending] = record
+        self._pending += 1
+        self.appended += 1
+        if self._pending >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+            
+    def flush(self):
+        """Write the staged batch to the file"""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        self._file.write(self._batch[:self._pending].tobytes())
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._flushed += self._pending
+        self._pending = 0
+        self.flushes += 1
+        
+    def close(self):
+        self.flush()
+        self._map = None
+        self._file.close()
+        
+    def _mapped(self) -> np.ndarray:
+        """Memory map of the flushed records, remapped only when the file has grown"""
+        if self._map is None or len(self._map) != self._flushed:
+            if self._flushed == 0:
+                return np.zeros(0, dtype=self.dtype)
+            self._map = np.memmap(self.path, dtype=self.dtype, mode='r', offset=self._header_size,
+                                  shape=(self._flushed,))
+        return self._map
+        
+    def read(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Records [start, stop), including staged ones; slices of the map are zero-copy"""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        mapped = self._mapped()
+        flushed = len(mapped)
+        if stop <= flushed:
+            return mapped[start:stop]
+            
+        staged = self._batch[:self._pending]
+        if start >= flushed:
+            return staged[start - flushed:stop - flushed].copy()
+        return np.concatenate((mapped[start:], staged[:stop - flushed]))
+        
+    def tail(self, count: int) -> np.ndarray:
+        """The last `count` records"""
+        return self.read(max(0, len(self) - count))
+        
+    def time_bounds(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> Tuple[int, int]:
+        """Record indices [start, stop) with start_time <= timestamp <= end_time, assuming appends in time order"""
+        self.flush()
+        timestamps = self._mapped()['timestamp']
+        start = 0 if start_time is None else int(np.searchsorted(timestamps, start_time, side='left'))
+        stop = len(timestamps) if end_time is None else int(np.searchsorted(timestamps, end_time, side='right'))
+        return start, stop
+        
+    def time_range(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> np.ndarray:
+        """Records with start_time <= timestamp <= end_time, assuming appends in time order"""
+        start, stop = self.time_bounds(start_time, end_time)
+        return self._mapped()[start:stop]
+        
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'records': len(self),
+            'pending': self._pending,
+            'appended': self.appended,
+            'flushes': self.flushes,
+            'bytes': self._header_size + self._flushed * self.dtype.itemsize
+        }
+
+class TickLog(RecordLog):
+    """Append-only log of MarketDataPoint records"""
+    
+    KIND = 1
+    
+    def __init__(self, path: str, batch_size: int = 1024, flush_interval: float = 1.0, fsync: bool = False):
+        super().__init__(path, TICK_LOG_DTYPE, batch_size, flush_interval, fsync)
+        self._encoded: Dict[str, bytes] = {}
+        self._decoded: Dict[bytes, str] = {}
+        
+    def _encode(self, text: str) -> bytes:
+        encoded = self._encoded.get(text)
+        if encoded is None:
+            encoded = self._encoded[text] = text.encode()
+        return encoded
+        
+    def append_point(self, market_data: MarketDataPoint):
+        self.append_record((market_data.timestamp, market_data.price, market_data.volume,
+                            market_data.change_24h, self._encode(market_data.symbol),
+                            self._encode(market_data.source)))
+    
+    def to_points(self, records: np.ndarray) -> List[MarketDataPoint]:
+        """Materialize tick records as MarketDataPoint objects"""
+        decoded = self._decoded
+        points = []
+        for timestamp, price, volume, change_24h, symbol, source in zip(
+            records['timestamp'].tolist(), records['price'].tolist(), records['volume'].tolist(),
+            records['change_24h'].tolist(), records['symbol'].tolist(), records['source'].tolist()
+        ):
+            symbol_name = decoded.get(symbol)
+            if symbol_name is None:
+                symbol_name = decoded[symbol] = symbol.decode()
+            source_name = decoded.get(source)
+            if source_name is None:
+                source_name = decoded[source] = source.decode()
+            points.append(MarketDataPoint(symbol_name, price, volume, change_24h, timestamp, source_name))
+        return points
+        
+    def tail_points(self, count: int) -> List[MarketDataPoint]:
+        return self.to_points(self.tail(count))
+
+class BlockLog(RecordLog):
+    """Append-only log of sealed signing blocks (see BLOCK_LOG_DTYPE)"""
+    
+    KIND = 3
+    
+    def __init__(self, path: str, batch_size: int = 64, flush_interval: float = 1.0, fsync: bool = False):
+        super().__init__(path, BLOCK_LOG_DTYPE, batch_size, flush_interval, fsync)
+        
+    def append_block(self, block: Dict[str, Any], first_record: int):
+        self.append_record((block['sealed_at'], block['block_id'], first_record, block['size'],
+                            block['algorithm'].encode(), block['root'].encode(), block['signature'].encode()))
+        
+    def next_block_id(self) -> int:
+        """Block ID following the last logged block, so IDs stay unique across restarts"""
+        last = self.tail(1)
+        return int(last['block_id'][0]) + 1 if len(last) else 0
+        
+    def covering(self, start: int, stop: int) -> np.ndarray:
+        """Blocks holding any consensus record in [start, stop), assuming appends in record order"""
+        blocks = self.read()
+        ends = blocks['first_record'] + blocks['size']
+        first = int(np.searchsorted(ends, start, side='right'))
+        last = int(np.searchsorted(blocks['first_record'], stop, side='left'))
+        return blocks[first:last]
+
+class ConsensusLog(RecordLog):
+    """
+    Append-only log of ConsensusResult records.
+    
+    Sealed signing blocks go to a companion BlockLog (`<path>.blocks`).
+    Inclusion proofs are not stored: reads rebuild them from the block
+    record and the logged values of the block's results.
+    """
+    
+    KIND = 2
+    
+    def __init__(self, path: str, batch_size: int = 256, flush_interval: float = 1.0, fsync: bool = False):
+        super().__init__(path, CONSENSUS_LOG_DTYPE, batch_size, flush_interval, fsync)
+        self.blocks = BlockLog(path + '.blocks', flush_interval=flush_interval, fsync=fsync)
+        
+    def flush(self):
+        super().flush()
+        self.blocks.flush()
+        
+    def close(self):
+        super().close()
+        self.blocks.close()
+        
+    def append_result(self, consensus_result: ConsensusResult):
+        signatures = consensus_result.validation_signatures
+        self.append_record((consensus_result.consensus_timestamp, consensus_result.hri_value,
+                            consensus_result.sss_value, consensus_result.harmonic_quality,
+                            consensus_result.participating_nodes,
+                            signatures[0].encode() if signatures else b''))
+                            
+    def append_block(self, block: Dict[str, Any]):
+        """Record a sealed block whose results are the last `size` appended records"""
+        self.blocks.append_block(block, len(self) - block['size'])
+        
+    def _proofs(self, start: int, stop: int) -> Dict[int, Dict[str, Any]]:
+        """Inclusion proofs of the records in [start, stop) that belong to a sealed block, by record index"""
+        proofs = {}
+        for block in self.blocks.covering(start, stop).tolist():
+            _, block_id, first_record, size, algorithm, root, signature = block
+            results = self.to_results(self.read(first_record, first_record + size))
+            levels = merkle_levels([consensus_leaf(consensus_result) for consensus_result in results])
+            hex_levels = [[node.hex() for node in level] for level in levels]
+            for index in range(max(start, first_record), min(stop, first_record + size)):
+                leaf_index = index - first_record
+                proofs[index] = {
+                    'block_id': block_id,
+                    'block_size': size,
+                    'leaf_index': leaf_index,
+                    'path': merkle_path(hex_levels, leaf_index),
+                    'root': root.decode(),
+                    'root_signature': signature.decode(),
+                    'algorithm': algorithm.decode()
+                }
+        return proofs
+        
+    def to_results(self, records: np.ndarray, start: Optional[int] = None) -> List[ConsensusResult]:
+        """Materialize records as ConsensusResults; with their log index `start`, sealed ones get proofs"""
+        results = [
+            ConsensusResult(
+                hri_value=hri,
+                sss_value=sss,
+                harmonic_quality=quality,
+                consensus_timestamp=timestamp,
+                participating_nodes=nodes,
+                validation_signatures=[signature.decode()] if signature else []
+            )
+            for timestamp, hri, sss, quality, nodes, signature in zip(
+                records['timestamp'].tolist(), records['hri_value'].tolist(), records['sss_value'].tolist(),
+                records['harmonic_quality'].tolist(), records['participating_nodes'].tolist(),
+                records['signature'].tolist()
+            )
+        ]
+        if start is not None:
+            proofs = self._proofs(start, start + len(results))
+            for index, consensus_result in enumerate(results, start):
+                proof = proofs.get(index)
+                if proof is not None:
+                    consensus_result.inclusion_proof = proof
+                    consensus_result.validation_signatures.append(proof['root_signature'])
+        return results
+        
+    def tail_results(self, count: int) -> List[ConsensusResult]:
+        start = max(0, len(self) - count)
+        return self.to_results(self.read(start), start)
+        
+    def _select(self, limit: Optional[int], start_time: Optional[float],
+                end_time: Optional[float]) -> Tuple[int, np.ndarray]:
+        """Log index and records of the newest `limit` records (all when None) within the time range"""
+        if start_time is None and end_time is None:
+            start, stop = 0, len(self)
+        else:
+            start, stop = self.time_bounds(start_time, end_time)
+        if limit:
+            start = max(start, stop - limit)
+        return start, self.read(start, stop)
+        
+    def history(self, limit: int = 100, start_time: Optional[float] = None,
+                end_time: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Consensus history as dicts (like ConsensusResult.to_dict), newest `limit` within the range"""
+        start, records = self._select(limit, start_time, end_time)
+        return [consensus_result.to_dict() for consensus_result in self.to_results(records, start)]
+        
+    def columns(self, limit: Optional[int] = None, start_time: Optional[float] = None,
+                end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Consensus history as NumPy columns named like CONSENSUS_COLUMNS"""
+        _, records = self._select(limit, start_time, end_time)
+        return {
+            name: np.array(records['timestamp' if name == 'consensus_timestamp' else name], dtype=dtype)
+            for name, dtype in CONSENSUS_COLUMNS
+        }
+
+def open_sensory_logs(directory: str, **options) -> Tuple[TickLog, ConsensusLog]:
+    """Open (or create) ticks.log and consensus.log in a directory"""
+    os.makedirs(directory, exist_ok=True)
+    return (TickLog(os.path.join(directory, 'ticks.log'), **options),
+            ConsensusLog(os.path.join(directory, 'consensus.log'), **options))
+
+def main():
+    """Inspect a log directory from the command line"""
+    parser = argparse.ArgumentParser(description="Inspect sensory tick and consensus logs")
+    parser.add_argument('directory', help="Directory holding ticks.log and consensus.log")
+    parser.add_argument('--tail', type=int, default=5, help="Consensus records to show")
+    args = parser.parse_args()
+    
+    tick_log, consensus_log = open_sensory_logs(args.directory)
+    for log in (tick_log, consensus_log):
+        stats = log.get_stats()
+        print(f"🗄️ {stats['path']}: {stats['records']:,} records, {stats['bytes']:,} bytes")
+        
+    for result in consensus_log.tail_results(args.tail):
+        print(f"🎵 {result.consensus_timestamp:.3f}: HRI={result.hri_value:.2f}, SSS={result.sss_value:.2f}, "
+              f"Quality={result.harmonic_quality:.2f}")
+    
+    tick_log.close()
+    consensus_log.close()
+
+if __name__ == "__main__":
+    main()
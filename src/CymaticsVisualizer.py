@@ -4,14 +4,41 @@ from io import BytesIO
 import base64
 
 class CymaticVisualizer:
-    def __init__(self, size=500):
+    def __init__(self, size=500, modal=False, backend='matplotlib', image_format='png'):
+        if backend not in ('matplotlib', 'headless'):
+            raise ValueError(f"Unknown render backend: {backend}")
         self.size = size
+        # Render from a precomputed plate eigenmode bank instead of full-grid trig.
+        # src/core is only imported by the opt-in paths, so the default one works from anywhere
+        self.basis = None
+        if modal:
+            from core.modal_basis import shared_modal_basis
+            self.basis = shared_modal_basis(size)
+        # Headless rendering maps the pattern through a colormap LUT and encodes it directly
+        self.backend = backend
+        self.image_format = image_format
+        self._luts = {}
         
-    def render(self, frequency, amplitude=1.0, cmap='inferno'):
+    def pattern(self, frequency, amplitude=1.0):
+        """Pattern array in [-amplitude, amplitude]"""
+        if self.basis is not None:
+            Z = self.basis.render(frequency)
+            Z *= amplitude / (np.abs(Z).max() + 1e-12)
+            return Z
+            
         x = np.linspace(-np.pi, np.pi, self.size)
         y = np.linspace(-np.pi, np.pi, self.size)
         X, Y = np.meshgrid(x, y)
-        Z = np.sin(frequency * X) * np.sin(frequency * Y) * amplitude
+        return np.sin(frequency * X) * np.sin(frequency * Y) * amplitude
+        
+    def render(self, frequency, amplitude=1.0, cmap='inferno'):
+        Z = self.pattern(frequency, amplitude)
+        
+        if self.backend == 'headless':
+            from core.headless_render import named_lut, render_pattern, data_uri
+            if cmap not in self._luts:
+                self._luts[cmap] = named_lut(cmap)
+            return data_uri(render_pattern(Z, self._luts[cmap], self.image_format), self.image_format)
         
         fig, ax = plt.subplots(figsize=(5, 5))
         ax.imshow(Z, cmap=cmap)
@@ -1,12 +1,62 @@
-
-```python
 # cymatics_visualizer.py
+"""
+Key Enhancements and Features:
+
+1. Physics-Based Cymatics Patterns:
+   · The generate_chladni_pattern() method creates authentic wave interference patterns
+   · Patterns evolve over time, creating mesmerizing animations
+   · Higher frequencies generate more complex patterns
+2. Note-Specific Color Mapping:
+   · Each note has its own custom colormap based on your color system
+   · Patterns are rendered using the exact color associated with each frequency
+   · Smooth gradients from dark to light through the note's color
+3. Real-Time Visualization:
+   · The system can create real-time animations of market data sonification
+   · Patterns change dynamically as frequencies evolve
+   · Titles update with current frequency and color information
+4. Static Image Generation:
+   · Create beautiful still images of cymatics patterns
+   · Perfect for NFTs, reports, or documentation
+   · Each image encodes the frequency, note, and color information
+5. Seamless Integration:
+   · Works with your existing MarketSonifier class
+   · Maintains audio buffer for continuous visualization
+   · Provides multiple output formats (animation, static images)
+
+Practical Applications:
+
+1. Real-Time Market Dashboard:
+   · Live cymatics visualization showing market harmony/disharmony
+   · Color-coded by asset class (BTC=yellow, ETH=blue, etc.)
+2. NFT Generation:
+   · Create unique cymatics art for each significant market event
+   · Embed as metadata in harmonic NFTs
+3. Therapeutic Applications:
+   · Visual meditation based on market calmness (high HRI/SSS)
+   · Soothing patterns during stable market conditions
+4. Educational Tool:
+   · Demonstrate the physical manifestation of financial harmonics
+   · Show how different market conditions create different visual patterns
+
+This implementation transforms your sonification system from an auditory experience into a full multi-sensory immersion, where users can literally see the harmony (or disharmony) of the markets in physically accurate wave patterns
+"""
+import logging
+import os
+import shutil
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.colors import LinearSegmentedColormap
-from scipy.signal import spectrogram
 import matplotlib.colors as mcolors
+from .modal_basis import shared_modal_basis
+from .headless_render import (note_color_luts, render_pattern, to_uint8, compress_frame, encode_gif_frame,
+                              APNGWriter, GIFWriter, Image)
+
+logger = logging.getLogger(__name__)
 
 class CymaticsVisualizer:
     """
@@ -28,22 +78,53 @@ class CymaticsVisualizer:
     # 432Hz Tuning System
     A4_FREQ = 432.0
     
-    def __init__(self, sample_rate=44100, grid_size=256):
+    KERNELS = ('direct', 'separable', 'modal')
+    RENDER_BACKENDS = ('matplotlib', 'headless')
+    
+    def __init__(self, sample_rate=44100, grid_size=256, kernel='direct', render_backend='matplotlib',
+                 buffered=False):
+        if kernel not in self.KERNELS:
+            raise ValueError(f"Unknown pattern kernel: {kernel}")
+        if render_backend not in self.RENDER_BACKENDS:
+            raise ValueError(f"Unknown render backend: {render_backend}")
         self.sample_rate = sample_rate
         self.grid_size = grid_size
+        self.kernel = kernel
+        self.render_backend = render_backend
+        self.buffered = buffered
         
         # Create a meshgrid for the cymatics patterns
         x = np.linspace(-np.pi, np.pi, grid_size)
         y = np.linspace(-np.pi, np.pi, grid_size)
         self.X, self.Y = np.meshgrid(x, y)
         
+        # 1D tables for the separable kernel
+        self._init_separable_tables(x, y)
+        
+        # Preallocated float32 work buffers, reused by every frame in buffered mode
+        if buffered:
+            self._init_work_buffers()
+        
+        # Plate eigenmode bank for the modal kernel, shared between visualizers
+        self.modal_basis = shared_modal_basis(grid_size) if kernel == 'modal' else None
+        
         # Pre-calculate note frequencies
         self.note_frequencies = self._calculate_note_frequencies()
         
         # Create custom colormaps for each note
         self.note_colormaps = self._create_note_colormaps()
         
-        # Initialize figure for visualization
+        # The same note gradients as 256-entry RGB lookup tables for the headless backend
+        self.note_luts = note_color_luts(self.NOTE_TO_COLOR)
+        
+        # The headless backend never builds figures; animations create one on demand
+        self.fig = self.ax = self.img = None
+        if render_backend == 'matplotlib':
+            self._init_figure()
+        
+    def _init_figure(self):
+        """Initialize figure for visualization"""
+        grid_size = self.grid_size
         self.fig, self.ax = plt.subplots(figsize=(8, 8))
         self.ax.axis('off')
         self.fig.subplots_adjust(left=0, bottom=0, right=1, top=1, wspace=None, hspace=None)
@@ -85,6 +166,163 @@ class CymaticsVisualizer:
                 return note
         return None
     
+    def _init_separable_tables(self, x, y):
+        """
+        Split the x axis into blocks of B ~ sqrt(N) samples, so that
+        x[j] = block_starts[j // B] + block_offsets[j % B] (padded to whole blocks).
+        """
+        size = len(x)
+        block = max(1, int(np.ceil(np.sqrt(size))))
+        blocks = -(-size // block)
+        dx = x[1] - x[0] if size > 1 else 0.0
+        
+        self._block_size = block
+        self._x_padded = x[0] + dx * np.arange(blocks * block)
+        self._block_starts = self._x_padded[::block].copy()
+        self._block_offsets = dx * np.arange(block)
+        self._y = y.copy()
+    
+    def _init_work_buffers(self):
+        """
+        float32 grids and scratch space owned by the visualizer. In buffered
+        mode generate_chladni_pattern writes into these instead of allocating,
+        so the returned pattern is only valid until the next call.
+        """
+        self._X32 = self.X.astype(np.float32)
+        self._Y32 = self.Y.astype(np.float32)
+        self._XY32 = (0.1 * self.X * self.Y).astype(np.float32)
+        self._pattern32 = np.empty_like(self._X32)
+        self._work_a = np.empty_like(self._X32)
+        self._work_b = np.empty_like(self._X32)
+        
+        block_shape = (self.grid_size, len(self._block_starts), self._block_size)
+        self._block_pattern32 = np.empty(block_shape, dtype=np.float32)
+        self._block_work_a = np.empty(block_shape, dtype=np.float32)
+        self._block_work_b = np.empty(block_shape, dtype=np.float32)
+    
+        # Separable kernel tables (float64, they are only O(N*sqrt(N))). The outer
+        # products do not depend on the harmonic, which only scales them
+        size, blocks, block = block_shape
+        self._y_starts = np.outer(self._y, self._block_starts)
+        self._y_offsets = np.outer(self._y, self._block_offsets)
+        self._row = np.empty((size, 1))
+        self._start_phase = np.empty((size, blocks))
+        self._sin_start = np.empty((size, blocks))
+        self._cos_start = np.empty((size, blocks))
+        self._offset_phase = np.empty((size, block))
+        self._sin_offset = np.empty((size, block))
+        self._cos_offset = np.empty((size, block))
+        self._column = np.empty(blocks * block)
+        
+    def _buffered_component_sum(self, k, time_point, complexity):
+        """Direct kernel evaluated with in-place ufuncs in the float32 work buffers"""
+        pattern, a, b = self._pattern32, self._work_a, self._work_b
+        pattern.fill(0.0)
+        for n in range(1, complexity + 1):
+            nk = np.float32(n * k)
+            phase = np.float32(time_point)
+            
+            # a = sin(nkX + t) * cos(nkY + t) * sin(0.1nkXY + t) / n
+            np.multiply(self._X32, nk, out=a)
+            a += phase
+            np.sin(a, out=a)
+            np.multiply(self._Y32, nk, out=b)
+            b += phase
+            np.cos(b, out=b)
+            a *= b
+            np.multiply(self._XY32, nk, out=b)
+            b += phase
+            np.sin(b, out=b)
+            a *= b
+            a *= np.float32(1.0 / n)
+            pattern += a
+        return pattern
+    
+    def _separable_component_sum(self, k, time_point, complexity):
+        """
+        Sum of the harmonic components using 1D tables instead of full-grid trig.
+        
+        sin(nkX+t)*cos(nkY+t) is an outer product of two 1D vectors. The
+        coupled term sin(c*X*Y+t) is Im(exp(i(c*y*x_start + t)) * exp(i*c*y*x_offset))
+        with x split into blocks, so each harmonic needs O(N*sqrt(N)) sin/cos
+        evaluations and the full grid only sees multiplies and adds.
+        """
+        if self.buffered:
+            return self._buffered_separable_sum(k, time_point, complexity)
+            
+        size = self.grid_size
+        block = self._block_size
+        blocks = len(self._block_starts)
+        y = self._y
+        pattern = np.zeros((size, blocks, block))
+        coupled = np.empty_like(pattern)
+        scratch = np.empty_like(pattern)
+        for n in range(1, complexity + 1):
+            c = 0.1 * n * k
+            
+            # Row factor cos(nky+t) is folded into the block-start tables
+            row = np.cos(n * k * y + time_point)[:, None]
+            start_phase = c * np.outer(y, self._block_starts) + time_point
+            sin_start = np.sin(start_phase) * row
+            cos_start = np.cos(start_phase) * row
+            offset_phase = c * np.outer(y, self._block_offsets)
+            sin_offset = np.sin(offset_phase)
+            cos_offset = np.cos(offset_phase)
+            
+            # Im(P*Q) = Im(P)Re(Q) + Re(P)Im(Q), expanded over (row, block, offset)
+            np.multiply(sin_start[:, :, None], cos_offset[:, None, :], out=coupled)
+            np.multiply(cos_start[:, :, None], sin_offset[:, None, :], out=scratch)
+            coupled += scratch
+            
+            # Column factor sin(nkx+t)/n, reshaped to the same block layout
+            column = np.sin(n * k * self._x_padded + time_point) / n
+            coupled *= column.reshape(1, blocks, block)
+            pattern += coupled
+            
+        return pattern.reshape(size, blocks * block)[:, :size]
+        
+    def _buffered_separable_sum(self, k, time_point, complexity):
+        """Separable kernel with every table and grid written in place into the preallocated buffers"""
+        size = self.grid_size
+        block = self._block_size
+        blocks = len(self._block_starts)
+        pattern, coupled, scratch = self._block_pattern32, self._block_work_a, self._block_work_b
+        row, start_phase, sin_start, cos_start = self._row, self._start_phase, self._sin_start, self._cos_start
+        offset_phase, sin_offset, cos_offset = self._offset_phase, self._sin_offset, self._cos_offset
+        column = self._column
+        pattern.fill(0.0)
+        
+        for n in range(1, complexity + 1):
+            c = 0.1 * n * k
+            
+            # Row factor cos(nky+t), folded into the block-start tables
+            np.multiply(self._y, n * k, out=row[:, 0])
+            row += time_point
+            np.cos(row, out=row)
+            np.multiply(self._y_starts, c, out=start_phase)
+            start_phase += time_point
+            np.sin(start_phase, out=sin_start)
+            sin_start *= row
+            np.cos(start_phase, out=cos_start)
+            cos_start *= row
+            np.multiply(self._y_offsets, c, out=offset_phase)
+            np.sin(offset_phase, out=sin_offset)
+            np.cos(offset_phase, out=cos_offset)
+            
+            np.multiply(sin_start[:, :, None], cos_offset[:, None, :], out=coupled)
+            np.multiply(cos_start[:, :, None], sin_offset[:, None, :], out=scratch)
+            coupled += scratch
+            
+            # Column factor sin(nkx+t)/n
+            np.multiply(self._x_padded, n * k, out=column)
+            column += time_point
+            np.sin(column, out=column)
+            column *= 1.0 / n
+            coupled *= column.reshape(1, blocks, block)
+            pattern += coupled
+        
+        return pattern.reshape(size, blocks * block)[:, :size]
+    
     def generate_chladni_pattern(self, frequency, time_point, complexity=3):
         """
         Generate a Chladni-like cymatics pattern for the given frequency.
@@ -93,23 +331,46 @@ class CymaticsVisualizer:
         # Normalize frequency to pattern scale (higher frequencies = more complex patterns)
         k = frequency / 100  # Wave number scaling
         
-        # Initialize pattern with basic wave
-        pattern = np.zeros_like(self.X)
-        
-        # Add multiple harmonic components for richer patterns
-        for n in range(1, complexity + 1):
-            # Varying wave directions and frequencies create different patterns
-            component = (np.sin(n * k * self.X + time_point) * 
-                        np.cos(n * k * self.Y + time_point) *
-                        np.sin(k * self.X * self.Y * 0.1 * n + time_point))
-            pattern += component / n
+        if self.kernel == 'separable':
+            pattern = self._separable_component_sum(k, time_point, complexity)
+        elif self.kernel == 'modal':
+            # Drive the plate at k and its overtones; time_point is the drive phase
+            pattern = self.modal_basis.render(k, time_point, complexity)
+        elif self.buffered:
+            pattern = self._buffered_component_sum(k, time_point, complexity)
+        else:
+            # Initialize pattern with basic wave
+            pattern = np.zeros_like(self.X)
+            
+            # Add multiple harmonic components for richer patterns
+            for n in range(1, complexity + 1):
+                # Varying wave directions and frequencies create different patterns
+                component = (np.sin(n * k * self.X + time_point) * 
+                            np.cos(n * k * self.Y + time_point) *
+                            np.sin(k * self.X * self.Y * 0.1 * n + time_point))
+                pattern += component / n
         
         # Normalize the pattern
+        if self.buffered:
+            # numpy has no fused min/max, so the grid is read by two reductions (a
+            # cache-blocked single pass measured slower); the rescale is one subtract
+            # into the contiguous output buffer and one in-place multiply
+            low = pattern.min()
+            scale = 1.0 / (pattern.max() - low + 1e-8)
+            out = self._pattern32 if pattern.dtype == np.float32 else pattern
+            np.subtract(pattern, low, out=out)
+            out *= out.dtype.type(scale)
+            return out
         pattern = (pattern - pattern.min()) / (pattern.max() - pattern.min() + 1e-8)
         return pattern
     
     def create_cymatics_animation(self, audio_data, duration=5, fps=30):
         """Create a real-time cymatics animation from audio data"""
+        if self.fig is None:
+            self._init_figure()
+            
+        from scipy.signal import spectrogram
+        
         # Analyze audio to find dominant frequencies over time
         freqs, times, Sxx = spectrogram(audio_data, self.sample_rate)
         
@@ -132,7 +393,8 @@ class CymaticsVisualizer:
                 cmap = self.note_colormaps[note]
                 # Generate cymatics pattern
                 pattern = self.generate_chladni_pattern(dominant_freq, current_time)
-                self.img.set_array(pattern)
+                # Not every matplotlib copies in set_array; buffered patterns are overwritten next frame
+                self.img.set_array(pattern.copy() if self.buffered else pattern)
                 self.img.set_cmap(cmap)
                 self.ax.set_title(f'Frequency: {dominant_freq:.1f} Hz ({note}) - {self.NOTE_TO_COLOR[note]}', 
                                  color=mcolors.hex2color(self.NOTE_TO_COLOR[note]),
@@ -147,11 +409,135 @@ class CymaticsVisualizer:
         
         return anim
     
+    def _frame_specs(self, audio_data, duration, fps):
+        """
+        (frequency, note, time) for every animation frame. Frames without a
+        recognised note repeat the previous one, as the live animation does.
+        """
+        from scipy.signal import spectrogram
+        
+        freqs, times, Sxx = spectrogram(audio_data, self.sample_rate)
+        dominant = freqs[np.argmax(Sxx, axis=0)]
+        
+        specs = []
+        previous = None
+        for frame in range(int(duration * fps)):
+            current_time = frame / fps
+            dominant_freq = dominant[np.argmin(np.abs(times - current_time))]
+            note = self.frequency_to_note(dominant_freq)
+            if note:
+                previous = (float(dominant_freq), note, current_time)
+            specs.append(previous)
+        return specs
+    
+    def render_frame(self, spec):
+        """Colormap indices and LUT for one frame spec (blank before the first note)"""
+        if spec is None:
+            return np.zeros((self.grid_size, self.grid_size), dtype=np.uint8), self.note_luts['A']
+        frequency, note, current_time = spec
+        return to_uint8(self.generate_chladni_pattern(frequency, current_time)), self.note_luts[note]
+    
+    def export_cymatics_animation(self, audio_data, output_path, duration=5, fps=30, workers=None,
+                                  chunk_size=16, compress_level=3):
+        """
+        Render an animation offline and stream it to disk in frame order.
+        
+        Frames are generated in a process pool in chunks of `chunk_size` frame
+        indices, with at most two chunks per worker in flight, so memory stays
+        bounded regardless of length. The format follows the extension: .gif
+        (streaming GIF writer, frames LZW-compressed by Pillow in the workers),
+        .png/.apng (built-in APNG writer, frames compressed in the workers) or
+        anything else piped as raw RGB frames to ffmpeg. workers=0 renders in
+        this process.
+        
+        Returns frame count, elapsed seconds and frames/second.
+        """
+        if int(duration * fps) < 1:
+            raise ValueError(f"duration * fps must give at least one frame (got {duration} s at {fps} fps)")
+            
+        extension = os.path.splitext(output_path)[1].lower()
+        if extension in ('.png', '.apng'):
+            output = 'apng'
+        elif extension == '.gif':
+            output = 'gif'
+            if Image is None:
+                raise ImportError("Pillow is required for GIF export")
+        else:
+            output = 'ffmpeg'
+            if shutil.which('ffmpeg') is None:
+                raise RuntimeError(f"ffmpeg is required to export {extension or output_path}")
+        
+        started = time.perf_counter()
+        specs = self._frame_specs(audio_data, duration, fps)
+        chunks = [specs[start:start + chunk_size] for start in range(0, len(specs), chunk_size)]
+        options = (self.sample_rate, self.grid_size, self.kernel)
+        
+        if workers == 0:
+            _init_export_worker(*options)
+            results = (_render_export_chunk(chunk, output, compress_level) for chunk in chunks)
+            frame_count = self._write_export(results, output, output_path, len(specs), fps)
+        else:
+            workers = workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(workers, initializer=_init_export_worker, initargs=options) as pool:
+                results = _ordered_results(pool, chunks, 2 * workers, output, compress_level)
+                frame_count = self._write_export(results, output, output_path, len(specs), fps)
+        
+        elapsed = time.perf_counter() - started
+        stats = {
+            'path': output_path,
+            'format': output,
+            'frames': frame_count,
+            'seconds': elapsed,
+            'frames_per_second': frame_count / elapsed if elapsed > 0 else 0.0
+        }
+        logger.info("Exported %d frames to %s at %.1f frames/s", frame_count, output_path, stats['frames_per_second'])
+        return stats
+    
+    def _write_export(self, results, output, output_path, frame_count, fps):
+        """Stream rendered chunks into the encoder; returns the number of frames written"""
+        size = self.grid_size
+        frames = (frame for chunk in results for frame in chunk)
+        
+        if output == 'apng':
+            with open(output_path, 'wb') as handle:
+                writer = APNGWriter(handle, size, size, frame_count, fps)
+                for data in frames:
+                    writer.write_compressed(data)
+                writer.close()
+            return writer.frames_written
+        
+        if output == 'gif':
+            with open(output_path, 'wb') as handle:
+                writer = GIFWriter(handle, size, size, fps)
+                for frame in frames:
+                    writer.write_encoded(frame)
+                writer.close()
+            return writer.frames_written
+        
+        encoder = subprocess.Popen(
+            ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+             '-s', f'{size}x{size}', '-r', str(fps), '-i', '-', '-pix_fmt', 'yuv420p', output_path],
+            stdin=subprocess.PIPE)
+        written = 0
+        try:
+            for data in frames:
+                encoder.stdin.write(data)
+                written += 1
+        finally:
+            encoder.stdin.close()
+            encoder.wait()
+        if encoder.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with status {encoder.returncode}")
+        return written
+    
     def generate_static_cymatics_image(self, frequency, note, output_path='cymatics_pattern.png'):
         """Generate a static cymatics image for a specific frequency/note"""
         # Generate pattern
         pattern = self.generate_chladni_pattern(frequency, time_point=0, complexity=4)
         
+        if self.render_backend == 'headless':
+            return self._write_headless_image(pattern, frequency, note, output_path)
+        
         # Create figure
         fig, ax = plt.subplots(figsize=(10, 10))
         ax.axis('off')
@@ -171,6 +557,56 @@ class CymaticsVisualizer:
         plt.close()
         
         return output_path
+    
+    def render_pattern_image(self, pattern, note, image_format='png'):
+        """Encode a pattern with the note's lookup table, without any figure"""
+        return render_pattern(pattern, self.note_luts[note], image_format)
+    
+    def _write_headless_image(self, pattern, frequency, note, output_path):
+        """Write a static image at grid resolution; the title goes into PNG metadata"""
+        image_format = 'webp' if output_path.lower().endswith('.webp') else 'png'
+        options = {}
+        if image_format == 'png':
+            options['text'] = {'Title': f'{note} Note: {frequency:.2f} Hz',
+                               'Description': f'Color: {self.NOTE_TO_COLOR[note]}'}
+        image = render_pattern(pattern, self.note_luts[note], image_format, **options)
+        with open(output_path, 'wb') as handle:
+            handle.write(image)
+        return output_path
+
+
+# Offline export workers: one headless visualizer per process
+_export_visualizer = None
+
+
+def _init_export_worker(sample_rate, grid_size, kernel):
+    global _export_visualizer
+    _export_visualizer = CymaticsVisualizer(sample_rate, grid_size, kernel, render_backend='headless')
+
+
+def _render_export_chunk(specs, output, compress_level):
+    """Render a chunk of frames in the form the encoder consumes"""
+    frames = []
+    for spec in specs:
+        indices, lut = _export_visualizer.render_frame(spec)
+        if output == 'gif':
+            frames.append(encode_gif_frame(indices, lut))
+        elif output == 'apng':
+            frames.append(compress_frame(lut[indices], compress_level))
+        else:
+            frames.append(lut[indices].tobytes())
+    return frames
+
+
+def _ordered_results(pool, chunks, max_in_flight, output, compress_level):
+    """Yield chunk results in order while keeping a bounded number of chunks in flight"""
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(_render_export_chunk, chunk, output, compress_level))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 # Integrated Market Sonification System with Cymatics
@@ -260,44 +696,3 @@ if __name__ == "__main__":
     # 1. Use the color to update UI/lighting
     # 2. Display the cymatics visualization
     # 3. Potentially save the visualization as an NFT metadata component
-```
-
-Key Enhancements and Features:
-
-1. Physics-Based Cymatics Patterns:
-   · The generate_chladni_pattern() method creates authentic wave interference patterns
-   · Patterns evolve over time, creating mesmerizing animations
-   · Higher frequencies generate more complex patterns
-2. Note-Specific Color Mapping:
-   · Each note has its own custom colormap based on your color system
-   · Patterns are rendered using the exact color associated with each frequency
-   · Smooth gradients from dark to light through the note's color
-3. Real-Time Visualization:
-   · The system can create real-time animations of market data sonification
-   · Patterns change dynamically as frequencies evolve
-   · Titles update with current frequency and color information
-4. Static Image Generation:
-   · Create beautiful still images of cymatics patterns
-   · Perfect for NFTs, reports, or documentation
-   · Each image encodes the frequency, note, and color information
-5. Seamless Integration:
-   · Works with your existing MarketSonifier class
-   · Maintains audio buffer for continuous visualization
-   · Provides multiple output formats (animation, static images)
-
-Practical Applications:
-
-1. Real-Time Market Dashboard:
-   · Live cymatics visualization showing market harmony/disharmony
-   · Color-coded by asset class (BTC=yellow, ETH=blue, etc.)
-2. NFT Generation:
-   · Create unique cymatics art for each significant market event
-   · Embed as metadata in harmonic NFTs
-3. Therapeutic Applications:
-   · Visual meditation based on market calmness (high HRI/SSS)
-   · Soothing patterns during stable market conditions
-4. Educational Tool:
-   · Demonstrate the physical manifestation of financial harmonics
-   · Show how different market conditions create different visual patterns
-
-This implementation transforms your sonification system from an auditory experience into a full multi-sensory immersion, where users can literally see the harmony (or disharmony) of the markets in physically accurate wave patterns
@@ -1,8 +1,7 @@
-``python
 # harmonic_colorizer.py
 import numpy as np
-import matplotlib.colors as mcolors
 from scipy.signal import spectrogram
+from .headless_render import hex_to_rgb, encode_png, render_waveform_panel, render_swatch_panel
 
 class HarmonicColorizer:
     # Define the user's precise color mapping for notes
@@ -29,8 +28,11 @@ class HarmonicColorizer:
         'B': 493.88 / 440.0
     }
     
-    def __init__(self, sample_rate=44100):
+    def __init__(self, sample_rate=44100, visualization_backend='matplotlib'):
+        if visualization_backend not in ('matplotlib', 'headless'):
+            raise ValueError(f"Unknown visualization backend: {visualization_backend}")
         self.sample_rate = sample_rate
+        self.visualization_backend = visualization_backend
         # Pre-calculate the precise 432Hz-based frequencies
         self.note_frequencies = {
             note: ratio * self.A4_FREQ 
@@ -69,7 +71,7 @@ class HarmonicColorizer:
         hex_color = self.NOTE_TO_COLOR.get(note)
         if hex_color:
             # Convert HEX to RGB (0-1 range for matplotlib)
-            return mcolors.hex2color(hex_color)
+            return hex_to_rgb(hex_color)
         return None
     
     def frequency_to_color(self, frequency):
@@ -134,6 +136,10 @@ class HarmonicColorizer:
     
     def _create_visualization(self, audio_data, note_data):
         """Create a visualization of the audio analysis"""
+        if self.visualization_backend == 'headless':
+            self._create_headless_visualization(audio_data, note_data)
+            return
+            
         try:
             import matplotlib.pyplot as plt
             from matplotlib.patches import Rectangle
@@ -169,7 +175,25 @@ class HarmonicColorizer:
             print("Visualization saved as 'harmonic_analysis.png'")
             
         except ImportError:
-            print("Matplotlib not installed. Skipping visualization.")
+            print("Matplotlib not installed. Using the headless renderer.")
+            self._create_headless_visualization(audio_data, note_data)
+    
+    def _create_headless_visualization(self, audio_data, note_data, output_path='harmonic_analysis.png',
+                                       width=1000, height=800):
+        """
+        Same layout as _create_visualization (waveform above, dominant colors
+        below) drawn straight into a pixel array and encoded as PNG, without
+        any figure objects. Note names and frequencies go into PNG text metadata.
+        """
+        waveform = render_waveform_panel(audio_data, width, height // 2)
+        swatches = render_swatch_panel([data['color_rgb'] for data in note_data.values()],
+                                       width, height - height // 2)
+        labels = ', '.join(f"{note} {data['frequency']:.1f}Hz" for note, data in note_data.items())
+        
+        with open(output_path, 'wb') as handle:
+            handle.write(encode_png(np.vstack([waveform, swatches]),
+                                    text={'Title': 'Dominant Harmonic Colors', 'Description': labels}))
+        print(f"Visualization saved as '{output_path}'")
     
     def generate_color_gradient(self, base_note, duration=5.0):
         """
@@ -183,12 +207,12 @@ class HarmonicColorizer:
         array: Sequence of RGB values for animation
         """
         # Get base color
-        base_color = np.array(mcolors.hex2color(self.NOTE_TO_COLOR[base_note]))
+        base_color = np.array(hex_to_rgb(self.NOTE_TO_COLOR[base_note]))
         
         # Create gradient through related colors
         gradient_frames = []
         for note in ['C', 'D', 'E', 'F', 'G', 'A', 'B']:
-            target_color = np.array(mcolors.hex2color(self.NOTE_TO_COLOR[note]))
+            target_color = np.array(hex_to_rgb(self.NOTE_TO_COLOR[note]))
             # Interpolate between base and target
             for alpha in np.linspace(0, 1, int(duration*10/7)):
                 blend_color = base_color * (1-alpha) + target_color * alpha
@@ -242,4 +266,3 @@ if __name__ == "__main__":
             # For example: control LED lights, update UI, or generate visual effects
             
             return note_id, color_hex
-```
@@ -0,0 +1,313 @@
+# headless_render.py
+import base64
+import struct
+import zlib
+from io import BytesIO
+
+import numpy as np
+
+try:
+    from PIL import Image  # Optional WebP encoder
+except ImportError:
+    Image = None
+
+# Named colormaps as 17 evenly spaced RGB stops (sampled from matplotlib)
+COLORMAP_STOPS = {
+    'viridis': [(68, 1, 84), (72, 24, 106), (71, 45, 123), (66, 64, 134), (59, 82, 139), (51, 99, 141),
+                (44, 114, 142), (38, 130, 142), (33, 145, 140), (31, 160, 136), (40, 174, 128),
+                (63, 188, 115), (94, 201, 98), (132, 212, 75), (173, 220, 48), (216, 226, 25),
+                (253, 231, 37)],
+    'inferno': [(0, 0, 4), (11, 7, 36), (33, 12, 74), (61, 9, 101), (87, 16, 110), (113, 25, 110),
+                (138, 34, 106), (163, 44, 97), (188, 55, 84), (210, 70, 68), (228, 90, 49),
+                (241, 115, 29), (249, 142, 9), (252, 172, 17), (249, 203, 53), (242, 234, 105),
+                (252, 255, 164)],
+    'gray': [(0, 0, 0), (255, 255, 255)]
+}
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def hex_to_rgb(hex_color):
+    """'#RRGGBB' to an (r, g, b) tuple in 0-1 range"""
+    value = hex_color.lstrip('#')
+    return tuple(int(value[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
+
+
+def build_lut(colors, size=256):
+    """
+    Linear gradient through evenly spaced colors as a (size, 3) uint8 table.
+    Colors are 0-1 floats (like matplotlib) or 0-255 integers.
+    """
+    stops = np.asarray(colors, dtype=np.float64)
+    if stops.max() <= 1.0:
+        stops = stops * 255.0
+    positions = np.linspace(0.0, 1.0, len(stops))
+    samples = np.linspace(0.0, 1.0, size)
+    lut = np.stack([np.interp(samples, positions, stops[:, channel]) for channel in range(3)], axis=1)
+    return np.round(lut).astype(np.uint8)
+
+
+def named_lut(name):
+    """
+    LUT for a named colormap: sampled once from matplotlib's colormap registry
+    when it is installed (no figures involved), else built from COLORMAP_STOPS.
+    """
+    try:
+        import matplotlib
+        colormap = matplotlib.colormaps[name]
+        return np.round(colormap(np.arange(256))[:, :3] * 255).astype(np.uint8)
+    except (ImportError, KeyError):
+        pass
+        
+    if name not in COLORMAP_STOPS:
+        raise ValueError(f"Unknown colormap: {name}")
+    return build_lut(COLORMAP_STOPS[name])
+
+
+def note_color_luts(note_to_color):
+    """Black -> note color -> white LUT per note, matching the visualizers' note colormaps"""
+    return {
+        note: build_lut([(0, 0, 0), hex_to_rgb(hex_color), (1, 1, 1)])
+        for note, hex_color in note_to_color.items()
+    }
+
+
+def to_uint8(pattern, low=None, high=None):
+    """Scale a pattern to 0-255 indices over [low, high] (its own range by default)"""
+    if low is None:
+        low = pattern.min()
+    if high is None:
+        high = pattern.max()
+    scale = 255.0 / (high - low) if high > low else 0.0
+    scaled = (pattern - low) * scale
+    np.clip(scaled, 0.0, 255.0, out=scaled)
+    return scaled.astype(np.uint8)
+
+
+def apply_lut(indices, lut):
+    """Map uint8 indices to RGB pixels through a (256, 3) table"""
+    return lut[indices]
+
+
+def _png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def _png_header(width, height, color_type):
+    return _png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+
+
+def compress_frame(pixels, compress_level=6):
+    """zlib stream of an image's scanlines (filter type 0), i.e. the PNG IDAT payload"""
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    height = pixels.shape[0]
+    
+    # Each scanline is prefixed with its filter byte
+    rows = np.zeros((height, pixels[0].size + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, -1)
+    return zlib.compress(rows.tobytes(), compress_level)
+
+
+def encode_png(pixels, compress_level=6, text=None):
+    """
+    Encode an (H, W, 3) RGB or (H, W) grayscale uint8 array as PNG bytes.
+    Rows use filter type 0; `text` adds tEXt metadata (e.g. frequency and note).
+    """
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    chunks = [_png_header(width, height, 2 if pixels.ndim == 3 else 0)]
+    for key, value in (text or {}).items():
+        chunks.append(_png_chunk(b'tEXt', f"{key}\0{value}".encode('latin-1', 'replace')))
+    chunks.append(_png_chunk(b'IDAT', compress_frame(pixels, compress_level)))
+    chunks.append(_png_chunk(b'IEND', b''))
+    return PNG_SIGNATURE + b''.join(chunks)
+
+
+class APNGWriter:
+    """
+    Streams RGB frames into an animated PNG. Frames arrive already
+    compressed (see compress_frame), so the expensive part can run in
+    worker processes and the writer only appends chunks in order.
+    """
+    
+    def __init__(self, handle, width, height, frame_count, fps, loops=0):
+        self.handle = handle
+        self.width = width
+        self.height = height
+        self.frame_count = frame_count
+        self.frames_written = 0
+        self._sequence = 0
+        
+        # Frame delay as a fraction of a second
+        self._delay = (1, int(fps)) if float(fps).is_integer() else (int(round(1000 / fps)), 1000)
+        
+        handle.write(PNG_SIGNATURE)
+        handle.write(_png_header(width, height, 2))
+        handle.write(_png_chunk(b'acTL', struct.pack('>II', frame_count, loops)))
+        
+    def _next_sequence(self):
+        sequence = self._sequence
+        self._sequence += 1
+        return sequence
+        
+    def write_compressed(self, data):
+        """Append one frame given its compressed scanlines"""
+        if self.frames_written >= self.frame_count:
+            raise ValueError("All announced frames have been written")
+        self.handle.write(_png_chunk(b'fcTL', struct.pack(
+            '>IIIIIHHBB', self._next_sequence(), self.width, self.height, 0, 0,
+            self._delay[0], self._delay[1], 0, 0)))
+        if self.frames_written == 0:
+            # The first frame doubles as the default image for non-APNG viewers
+            self.handle.write(_png_chunk(b'IDAT', data))
+        else:
+            self.handle.write(_png_chunk(b'fdAT', struct.pack('>I', self._next_sequence()) + data))
+        self.frames_written += 1
+        
+    def write_frame(self, pixels, compress_level=6):
+        self.write_compressed(compress_frame(pixels, compress_level))
+        
+    def close(self):
+        if self.frames_written != self.frame_count:
+            raise ValueError(f"Announced {self.frame_count} frames but wrote {self.frames_written}")
+        self.handle.write(_png_chunk(b'IEND', b''))
+
+
+def encode_gif_frame(indices, lut):
+    """
+    One palette frame as GIF blocks for GIFWriter: (placement, descriptor
+    flags, color table, LZW data). Pillow does the LZW compression, so like
+    compress_frame this can run in worker processes.
+    """
+    if Image is None:
+        raise ImportError("Pillow is required for GIF encoding")
+    indices = np.ascontiguousarray(indices, dtype=np.uint8)
+    height, width = indices.shape
+    image = Image.frombytes('P', (width, height), indices.tobytes())
+    image.putpalette(np.ascontiguousarray(lut, dtype=np.uint8).tobytes())
+    buffer = BytesIO()
+    image.save(buffer, format='GIF', optimize=False)
+    data = buffer.getvalue()
+    
+    # Header and screen descriptor, a color table, extensions, then the one image
+    flags = data[10]
+    offset = 13
+    table_bits = flags & 0x07
+    table = b''
+    if flags & 0x80:
+        table = data[offset:offset + (3 << (table_bits + 1))]
+        offset += len(table)
+    while data[offset] == 0x21:
+        offset += 2
+        while data[offset]:
+            offset += data[offset] + 1
+        offset += 1
+    descriptor = data[offset + 1:offset + 10]
+    offset += 10
+    if descriptor[8] & 0x80:
+        table_bits = descriptor[8] & 0x07
+        table = data[offset:offset + (3 << (table_bits + 1))]
+        offset += len(table)
+        
+    # The table becomes the frame's local color table; the trailer byte is dropped
+    return descriptor[:8], 0x80 | (descriptor[8] & 0x40) | table_bits, table, data[offset:-1]
+
+
+class GIFWriter:
+    """
+    Streams palette frames into an animated GIF, each with its own color
+    table. As with APNGWriter, frames arrive already compressed (see
+    encode_gif_frame) and only their blocks are appended, so nothing but
+    the current frame is held in memory.
+    """
+    
+    def __init__(self, handle, width, height, fps, loops=0):
+        self.handle = handle
+        self.frames_written = 0
+        
+        # Frame delay in hundredths of a second
+        self._delay = max(1, int(round(100 / fps)))
+        
+        handle.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0, 0, 0))
+        # NETSCAPE2.0 application extension carries the loop count (0 = forever)
+        handle.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loops) + b'\x00')
+        
+    def write_encoded(self, frame):
+        """Append one frame given its encode_gif_frame blocks"""
+        placement, flags, table, image_data = frame
+        # Graphic control extension: leave the frame in place (disposal 1) for the delay
+        self.handle.write(b'\x21\xf9\x04' + struct.pack('<BHBB', 0x04, self._delay, 0, 0))
+        self.handle.write(b'\x2c' + placement + bytes([flags]) + table + image_data)
+        self.frames_written += 1
+        
+    def write_frame(self, indices, lut):
+        self.write_encoded(encode_gif_frame(indices, lut))
+        
+    def close(self):
+        self.handle.write(b'\x3b')
+
+
+def encode_webp(pixels, quality=90, lossless=False):
+    """Encode an RGB uint8 array as WebP bytes (requires Pillow)"""
+    if Image is None:
+        raise ImportError("Pillow is required for WebP encoding")
+    buffer = BytesIO()
+    Image.fromarray(np.ascontiguousarray(pixels, dtype=np.uint8)).save(
+        buffer, format='WEBP', quality=quality, lossless=lossless)
+    return buffer.getvalue()
+
+
+def encode_image(pixels, image_format='png', **options):
+    """Encode pixels as 'png' or 'webp' bytes"""
+    if image_format == 'png':
+        return encode_png(pixels, **options)
+    if image_format == 'webp':
+        return encode_webp(pixels, **options)
+    raise ValueError(f"Unknown image format: {image_format}")
+
+
+def data_uri(image_bytes, image_format='png'):
+    """Base64 data URI for an encoded image"""
+    return f"data:image/{image_format};base64,{base64.b64encode(image_bytes).decode('ascii')}"
+
+
+def render_pattern(pattern, lut, image_format='png', low=None, high=None, **options):
+    """Pattern -> uint8 indices -> RGB through the LUT -> encoded image bytes"""
+    return encode_image(apply_lut(to_uint8(pattern, low, high), lut), image_format, **options)
+
+
+def render_waveform_panel(audio_data, width, height, color=(31, 119, 180), background=(255, 255, 255)):
+    """Min/max envelope of a waveform, one pixel column per slice of samples"""
+    panel = np.empty((height, width, 3), dtype=np.uint8)
+    panel[:] = background
+    if len(audio_data) == 0:
+        return panel
+        
+    # Pad to whole columns with the last sample, then take each column's extent
+    per_column = -(-len(audio_data) // width)
+    padded = np.resize(np.asarray(audio_data, dtype=np.float64), per_column * width)
+    padded[len(audio_data):] = audio_data[-1]
+    columns = padded.reshape(width, per_column)
+    peak = np.abs(padded).max() or 1.0
+    
+    # Amplitude +peak maps to row 0, -peak to the bottom row
+    top = np.round((1.0 - columns.max(axis=1) / peak) * (height - 1) / 2).astype(int)
+    bottom = np.round((1.0 - columns.min(axis=1) / peak) * (height - 1) / 2).astype(int)
+    rows = np.arange(height)[:, None]
+    panel[(rows >= top[None, :]) & (rows <= bottom[None, :])] = color
+    return panel
+
+
+def render_swatch_panel(colors, width, height, background=(255, 255, 255)):
+    """Evenly spaced color swatches (0-1 RGB tuples) centered in a panel"""
+    panel = np.empty((height, width, 3), dtype=np.uint8)
+    panel[:] = background
+    if not colors:
+        return panel
+        
+    slot = width // (2 * len(colors) + 1)
+    top, bottom = height // 3, 2 * height // 3
+    for index, color in enumerate(colors):
+        left = slot * (2 * index + 1)
+        panel[top:bottom, left:left + slot] = np.round(np.asarray(color) * 255).astype(np.uint8)
+    return panel
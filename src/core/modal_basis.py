@@ -0,0 +1,84 @@
+# modal_basis.py
+from functools import lru_cache
+
+import numpy as np
+
+
+class ModalBasis:
+    """
+    Precomputed bank of square-plate eigenmodes for rendering Chladni
+    figures as a weighted sum of cached modes instead of full-grid trig.
+    
+    Modes are the classic Chladni shapes
+        phi(m, n) = C_m(x) * C_n(y) +/- C_n(x) * C_m(y),  C_m(u) = cos(m * pi * u)
+    on the unit square mapped onto the [-pi, pi] grid, with wavenumber
+    sqrt(m^2 + n^2) / 2 in the units of the visualizer grid. Every mode is
+    a sum of outer products of the 1D shapes C_m, so the bank is kept in
+    that factored form: a (max_order + 1) x grid_size table instead of one
+    full image per mode. Rendering turns the mode weights into a small
+    coefficient matrix A and evaluates C^T @ A @ C, two small matrix
+    products per frame.
+    
+    A drive at wavenumber k excites each mode with the steady-state
+    response H = 1 / (kappa^2 - k^2 + 2i * damping * kappa * k), so modes
+    near resonance dominate; `phase` is the drive phase in radians.
+    """
+    
+    def __init__(self, grid_size=256, max_order=40, damping=0.05):
+        self.grid_size = grid_size
+        self.max_order = max_order
+        self.damping = damping
+        
+        # 1D mode shapes over the grid, one row per order
+        u = np.linspace(0.0, 1.0, grid_size)
+        orders = np.arange(max_order + 1)
+        self.mode_shapes = np.cos(np.pi * orders[:, None] * u[None, :])
+        
+        # Mode table: (m, n, sign) with m <= n; m == n only has the symmetric mode
+        m, n = np.triu_indices(max_order + 1)
+        asymmetric = m != n
+        self.mode_m = np.concatenate([m, m[asymmetric]])
+        self.mode_n = np.concatenate([n, n[asymmetric]])
+        self.mode_sign = np.concatenate([np.ones(len(m)), -np.ones(asymmetric.sum())])
+        self.wavenumbers = np.sqrt(self.mode_m ** 2 + self.mode_n ** 2) / 2.0
+        
+    @property
+    def mode_count(self):
+        return len(self.wavenumbers)
+        
+    def response(self, wavenumber):
+        """Complex steady-state response of every mode to a drive at `wavenumber`"""
+        kappa = self.wavenumbers
+        return 1.0 / (kappa ** 2 - wavenumber ** 2 + 2j * self.damping * kappa * wavenumber + 1e-12)
+        
+    def weights(self, wavenumber, phase=0.0, harmonics=1):
+        """Real mode weights for the drive and its overtones n*k, each scaled by 1/n"""
+        weights = np.zeros(self.mode_count)
+        rotation = np.exp(1j * phase)
+        for n in range(1, harmonics + 1):
+            weights += (self.response(n * wavenumber) * rotation).real / n
+        return weights
+        
+    def coefficients(self, weights):
+        """Fold mode weights into the (order x order) matrix A with pattern = C^T A C"""
+        size = self.max_order + 1
+        coefficients = np.zeros(size * size)
+        # Row index is the y order, column index the x order
+        np.add.at(coefficients, self.mode_n * size + self.mode_m, weights)
+        np.add.at(coefficients, self.mode_m * size + self.mode_n, weights * self.mode_sign)
+        return coefficients.reshape(size, size)
+        
+    def render_weights(self, weights):
+        """Superpose the bank with arbitrary mode weights"""
+        shapes = self.mode_shapes
+        return shapes.T @ (self.coefficients(weights) @ shapes)
+        
+    def render(self, wavenumber, phase=0.0, harmonics=1):
+        """Pattern (rows = y, columns = x) of the plate driven at `wavenumber`"""
+        return self.render_weights(self.weights(wavenumber, phase, harmonics))
+
+
+@lru_cache(maxsize=8)
+def shared_modal_basis(grid_size=256, max_order=40, damping=0.05):
+    """One ModalBasis per configuration, shared by every visualizer in the process"""
+    return ModalBasis(grid_size, max_order, damping)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Indicator modules import each other by flat name, and src/core is imported as `core`
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, 'Indicator'), os.path.join(ROOT, 'src')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from sensory_data_level import MarketDataPoint, MarketDataIngestionEngine, RollingChangeTracker, SensoryDataLayer
+from sensory_replay import read_change_history, seed_change_tracker
+
+
+def test_sources_do_not_share_rings():
+    tracker = RollingChangeTracker(window_seconds=600.0, bucket_seconds=60.0)
+    tracker.update('coinbase', 'BTC', 100.0, 0.0)
+    tracker.update('binance', 'BTC', 200.0, 30.0)
+    assert tracker.update('coinbase', 'BTC', 110.0, 120.0) == pytest.approx(10.0)
+    assert tracker.change('binance', 'BTC', 210.0) == pytest.approx(5.0)
+    assert tracker.change('kraken', 'BTC', 210.0) == 0.0
+
+
+def test_restore_only_feeds_the_tick_source():
+    engine = MarketDataIngestionEngine()
+    engine.restore([MarketDataPoint('BTC', 100.0, 1.0, 0.0, 0.0, 'coinbase'),
+                    MarketDataPoint('BTC', 50.0, 1.0, 0.0, 10.0, 'kraken')])
+    assert engine.change_tracker.change('coinbase', 'BTC', 120.0) == pytest.approx(20.0)
+
+
+def test_seed_from_raw_coinbase_frames(tmp_path):
+    path = tmp_path / 'frames.jsonl'
+    frames = [
+        {'type': 'ticker', 'product_id': 'BTC-USD', 'price': '100.0', 'time': '2024-01-01T00:00:00Z'},
+        {'type': 'ticker', 'product_id': 'BTC-USD', 'price': '104.0', 'time': '2024-01-01T00:05:00Z'},
+        {'symbol': 'ETH', 'price': 10.0, 'timestamp': 1704067200.0, 'source': 'coinbase'}
+    ]
+    path.write_text('\n'.join(json.dumps(frame) for frame in frames))
+    
+    tracker = RollingChangeTracker()
+    assert seed_change_tracker(tracker, str(path)) == 3
+    assert tracker.change('coinbase', 'BTC', 110.0) == pytest.approx(10.0)
+    assert tracker.change('coinbase', 'ETH', 11.0) == pytest.approx(10.0)
+
+
+def test_seed_rejects_raw_frames_without_time(tmp_path):
+    path = tmp_path / 'frames.jsonl'
+    path.write_text(json.dumps({'type': 'ticker', 'product_id': 'BTC-USD', 'price': '100.0'}))
+    with pytest.raises(ValueError):
+        seed_change_tracker(RollingChangeTracker(), str(path))
+
+
+def test_layer_seeds_from_change_history(tmp_path):
+    path = tmp_path / 'history.jsonl'
+    path.write_text(json.dumps({'symbol': 'BTC', 'price': 100.0, 'timestamp': 0.0, 'source': 'coinbase'}))
+    layer = SensoryDataLayer(change_history=read_change_history(str(path)), log_consensus_updates=False)
+    assert layer.ingestion_engine.change_tracker.change('coinbase', 'BTC', 125.0) == pytest.approx(25.0)
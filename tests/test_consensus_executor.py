@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+import sensory_data_level
+from sensory_data_level import (
+    ConsensusExecutor,
+    HarmonicResonanceCalculator,
+    SonicStabilityCalculator,
+    VectorizedHarmonicResonanceCalculator,
+    VectorizedSonicStabilityCalculator,
+    market_data_arrays
+)
+
+from test_sensory_calculators import random_ticks
+
+
+def windows(count, size, seed):
+    ticks = random_ticks(count + size, seed)
+    return [ticks[start:start + size] for start in range(count)]
+
+
+def expected_values(window, backend):
+    if backend == 'python':
+        return (HarmonicResonanceCalculator().calculate_hri(window),
+                SonicStabilityCalculator().calculate_sss(window))
+    prices, volumes, changes, timestamps = market_data_arrays(window)
+    return (VectorizedHarmonicResonanceCalculator().calculate_hri_arrays(prices, volumes, changes),
+            VectorizedSonicStabilityCalculator().calculate_sss_arrays(volumes, changes, timestamps))
+
+
+async def run_jobs(executor, jobs):
+    for index, window in enumerate(jobs):
+        while not executor.has_capacity():
+            await asyncio.sleep(0.001)
+        assert executor.submit(*market_data_arrays(window), context=index)
+    await executor.close()
+
+
+@pytest.mark.parametrize('mode', ['thread', 'process'])
+@pytest.mark.parametrize('backend', ['python', 'vectorized'])
+def test_worker_results_match_inline_backend(mode, backend):
+    jobs = windows(6, 12, seed=8)
+    results = []
+    
+    async def on_result(context, values):
+        results.append((context, values))
+        
+    executor = ConsensusExecutor(on_result, mode, workers=2, window_size=12, backend=backend)
+    asyncio.run(run_jobs(executor, jobs))
+    
+    assert [context for context, _ in results] == list(range(len(jobs)))
+    for (index, values), window in zip(results, jobs):
+        assert values == expected_values(window, backend)
+
+
+def test_failed_jobs_still_free_capacity(monkeypatch):
+    compute = sensory_data_level.compute_window_values
+    
+    def flaky(columns, base_frequency, backend):
+        if columns[0, 0] < 0:
+            raise RuntimeError("worker failed")
+        return compute(columns, base_frequency, backend)
+        
+    monkeypatch.setattr(sensory_data_level, 'compute_window_values', flaky)
+    results, refills = [], []
+    
+    async def on_result(context, values):
+        results.append(context)
+        
+    async def scenario():
+        executor = ConsensusExecutor(on_result, 'thread', workers=1, window_size=12, max_pending=1,
+                                     on_capacity=lambda: refills.append(executor.has_capacity()))
+        good, bad = windows(2, 12, seed=9)
+        bad_columns = market_data_arrays(bad)
+        bad_columns[0][0] = -1.0
+        assert executor.submit(*bad_columns, context='bad')
+        assert not executor.submit(*market_data_arrays(good), context='good')
+        await executor.drain()
+        assert executor.submit(*market_data_arrays(good), context='good')
+        await executor.close()
+        return executor
+        
+    executor = asyncio.run(scenario())
+    assert results == ['good']
+    assert refills == [True, True]
+    assert executor.failed == 1
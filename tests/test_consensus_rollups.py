@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from sensory_data_level import ConsensusResult, ConsensusRollup, ConsensusRollups
+
+
+def columns(rollup, start_time, end_time, group=1):
+    return {name: values.tolist() for name, values in rollup.query(start_time, end_time, group).items()}
+
+
+def test_buckets_aggregate_min_max_mean_and_last():
+    rollup = ConsensusRollup(10.0, 4)
+    # The result at t=4 arrives after t=9 but is not the bucket's last
+    for timestamp, hri in [(1.0, 40.0), (9.0, 60.0), (4.0, 20.0), (12.0, 55.0)]:
+        rollup.add(timestamp, hri, 100.0 - hri, hri / 2)
+
+    result = columns(rollup, 0.0, 19.0)
+    assert result['bucket_start'] == [0.0, 10.0]
+    assert result['count'] == [3, 1]
+    assert result['hri_min'] == [20.0, 55.0]
+    assert result['hri_max'] == [60.0, 55.0]
+    assert result['hri_mean'] == [40.0, 55.0]
+    assert result['hri_last'] == [60.0, 55.0]
+    assert result['sss_min'] == [40.0, 45.0]
+    assert result['quality_last'] == [30.0, 27.5]
+
+
+def test_ring_wraps_and_drops_results_older_than_its_horizon():
+    rollup = ConsensusRollup(10.0, 4)
+    for bucket in range(6):
+        rollup.add(bucket * 10.0 + 1, float(bucket), 0.0, 0.0)
+
+    # Buckets 0 and 1 were overwritten by 4 and 5
+    assert columns(rollup, 0.0, 59.0)['bucket_start'] == [20.0, 30.0, 40.0, 50.0]
+    assert not rollup.covers(0.0, 59.0)
+    assert rollup.covers(20.0, 59.0)
+
+    # A late result inside the horizon merges; one behind it is dropped
+    rollup.add(15.0, 100.0, 0.0, 0.0)
+    rollup.add(35.0, 100.0, 0.0, 0.0)
+    result = columns(rollup, 0.0, 59.0)
+    assert result['count'] == [1, 2, 1, 1]
+    assert result['hri_max'] == [2.0, 100.0, 4.0, 5.0]
+
+
+def test_query_ranges_and_grouping():
+    rollup = ConsensusRollup(1.0, 100)
+    for second in range(20):
+        rollup.add(second + 0.5, float(second), 0.0, 0.0)
+
+    assert columns(rollup, 5.0, 9.99)['bucket_start'] == [5.0, 6.0, 7.0, 8.0, 9.0]
+    assert columns(rollup, 30.0, 40.0)['count'] == []
+
+    grouped = columns(rollup, 0.0, 19.0, group=5)
+    assert grouped['bucket_start'] == [0.0, 5.0, 10.0, 15.0]
+    assert grouped['count'] == [5, 5, 5, 5]
+    assert grouped['hri_min'] == [0.0, 5.0, 10.0, 15.0]
+    assert grouped['hri_max'] == [4.0, 9.0, 14.0, 19.0]
+    assert grouped['hri_last'] == grouped['hri_max']
+    assert grouped['hri_mean'] == [2.0, 7.0, 12.0, 17.0]
+
+
+@pytest.mark.parametrize('capacity', [3, 50])
+def test_add_arrays_matches_add(capacity):
+    rng = np.random.default_rng(7)
+    timestamps = np.sort(rng.uniform(0.0, 200.0, 500))
+    values = rng.uniform(0.0, 100.0, (3, 500))
+    sequential, bulk = ConsensusRollup(5.0, capacity), ConsensusRollup(5.0, capacity)
+
+    for timestamp, hri, sss, quality in zip(timestamps, *values):
+        sequential.add(timestamp, hri, sss, quality)
+    # Split in two so the second batch merges with buckets already in the ring
+    bulk.add_arrays(timestamps[:250], *values[:, :250])
+    bulk.add_arrays(timestamps[250:], *values[:, 250:])
+
+    expected, actual = sequential.query(0.0, 200.0), bulk.query(0.0, 200.0)
+    for name in expected:
+        np.testing.assert_allclose(actual[name], expected[name])
+
+
+def rollups_with(resolutions, count, step=1.0):
+    rollups = ConsensusRollups(resolutions)
+    for index in range(count):
+        rollups.add(ConsensusResult(float(index % 100), 50.0, 50.0, index * step, 1, []))
+    return rollups
+
+
+def test_query_picks_the_finest_resolution_that_fits():
+    rollups = rollups_with(((1.0, 100), (10.0, 100), (100.0, 100)), 5000)
+
+    # Inside the 1s horizon and within budget
+    assert rollups.query(4950.0, 4999.0, max_points=500)['resolution'] == 1.0
+    # Too many 1s buckets for the budget
+    assert rollups.query(4900.0, 4999.0, max_points=20)['resolution'] == 10.0
+    # Beyond the 10s horizon
+    wide = rollups.query(0.0, 4999.0, max_points=500)
+    assert wide['resolution'] == 100.0
+    assert sum(wide['count']) == 5000
+    # Even the coarsest ring needs merging to fit 10 points
+    merged = rollups.query(0.0, 4999.0, max_points=10)
+    assert merged['resolution'] == 500.0
+    assert merged['points'] == 10
+
+
+def test_snapshot_round_trip(tmp_path):
+    rollups = rollups_with(((1.0, 50), (10.0, 20)), 300)
+    path = str(tmp_path / 'consensus.log.rollups')
+    rollups.save(path, log_records=300)
+
+    loaded, covered = ConsensusRollups.load(path)
+    assert covered == 300
+    assert loaded.latest_timestamp == rollups.latest_timestamp
+    assert loaded.query(0.0, 299.0) == rollups.query(0.0, 299.0)
+    assert loaded.query(250.0, 299.0) == rollups.query(250.0, 299.0)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from sensory_data_level import ConsensusScheduler, MarketDataPoint
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        
+    def __call__(self):
+        return self.now
+
+
+def tick(price=100.0, symbol='BTC'):
+    return MarketDataPoint(symbol, price, 1.0, 0.0, 0.0, 'test')
+
+
+def test_deferred_run_does_not_double_count():
+    clock = Clock()
+    scheduler = ConsensusScheduler(max_rate_hz=1.0, clock=clock)
+    assert scheduler.on_tick(tick())
+    clock.now = 0.2
+    assert not scheduler.on_tick(tick())
+    clock.now = 0.4
+    assert not scheduler.on_tick(tick())
+    assert scheduler.ticks_coalesced == 0
+    
+    # One deferred run serves both held-back ticks: only the older one was coalesced
+    clock.now = 1.1
+    assert scheduler.claim_deferred()
+    assert scheduler.get_stats() == {'ticks_seen': 3, 'recomputations': 2, 'ticks_coalesced': 1,
+                                     'deferred_runs': 1, 'pending_ticks': 0}
+
+
+def test_tick_interval_coalesces_all_but_the_trigger():
+    scheduler = ConsensusScheduler(tick_interval=4)
+    runs = [scheduler.on_tick(tick()) for _ in range(10)]
+    assert runs == [False, False, False, True] * 2 + [False, False]
+    assert scheduler.ticks_coalesced == 6
+    assert scheduler.pending_ticks == 2
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_counters_add_up(seed):
+    rng = np.random.default_rng(seed)
+    clock = Clock()
+    scheduler = ConsensusScheduler(max_rate_hz=5.0, tick_interval=3, price_move_threshold=0.01, clock=clock)
+    for _ in range(500):
+        clock.now += float(rng.exponential(0.05))
+        scheduler.on_tick(tick(100.0 * (1 + float(rng.normal(0, 0.01))), symbol=str(rng.integers(3))))
+        if rng.random() < 0.1:
+            scheduler.claim_deferred(force=rng.random() < 0.5)
+        stats = scheduler.get_stats()
+        assert stats['ticks_seen'] == stats['recomputations'] + stats['ticks_coalesced'] + stats['pending_ticks']
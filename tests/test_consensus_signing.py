@@ -0,0 +1,111 @@
+import asyncio
+import os
+import stat
+
+import pytest
+
+from sensory_data_level import ConsensusResult, MerkleBlockSigner, SensoryDataLayer
+from sensory_log import ConsensusLog
+
+
+def results(count, offset=0):
+    return [ConsensusResult(40.0 + index * 0.5, 60.0 - index * 0.25, 50.0, 1_700_000_000.0 + offset + index, 1, [])
+            for index in range(count)]
+
+
+def test_signer_requires_a_key():
+    with pytest.raises(ValueError):
+        MerkleBlockSigner()
+
+
+def test_key_path_is_created_once_and_reused(tmp_path):
+    key_path = str(tmp_path / 'signing.key')
+    first = MerkleBlockSigner(key_path=key_path)
+    assert stat.S_IMODE(os.stat(key_path).st_mode) == 0o600
+    assert MerkleBlockSigner(key_path=key_path).key == first.key
+
+
+@pytest.mark.parametrize('count', [1, 2, 5, 8])
+def test_sealed_results_carry_signature_and_proof(count):
+    signer = MerkleBlockSigner(b'k' * 32, block_size=8, max_block_age=1e9)
+    sealed = []
+    signer.seal_callbacks.append(lambda block, block_results: sealed.append((block, block_results)))
+    batch = results(count)
+    for consensus_result in batch:
+        signer.add(consensus_result)
+    signer.seal()
+    
+    assert len(sealed) == 1
+    block, block_results = sealed[0]
+    assert block_results == batch
+    assert all(consensus_result.validation_signatures == [block['signature']] for consensus_result in batch)
+    assert all(signer.verify_results(batch))
+
+
+def test_logged_history_keeps_verifiable_proofs(tmp_path):
+    log_path = str(tmp_path / 'consensus.log')
+    
+    async def publish():
+        layer = SensoryDataLayer(consensus_log=ConsensusLog(log_path), log_consensus_updates=False,
+                                 signer=None, clock=lambda: 0.0)
+        layer.signer.block_size = 4
+        layer.use_deferred_timer = False
+        proven = []
+        
+        async def on_proofs(block, block_results):
+            proven.extend(block_results)
+            
+        layer.add_proof_callback(on_proofs)
+        for consensus_result in results(10):
+            await layer._publish_consensus(consensus_result.hri_value, consensus_result.sss_value,
+                                           consensus_result.consensus_timestamp)
+        await layer.close()
+        layer.consensus_log.close()
+        return proven
+        
+    proven = asyncio.run(publish())
+    assert len(proven) == 10
+    assert all(consensus_result.inclusion_proof for consensus_result in proven)
+    
+    # A fresh process reads the same key and rebuilds the proofs from the log
+    consensus_log = ConsensusLog(log_path)
+    layer = SensoryDataLayer(consensus_log=consensus_log, log_consensus_updates=False)
+    restored = consensus_log.tail_results(7)
+    assert [proof.inclusion_proof for proof in restored] == [proof.inclusion_proof for proof in proven[3:]]
+    assert all(layer.verify_consensus(restored))
+    
+    history = consensus_log.history(limit=3, start_time=1_700_000_002.0, end_time=1_700_000_006.0)
+    assert [entry['consensus_timestamp'] for entry in history] == [1_700_000_004.0, 1_700_000_005.0, 1_700_000_006.0]
+    assert [entry['inclusion_proof']['leaf_index'] for entry in history] == [0, 1, 2]
+    assert all(entry['validation_signatures'] == [entry['inclusion_proof']['root_signature']] for entry in history)
+    consensus_log.close()
+
+
+def test_block_ids_stay_unique_across_restarts(tmp_path):
+    log_path = str(tmp_path / 'consensus.log')
+    
+    async def run(offset):
+        layer = SensoryDataLayer(consensus_log=ConsensusLog(log_path), log_consensus_updates=False)
+        layer.signer.block_size = 4
+        layer.use_deferred_timer = False
+        for consensus_result in results(6, offset):
+            await layer._publish_consensus(consensus_result.hri_value, consensus_result.sss_value,
+                                           consensus_result.consensus_timestamp)
+        await layer.close()
+        layer.consensus_log.close()
+        
+    for offset in (0, 100, 200):
+        asyncio.run(run(offset))
+        
+    consensus_log = ConsensusLog(log_path)
+    block_ids = consensus_log.blocks.read()['block_id'].tolist()
+    assert block_ids == list(range(6))
+    
+    restored = consensus_log.tail_results(18)
+    layer = SensoryDataLayer(consensus_log=consensus_log, log_consensus_updates=False)
+    assert layer.signer.next_block_id == 6
+    # Each run seals a full block of 4 and a partial block of 2 on close
+    assert [proof.inclusion_proof['block_id'] for proof in restored] == [
+        2 * (index // 6) + (index % 6 >= 4) for index in range(18)]
+    assert all(layer.verify_consensus(restored))
+    consensus_log.close()
@@ -0,0 +1,104 @@
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+import matplotlib
+matplotlib.use('Agg')
+
+from core.cymatics_visualizer import CymaticsVisualizer
+
+# A4 = 432 Hz lands exactly on a spectrogram bin at this rate (256-sample segments)
+SAMPLE_RATE = 6912
+
+
+def note_audio(seconds=1.0):
+    samples = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return np.sin(2 * np.pi * 432.0 * samples) + 0.5 * np.sin(2 * np.pi * 324.0 * samples) * (samples > 0.5)
+
+
+def fixed_frame_specs(visualizer):
+    """Replace the spectrogram analysis (scipy) with two fixed notes, so exports run without scipy"""
+    def frame_specs(audio_data, duration, fps):
+        frame_count = int(duration * fps)
+        frequencies = [432.0 if frame < frame_count // 2 else 324.0 for frame in range(frame_count)]
+        return [(frequency, visualizer.frequency_to_note(frequency), frame / fps)
+                for frame, frequency in enumerate(frequencies)]
+        
+    visualizer._frame_specs = frame_specs
+
+
+def test_frame_specs_follow_the_dominant_note():
+    pytest.importorskip('scipy')
+    visualizer = CymaticsVisualizer(SAMPLE_RATE, grid_size=16, render_backend='headless')
+    specs = visualizer._frame_specs(note_audio(), duration=1.0, fps=4)
+    assert len(specs) == 4
+    assert specs[0][:2] == (432.0, visualizer.frequency_to_note(432.0))
+    assert [spec[2] for spec in specs] == [0.0, 0.25, 0.5, 0.75]
+
+
+@pytest.mark.parametrize('extension', ['png', 'gif'])
+def test_export_is_identical_in_process_and_in_pool(tmp_path, extension):
+    visualizer = CymaticsVisualizer(SAMPLE_RATE, grid_size=32, render_backend='headless')
+    fixed_frame_specs(visualizer)
+    outputs = []
+    for workers in (0, 2):
+        path = str(tmp_path / f'export_{workers}.{extension}')
+        stats = visualizer.export_cymatics_animation(note_audio(), path, duration=1.0, fps=12,
+                                                     workers=workers, chunk_size=5)
+        assert stats['frames'] == 12
+        outputs.append((tmp_path / f'export_{workers}.{extension}').read_bytes())
+    assert outputs[0] == outputs[1]
+    
+    image_module = pytest.importorskip('PIL.Image')
+    image = image_module.open(BytesIO(outputs[0]))
+    assert image.size == (32, 32)
+    assert image.n_frames == 12
+    image.seek(11)
+    assert np.asarray(image.convert('RGB')).any()
+
+
+def test_export_rejects_empty_animation(tmp_path):
+    visualizer = CymaticsVisualizer(SAMPLE_RATE, grid_size=16, render_backend='headless')
+    with pytest.raises(ValueError):
+        visualizer.export_cymatics_animation(note_audio(), str(tmp_path / 'empty.png'), duration=0.01, fps=30)
+    assert not (tmp_path / 'empty.png').exists()
+
+
+@pytest.mark.parametrize('grid_size', [1, 2, 17, 64, 100])
+@pytest.mark.parametrize('frequency', [50.0, 256.0, 432.0, 1975.5])
+def test_separable_kernel_matches_direct(grid_size, frequency):
+    direct = CymaticsVisualizer(SAMPLE_RATE, grid_size=grid_size, render_backend='headless')
+    separable = CymaticsVisualizer(SAMPLE_RATE, grid_size=grid_size, kernel='separable', render_backend='headless')
+    for time_point, complexity in [(0.0, 1), (0.7, 3), (12.3, 5)]:
+        expected = direct.generate_chladni_pattern(frequency, time_point, complexity)
+        actual = separable.generate_chladni_pattern(frequency, time_point, complexity)
+        assert actual.shape == (grid_size, grid_size)
+        np.testing.assert_allclose(actual, expected, atol=1e-9)
+
+
+@pytest.mark.parametrize('kernel', ['direct', 'separable', 'modal'])
+@pytest.mark.parametrize('grid_size', [17, 64])
+def test_buffered_patterns_match_float64(kernel, grid_size):
+    exact = CymaticsVisualizer(SAMPLE_RATE, grid_size=grid_size, kernel=kernel, render_backend='headless')
+    buffered = CymaticsVisualizer(SAMPLE_RATE, grid_size=grid_size, kernel=kernel, render_backend='headless',
+                                  buffered=True)
+    for frequency, time_point in [(256.0, 0.0), (432.0, 0.7), (1975.5, 12.3)]:
+        expected = exact.generate_chladni_pattern(frequency, time_point)
+        actual = buffered.generate_chladni_pattern(frequency, time_point)
+        assert actual.shape == expected.shape
+        assert actual.flags.c_contiguous
+        np.testing.assert_allclose(actual, expected, atol=1e-4)
+
+
+def test_buffered_animation_keeps_its_own_frame():
+    pytest.importorskip('scipy')
+    visualizer = CymaticsVisualizer(SAMPLE_RATE, grid_size=16, buffered=True)
+    animation = visualizer.create_cymatics_animation(note_audio(), duration=0.5, fps=4)
+    animation._func(0)
+    shown = visualizer.img.get_array()
+    expected = np.array(shown)
+    visualizer.generate_chladni_pattern(1975.5, 3.0)
+    np.testing.assert_array_equal(shown, expected)
+    matplotlib.pyplot.close(visualizer.fig)
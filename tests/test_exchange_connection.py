@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip('websockets')
+
+from local_feed_server import LocalFeedServer
+from sensory_data_level import CoinbaseTickerDecoder, ExchangeConnection
+
+
+class ContiguousTickerDecoder(CoinbaseTickerDecoder):
+    """Coinbase ticker frames whose sequence advances by one per frame"""
+
+    contiguous_sequences = True
+
+
+def ticker_frames(count):
+    return [json.dumps({'type': 'ticker', 'product_id': 'BTC-USD', 'price': str(50000 + index),
+                        'volume_24h': '10', 'sequence': index + 1})
+            for index in range(count)]
+
+
+async def stream(decoder, frames, disconnect_after, skip_on_reconnect, expected_ticks):
+    server = LocalFeedServer(frames, disconnect_after=disconnect_after, skip_on_reconnect=skip_on_reconnect)
+    await server.start()
+    ticks = []
+
+    async def on_tick(market_data):
+        ticks.append(market_data)
+
+    connection = ExchangeConnection(server.url, decoder, ['BTC'], on_tick, initial_backoff=0.01, jitter=0.0)
+    task = asyncio.create_task(connection.run())
+    deadline = asyncio.get_running_loop().time() + 5
+    try:
+        while len(ticks) < expected_ticks:
+            assert asyncio.get_running_loop().time() < deadline and not task.done()
+            await asyncio.sleep(0.01)
+    finally:
+        await connection.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await server.stop()
+    return server, connection, ticks
+
+
+def test_reconnects_resubscribe_and_count_gaps():
+    # 12 frames, 5 per connection, 2 skipped on every reconnect: 1-5, then 8-12
+    server, connection, ticks = asyncio.run(
+        stream(ContiguousTickerDecoder(), ticker_frames(12), disconnect_after=5, skip_on_reconnect=2,
+               expected_ticks=10))
+
+    assert connection.reconnects >= 1
+    assert server.connections >= 2
+    assert len(server.subscriptions) == server.connections
+    assert all(message == CoinbaseTickerDecoder().subscribe_messages(['BTC'])[0] for message in server.subscriptions)
+    assert [tick.price for tick in ticks] == [50000 + index for index in [0, 1, 2, 3, 4, 7, 8, 9, 10, 11]]
+
+    stats = connection.get_stats()
+    assert stats['sequence_gaps'] == 1
+    assert stats['missed_messages'] == 2
+    assert stats['out_of_order'] == 0
+    assert stats['ticks_received'] == 10
+
+
+def test_coinbase_sequences_are_checked_for_order_only():
+    server, connection, ticks = asyncio.run(
+        stream(CoinbaseTickerDecoder(), ticker_frames(12), disconnect_after=5, skip_on_reconnect=2,
+               expected_ticks=10))
+
+    stats = connection.get_stats()
+    assert stats['reconnects'] >= 1
+    assert stats['sequence_gaps'] == 0
+    assert stats['missed_messages'] == 0
+
+
+def test_repeated_sequences_count_as_out_of_order():
+    # A recording that repeats itself, split across a reconnect
+    frames = ticker_frames(4)
+    server, connection, ticks = asyncio.run(
+        stream(CoinbaseTickerDecoder(), frames * 2, disconnect_after=6, skip_on_reconnect=0, expected_ticks=8))
+
+    assert connection.get_stats()['out_of_order'] == 4
@@ -0,0 +1,120 @@
+import struct
+import sys
+import zlib
+
+import numpy as np
+import pytest
+
+from core.headless_render import (
+    COLORMAP_STOPS, PNG_SIGNATURE, build_lut, encode_png, hex_to_rgb, named_lut, note_color_luts, to_uint8
+)
+
+
+def read_png(data):
+    """Minimal PNG reader for the encoder's output: (pixels, text chunks)"""
+    assert data[:8] == PNG_SIGNATURE
+    offset, idat, text = 8, b'', {}
+    while offset < len(data):
+        length, kind = struct.unpack('>I4s', data[offset:offset + 8])
+        body = data[offset + 8:offset + 8 + length]
+        assert struct.unpack('>I', data[offset + 8 + length:offset + 12 + length])[0] == zlib.crc32(kind + body)
+        if kind == b'IHDR':
+            width, height, _, color_type = struct.unpack('>IIBB', body[:10])
+        elif kind == b'IDAT':
+            idat += body
+        elif kind == b'tEXt':
+            key, value = body.split(b'\0', 1)
+            text[key.decode('latin-1')] = value.decode('latin-1')
+        offset += 12 + length
+        
+    channels = 3 if color_type == 2 else 1
+    rows = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, width * channels + 1)
+    assert not rows[:, 0].any()  # Filter type 0 on every row
+    pixels = rows[:, 1:].reshape((height, width, channels) if channels == 3 else (height, width))
+    return pixels, text
+
+
+def test_png_round_trip_rgb_and_text():
+    pixels = np.random.default_rng(3).integers(0, 256, (7, 5, 3), dtype=np.uint8)
+    decoded, text = read_png(encode_png(pixels, text={'Title': 'A Note: 432.00 Hz'}))
+    np.testing.assert_array_equal(decoded, pixels)
+    assert text == {'Title': 'A Note: 432.00 Hz'}
+
+
+def test_png_accepts_lists_and_non_contiguous_arrays():
+    gray = [[0, 128, 255], [1, 2, 3]]
+    np.testing.assert_array_equal(read_png(encode_png(gray))[0], np.array(gray, dtype=np.uint8))
+    
+    pixels = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)[:, ::2]
+    np.testing.assert_array_equal(read_png(encode_png(pixels))[0], pixels)
+
+
+def test_png_decodes_with_pillow():
+    image_module = pytest.importorskip('PIL.Image')
+    from io import BytesIO
+    
+    pixels = np.random.default_rng(4).integers(0, 256, (9, 11, 3), dtype=np.uint8)
+    image = image_module.open(BytesIO(encode_png(pixels)))
+    np.testing.assert_array_equal(np.asarray(image), pixels)
+
+
+def test_to_uint8_covers_full_range():
+    indices = to_uint8(np.linspace(-2.0, 3.0, 256))
+    assert indices[0] == 0 and indices[-1] == 255
+    assert not to_uint8(np.full(4, 1.5)).any()
+
+
+def test_note_luts_match_matplotlib_colormaps():
+    pytest.importorskip('matplotlib')
+    import matplotlib.colors as mcolors
+    
+    for note, lut in note_color_luts({'C': '#FF00FF', 'D': '#FFA500', 'G': '#800080'}).items():
+        rgb = mcolors.hex2color({'C': '#FF00FF', 'D': '#FFA500', 'G': '#800080'}[note])
+        colormap = mcolors.LinearSegmentedColormap.from_list(note, [(0, 0, 0), rgb, (1, 1, 1)], N=256)
+        expected = np.round(colormap(np.arange(256))[:, :3] * 255).astype(np.uint8)
+        np.testing.assert_array_equal(lut, expected)
+
+
+def test_hex_to_rgb_matches_matplotlib():
+    pytest.importorskip('matplotlib')
+    import matplotlib.colors as mcolors
+    
+    for hex_color in ('#FF00FF', '#FFA500', '#800080', '#FFFFFF'):
+        assert hex_to_rgb(hex_color) == pytest.approx(mcolors.hex2color(hex_color))
+
+
+@pytest.mark.parametrize('name', sorted(COLORMAP_STOPS))
+def test_fallback_stops_track_matplotlib(name):
+    pytest.importorskip('matplotlib')
+    fallback = build_lut(COLORMAP_STOPS[name]).astype(int)
+    # Linear interpolation between 17 stops stays within a few levels of the full colormap
+    assert np.abs(fallback - named_lut(name).astype(int)).max() <= 8
+
+
+def test_named_lut_without_matplotlib(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'matplotlib', None)
+    lut = named_lut('inferno')
+    assert lut.shape == (256, 3) and lut.dtype == np.uint8
+    np.testing.assert_array_equal(lut[[0, -1]], [[0, 0, 4], [252, 255, 164]])
+    with pytest.raises(ValueError):
+        named_lut('no-such-colormap')
+
+
+def test_colorizer_falls_back_to_headless_without_matplotlib(monkeypatch, tmp_path):
+    pytest.importorskip('scipy')
+    monkeypatch.setitem(sys.modules, 'matplotlib', None)
+    monkeypatch.setitem(sys.modules, 'matplotlib.pyplot', None)
+    monkeypatch.delitem(sys.modules, 'core.harmonic_colorizer', raising=False)
+    from core.harmonic_colorizer import HarmonicColorizer
+    
+    monkeypatch.chdir(tmp_path)
+    # 432 Hz falls exactly on a spectrogram bin (256-sample segments)
+    colorizer = HarmonicColorizer(sample_rate=6912)
+    assert colorizer.note_to_color('F') == (0.0, 0.0, 1.0)
+    
+    tone = np.sin(2 * np.pi * colorizer.note_frequencies['A'] * np.arange(6912) / 6912)
+    result = colorizer.analyze_audio_buffer(tone)
+    pixels, text = read_png((tmp_path / 'harmonic_analysis.png').read_bytes())
+    assert pixels.shape == (800, 1000, 3)
+    assert text['Title'] == 'Dominant Harmonic Colors'
+    assert list(result) == ['A']
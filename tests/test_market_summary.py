@@ -0,0 +1,23 @@
+from sensory_data_level import MarketDataPoint, SensoryDataLayer
+
+from test_sensory_calculators import random_ticks
+
+
+def test_summary_covers_recent_symbols_by_default():
+    layer = SensoryDataLayer()
+    assert layer.get_market_data_summary() == {'status': 'no_data'}
+    
+    ticks = random_ticks(30, seed=10, symbols=('BTC', 'ETH'))
+    ticks.append(MarketDataPoint('SOL', 20.0, 1.0, 0.0, ticks[-1].timestamp - 100.0, 'test'))
+    ticks += random_ticks(10, seed=11, symbols=('ADA',))
+    layer.ingestion_engine.restore(ticks)
+    
+    summary = layer.get_market_data_summary()
+    assert summary['symbols'] == ['ADA']
+    assert summary['data_points'] == 10
+    assert summary['buffered_ticks'] == len(ticks)
+    assert summary['assets']['ADA']['price'] == ticks[-1].price
+    
+    summary = layer.get_market_data_summary(['SOL', 'BTC', 'DOGE'])
+    assert list(summary['assets']) == ['SOL', 'BTC']
+    assert summary['assets']['SOL']['price'] == 20.0
@@ -0,0 +1,134 @@
+import json
+
+import numpy as np
+import pytest
+
+import sensory_data_level
+from sensory_data_level import (
+    BinanceTickerDecoder,
+    CoinbaseTickerDecoder,
+    ColumnarTickBuffer,
+    KrakenTickerDecoder,
+    MarketDataIngestionEngine
+)
+
+
+def clock():
+    return 1_700_000_000.0
+
+
+def coinbase_frame(symbol='BTC', price=50000.0, open_24h=None, sequence=1):
+    frame = {'type': 'ticker', 'product_id': f'{symbol}-USD', 'price': str(price), 'volume_24h': '12.5',
+             'sequence': sequence}
+    if open_24h is not None:
+        frame['open_24h'] = str(open_24h)
+    return json.dumps(frame)
+
+
+def test_orjson_falls_back_to_json(monkeypatch):
+    monkeypatch.setattr(sensory_data_level, 'orjson', None)
+    decoder = CoinbaseTickerDecoder(clock=clock)
+    assert decoder.json_backend == 'json'
+    assert decoder.decode_point(coinbase_frame(price=1.5)).price == 1.5
+
+    with pytest.raises(ImportError):
+        CoinbaseTickerDecoder(json_backend='orjson')
+
+
+def test_json_backends_decode_the_same_tick():
+    pytest.importorskip('orjson')
+    frame = coinbase_frame(open_24h=40000.0)
+    fast = CoinbaseTickerDecoder(json_backend='orjson', clock=clock).decode_point(frame.encode())
+    standard = CoinbaseTickerDecoder(json_backend='json', clock=clock).decode_point(frame)
+    assert fast == standard
+    assert fast.change_24h == pytest.approx(25.0)
+
+
+def test_non_ticker_frames_are_skipped():
+    decoder = CoinbaseTickerDecoder(clock=clock)
+    frames = [
+        json.dumps({'type': 'subscriptions', 'channels': [{'name': 'ticker'}]}),
+        json.dumps({'type': 'heartbeat', 'note': 'mentions "ticker" but is not one'}),
+        coinbase_frame(),
+        '{not json "ticker"'
+    ]
+    points = decoder.decode_batch(frames)
+
+    assert [point.symbol for point in points] == ['BTC']
+    stats = decoder.get_stats()
+    assert stats['messages_seen'] == 4
+    assert stats['messages_skipped'] == 2
+    assert stats['decode_errors'] == 1
+
+
+def test_binance_combined_stream_frames():
+    decoder = BinanceTickerDecoder(clock=clock)
+    frame = json.dumps({'stream': 'ethusdt@ticker',
+                        'data': {'e': '24hrTicker', 's': 'ETHUSDT', 'c': '3000.5', 'v': '1200', 'P': '-2.5'}})
+    point = decoder.decode_point(frame)
+
+    assert (point.symbol, point.price, point.volume, point.change_24h, point.source) == \
+        ('ETH', 3000.5, 1200.0, -2.5, 'binance')
+    assert point.timestamp == clock()
+    assert decoder.decode_point(json.dumps({'result': None, 'id': 1})) is None
+    assert decoder.subscribe_messages(['BTC', 'ETH'])[0]['params'] == ['btcusdt@ticker', 'ethusdt@ticker']
+
+
+def test_kraken_ticker_arrays_and_aliases():
+    decoder = KrakenTickerDecoder(clock=clock)
+    frame = json.dumps([340, {'c': ['52000.0', '0.1'], 'v': ['10', '250.5'], 'o': ['51000', '40000.0']},
+                        'ticker', 'XBT/USD'])
+    point = decoder.decode_point(frame)
+
+    assert (point.symbol, point.price, point.volume, point.source) == ('BTC', 52000.0, 250.5, 'kraken')
+    assert point.change_24h == pytest.approx(30.0)
+    assert decoder.decode_point(json.dumps({'event': 'heartbeat'})) is None
+    assert decoder.subscribe_messages(['BTC', 'ETH'])[0]['pair'] == ['XBT/USD', 'ETH/USD']
+
+
+def test_decode_batch_into_matches_decode_batch():
+    frames = [coinbase_frame(symbol, 100.0 + index, open_24h=90.0)
+              for index, symbol in enumerate(['BTC', 'ETH', 'BTC', 'SOL'])]
+    frames.insert(2, json.dumps({'type': 'heartbeat'}))
+    buffer = ColumnarTickBuffer(8)
+
+    written = CoinbaseTickerDecoder(clock=clock).decode_batch_into(frames, buffer)
+
+    assert written == 4
+    assert buffer.window().to_market_data() == CoinbaseTickerDecoder(clock=clock).decode_batch(frames)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_load_messages_fills_every_buffer(columnar):
+    symbols = ['BTC', 'ETH', 'SOL']
+    frames = [coinbase_frame(symbols[index % 3], 100.0 + index, open_24h=90.0) for index in range(25)]
+    engine = MarketDataIngestionEngine(buffer_size=10, columnar=columnar, symbol_buffer_size=4, clock=clock)
+    reference = MarketDataIngestionEngine(buffer_size=10, symbol_buffer_size=4, clock=clock)
+
+    assert engine.load_messages('coinbase', frames) == 25
+    for point in CoinbaseTickerDecoder(clock=clock).decode_batch(frames):
+        reference.data_buffer.append(point)
+        reference._index_market_data(point)
+
+    assert engine.get_buffered_count() == 10
+    assert engine.get_recent_data(limit=10) == reference.get_recent_data(limit=10)
+    for symbol in symbols:
+        assert engine.get_recent_data(symbol, limit=10) == reference.get_recent_data(symbol, limit=10)
+        assert engine.get_latest_quote(symbol) == reference.get_latest_quote(symbol)
+    assert engine.latest_timestamp == reference.latest_timestamp
+
+
+def test_append_arrays_wraps_like_append():
+    rng = np.random.default_rng(3)
+    values = rng.random((4, 11))
+    bulk, single = ColumnarTickBuffer(4), ColumnarTickBuffer(4)
+    single.append('BTC', 0.0, 0.0, 0.0, 0.0, 'coinbase')
+    bulk.append('BTC', 0.0, 0.0, 0.0, 0.0, 'coinbase')
+
+    bulk.append_arrays('BTC', 'coinbase', *values[:, :3])
+    bulk.append_arrays('BTC', 'coinbase', *values[:, 3:])
+    for column in values.T:
+        single.append('BTC', *column, 'coinbase')
+
+    assert bulk.total_appended == single.total_appended == 12
+    assert bulk.window().to_market_data() == single.window().to_market_data()
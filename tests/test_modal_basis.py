@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from core.modal_basis import ModalBasis, shared_modal_basis
+
+
+def test_render_shape_and_values():
+    basis = ModalBasis(grid_size=48, max_order=10)
+    pattern = basis.render(3.7, phase=0.4, harmonics=3)
+    assert pattern.shape == (48, 48)
+    assert np.all(np.isfinite(pattern))
+    assert np.abs(pattern).max() > 0
+
+
+def test_factored_render_matches_explicit_modes():
+    basis = ModalBasis(grid_size=32, max_order=6)
+    weights = np.random.default_rng(5).normal(size=basis.mode_count)
+    
+    shapes = basis.mode_shapes
+    expected = np.zeros((32, 32))
+    for weight, m, n, sign in zip(weights, basis.mode_m, basis.mode_n, basis.mode_sign):
+        # phi(m, n) = C_m(x) C_n(y) +/- C_n(x) C_m(y), rows are y and columns x
+        expected += weight * (np.outer(shapes[n], shapes[m]) + sign * np.outer(shapes[m], shapes[n]))
+    np.testing.assert_allclose(basis.render_weights(weights), expected, atol=1e-12)
+
+
+def test_shared_basis_is_cached():
+    assert shared_modal_basis(40, 8) is shared_modal_basis(40, 8)
+
+
+@pytest.mark.parametrize('amplitude', [1.0, 0.25])
+def test_modal_visualizer_is_normalized(amplitude):
+    pytest.importorskip('matplotlib')
+    from CymaticsVisualizer import CymaticVisualizer
+    
+    visualizer = CymaticVisualizer(size=64, modal=True)
+    pattern = visualizer.pattern(5.0, amplitude)
+    assert pattern.shape == (64, 64)
+    assert np.isclose(np.abs(pattern).max(), amplitude)
@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+from sensory_data_level import SensoryDataLayer
+
+from test_sensory_calculators import random_ticks
+
+
+@pytest.mark.parametrize('hri_mode, sss_mode', [('batch', 'batch'), ('incremental', 'streaming')])
+def test_update_and_window_latencies_are_separate(hri_mode, sss_mode):
+    layer = SensoryDataLayer(hri_mode=hri_mode, sss_mode=sss_mode, window_size=10, log_consensus_updates=False)
+    layer.use_deferred_timer = False
+    ticks = random_ticks(25, seed=12)
+    
+    async def feed():
+        for tick in ticks:
+            await layer.ingestion_engine._process_market_data(tick)
+        await layer.close()
+        
+    asyncio.run(feed())
+    stages = layer.get_metrics_snapshot()['stages']
+    per_tick = len(ticks) if hri_mode == 'incremental' else 0
+    windows = len(ticks) - 1 if hri_mode == 'batch' else 0
+    assert stages['hri_update']['count'] == stages['sss_update']['count'] == per_tick
+    assert stages['hri_window']['count'] == stages['sss_window']['count'] == windows
+    assert 'hri_window' in layer.render_metrics()
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from resonance_cluster import CLUSTER_SECRET_ENV, QuorumAggregator, load_cluster_secret, run_cluster, sign_vote
+from sensory_data_level import SensoryDataLayer
+
+
+SECRET = b's' * 32
+
+
+def test_cluster_secret_sources(tmp_path, monkeypatch):
+    monkeypatch.delenv(CLUSTER_SECRET_ENV, raising=False)
+    assert load_cluster_secret(SECRET) == SECRET
+
+    key_path = str(tmp_path / 'cluster.key')
+    assert load_cluster_secret(key_path=key_path) == load_cluster_secret(key_path=key_path)
+
+    monkeypatch.setenv(CLUSTER_SECRET_ENV, SECRET.hex())
+    assert load_cluster_secret() == SECRET
+
+    monkeypatch.delenv(CLUSTER_SECRET_ENV)
+    assert len(load_cluster_secret()) == 32
+    assert load_cluster_secret() != load_cluster_secret()
+
+
+def test_aggregator_requires_a_secret():
+    with pytest.raises(ValueError):
+        QuorumAggregator(3)
+
+
+def vote(node_id, hri, timestamp, secret=SECRET):
+    return {'node_id': node_id, 'round': 0, 'hri': hri, 'sss': 50.0, 'timestamp': timestamp,
+            'started_at': 0.0, 'signature': sign_vote(secret, node_id, 0, hri, 50.0, timestamp)}
+
+
+def test_votes_with_a_foreign_secret_are_rejected():
+    aggregator = QuorumAggregator(3, secret=SECRET, round_timeout=None)
+    aggregator._add_vote(vote(0, 40.0, 1.0, secret=b'x' * 32))
+    aggregator._add_vote(vote(1, 40.0, 1.0))
+
+    assert aggregator.invalid_signatures == 1
+    assert list(aggregator._rounds[0]['votes']) == [1]
+
+
+def test_timestamp_is_the_median_of_accepted_votes():
+    aggregator = QuorumAggregator(3, secret=SECRET, round_timeout=None)
+    result = aggregator.aggregate([vote(0, 40.0, 10.0), vote(1, 40.0, 11.0), vote(2, 90.0, 1000.0)])
+
+    assert aggregator.rejected_votes == 1
+    assert result.consensus_timestamp == 10.5
+    assert result.participating_nodes == 2
+    assert aggregator.verify(result)
+
+
+def test_cluster_with_a_faulty_node_reaches_quorum_and_feeds_the_layer():
+    layer = SensoryDataLayer(log_consensus_updates=False)
+    layer.use_deferred_timer = False
+    results = []
+
+    async def run():
+        stats = await run_cluster(3, faulty_nodes=1, faulty_bias=25.0, round_timeout=5.0,
+                                  on_result=lambda round_id, result: results.append(result), secret=SECRET,
+                                  layer=layer, tick_count=600, symbol_count=2, round_ticks=100)
+        await layer.close()
+        return stats
+
+    stats = asyncio.run(run())
+
+    assert stats.rounds == 6
+    assert stats.failed_rounds == 0
+    assert stats.votes == 18
+    assert stats.rejected_votes == 6
+    assert stats.invalid_signatures == 0
+
+    verifier = QuorumAggregator(3, secret=SECRET)
+    assert all(result.participating_nodes == 2 for result in results)
+    assert all(verifier.verify(result) for result in results)
+    assert not QuorumAggregator(3, secret=b'x' * 32).verify(results[0])
+
+    # The layer recorded every round with its node count and sealed them into a block
+    assert list(layer.consensus_history) == results
+    assert all(layer.verify_consensus(results))
@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+import pytest
+
+from sensory_data_level import (
+    MarketDataPoint,
+    HarmonicResonanceCalculator,
+    IncrementalHarmonicResonanceCalculator,
+    SonicStabilityCalculator,
+    StreamingSonicStabilityCalculator,
+    VectorizedHarmonicResonanceCalculator,
+    VectorizedSonicStabilityCalculator
+)
+
+
+def random_ticks(count, seed, symbols=('BTC', 'ETH', 'SOL')):
+    """Fixed-seed random walk ticks across a few symbols"""
+    rng = np.random.default_rng(seed)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, count)))
+    timestamp = 1_700_000_000.0
+    ticks = []
+    for index in range(count):
+        timestamp += float(rng.exponential(0.5))
+        ticks.append(MarketDataPoint(
+            symbol=symbols[index % len(symbols)],
+            price=float(prices[index]),
+            volume=float(rng.uniform(0.0, 5e6)),
+            change_24h=float(rng.normal(0.0, 5.0)),
+            timestamp=timestamp,
+            source='test'
+        ))
+    return ticks
+
+
+@pytest.mark.parametrize('count', [0, 1, 2, 3, 17, 50])
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_vectorized_backend_matches_python(count, seed):
+    ticks = random_ticks(count, seed)
+    assert math.isclose(VectorizedHarmonicResonanceCalculator().calculate_hri(ticks),
+                        HarmonicResonanceCalculator().calculate_hri(ticks), rel_tol=1e-9, abs_tol=1e-9)
+    assert math.isclose(VectorizedSonicStabilityCalculator().calculate_sss(ticks),
+                        SonicStabilityCalculator().calculate_sss(ticks), rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_single_symbol_window():
+    ticks = random_ticks(30, 7, symbols=('BTC',))
+    assert math.isclose(VectorizedHarmonicResonanceCalculator().calculate_hri(ticks),
+                        HarmonicResonanceCalculator().calculate_hri(ticks), rel_tol=1e-9)
+    assert math.isclose(VectorizedSonicStabilityCalculator().calculate_sss(ticks),
+                        SonicStabilityCalculator().calculate_sss(ticks), rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_vectorized_calculator_reused_across_window_sizes():
+    # Growing then shrinking windows must not reuse pair indices of another size
+    calculator = VectorizedHarmonicResonanceCalculator()
+    reference = HarmonicResonanceCalculator()
+    ticks = random_ticks(40, 11)
+    for end in list(range(1, 41)) + [12, 40, 5]:
+        assert math.isclose(calculator.calculate_hri(ticks[:end]), reference.calculate_hri(ticks[:end]),
+                            rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_batch_matches_per_window():
+    ticks = [random_ticks(25, seed) for seed in range(6)]
+    prices = np.array([[tick.price for tick in window] for window in ticks])
+    volumes = np.array([[tick.volume for tick in window] for window in ticks])
+    changes = np.array([[tick.change_24h for tick in window] for window in ticks])
+    timestamps = np.array([[tick.timestamp for tick in window] for window in ticks])
+    
+    hri = VectorizedHarmonicResonanceCalculator().calculate_hri_batch(prices, volumes, changes, chunk_size=4)
+    sss = VectorizedSonicStabilityCalculator().calculate_sss_batch(volumes, changes, timestamps)
+    for row, window in enumerate(ticks):
+        assert math.isclose(hri[row], HarmonicResonanceCalculator().calculate_hri(window), rel_tol=1e-9)
+        assert math.isclose(sss[row], SonicStabilityCalculator().calculate_sss(window), rel_tol=1e-9, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize('window_size', [1, 2, 5, 17])
+@pytest.mark.parametrize('seed', [4, 5, 6])
+def test_incremental_hri_matches_batch_on_every_window(window_size, seed):
+    ticks = random_ticks(3 * window_size + 7, seed)
+    incremental = IncrementalHarmonicResonanceCalculator(window_size=window_size)
+    batch = HarmonicResonanceCalculator()
+    
+    # The window fills, then every later tick evicts the oldest one
+    for index, tick in enumerate(ticks):
+        window = ticks[max(0, index + 1 - window_size):index + 1]
+        assert incremental.update(tick) == pytest.approx(batch.calculate_hri(window), rel=1e-9, abs=1e-9)
+        assert list(incremental.window) == window
+
+
+@pytest.mark.parametrize('window_size', [1, 2, 5, 17])
+@pytest.mark.parametrize('seed', [4, 5, 6])
+@pytest.mark.parametrize('resync_interval', [3, 10000])
+def test_streaming_sss_matches_batch_on_every_window(window_size, seed, resync_interval):
+    ticks = random_ticks(3 * window_size + 7, seed)
+    streaming = StreamingSonicStabilityCalculator(window_size=window_size, resync_interval=resync_interval)
+    batch = SonicStabilityCalculator()
+    
+    # The window fills, then every later tick evicts the oldest one and its interval
+    for index, tick in enumerate(ticks):
+        window = ticks[max(0, index + 1 - window_size):index + 1]
+        assert streaming.update(tick) == pytest.approx(batch.calculate_sss(window), rel=1e-9, abs=1e-9)
+        assert streaming.count == len(window)
+
+
+@pytest.mark.parametrize('zero_every', [1, 2, 3])
+def test_streaming_sss_matches_batch_with_zero_volume(zero_every):
+    # zero_every=1 leaves no non-zero amplitude in the window at all
+    ticks = random_ticks(40, seed=8)
+    for index in range(0, len(ticks), zero_every):
+        ticks[index].volume = 0.0
+    streaming = StreamingSonicStabilityCalculator(window_size=6)
+    batch = SonicStabilityCalculator()
+    
+    for index, tick in enumerate(ticks):
+        window = ticks[max(0, index - 5):index + 1]
+        assert streaming.update(tick) == pytest.approx(batch.calculate_sss(window), rel=1e-9, abs=1e-9)
+
+
+def test_incremental_hri_restarts_after_reset():
+    ticks = random_ticks(30, seed=7)
+    incremental = IncrementalHarmonicResonanceCalculator(window_size=8)
+    incremental.extend(ticks[:20])
+    incremental.reset()
+    assert incremental.extend(ticks[20:]) == pytest.approx(HarmonicResonanceCalculator().calculate_hri(ticks[22:]))
@@ -0,0 +1,108 @@
+import asyncio
+import csv
+import json
+
+import pytest
+
+from sensory_data_level import MarketDataPoint
+from sensory_replay import (
+    SimulatedClock,
+    create_replay_layer,
+    read_binary_ticks,
+    read_csv_ticks,
+    read_jsonl_ticks,
+    read_ticks,
+    write_binary_ticks
+)
+
+from test_sensory_calculators import random_ticks
+
+
+def test_simulated_clock_only_moves_forward():
+    clock = SimulatedClock(100.0)
+    assert clock() == 100.0
+    clock.advance_to(150.0)
+    clock.advance_to(120.0)
+    assert clock() == 150.0
+
+
+def test_csv_reader_fills_defaults(tmp_path):
+    path = tmp_path / 'ticks.csv'
+    with open(path, 'w', newline='') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['symbol', 'price', 'volume', 'change_24h', 'timestamp', 'source'])
+        writer.writerow(['BTC', '50000.5', '12', '-1.5', '1700000000.25', 'coinbase'])
+        writer.writerow(['ETH', '3000', '', '', '1700000001', ''])
+
+    assert list(read_csv_ticks(str(path))) == [
+        MarketDataPoint('BTC', 50000.5, 12.0, -1.5, 1_700_000_000.25, 'coinbase'),
+        MarketDataPoint('ETH', 3000.0, 0.0, 0.0, 1_700_000_001.0, 'replay')
+    ]
+
+
+def test_jsonl_reader_yields_points_and_raw_ticker_frames(tmp_path):
+    ticker = {'type': 'ticker', 'product_id': 'BTC-USD', 'price': '50000', 'time': '2023-11-14T22:13:20Z'}
+    lines = [
+        json.dumps({'symbol': 'ETH', 'price': 3000, 'timestamp': 1_700_000_000}),
+        '',
+        json.dumps({'type': 'subscriptions', 'channels': [{'name': 'ticker'}]}),
+        json.dumps({'type': 'heartbeat', 'product_id': 'BTC-USD'}),
+        json.dumps(ticker)
+    ]
+    path = tmp_path / 'ticks.jsonl'
+    path.write_text('\n'.join(lines) + '\n')
+
+    assert list(read_jsonl_ticks(str(path))) == [
+        MarketDataPoint('ETH', 3000.0, 0.0, 0.0, 1_700_000_000.0, 'replay'),
+        ticker
+    ]
+
+
+def test_binary_ticks_round_trip(tmp_path):
+    ticks = random_ticks(70_000, seed=21, symbols=('BTC', 'ETH', 'DOGE'))
+    path = str(tmp_path / 'ticks.npy')
+
+    assert write_binary_ticks(ticks, path) == len(ticks)
+    assert list(read_binary_ticks(path)) == ticks
+
+
+def test_read_ticks_infers_the_format(tmp_path):
+    ticks = random_ticks(5, seed=22)
+    write_binary_ticks(ticks, str(tmp_path / 'ticks.npy'))
+    assert list(read_ticks(str(tmp_path / 'ticks.npy'))) == ticks
+
+    with pytest.raises(ValueError):
+        read_ticks(str(tmp_path / 'ticks.parquet'))
+    with pytest.raises(ValueError):
+        read_ticks(str(tmp_path / 'ticks.npy'), 'parquet')
+
+
+def replay(ticks):
+    replay_engine = create_replay_layer(scheduler_options={'tick_interval': 3}, window_size=10,
+                                        log_consensus_updates=False)
+
+    async def run():
+        stats = await replay_engine.replay(ticks)
+        await replay_engine.layer.close()
+        return stats
+
+    return replay_engine, asyncio.run(run())
+
+
+def test_replay_is_deterministic():
+    ticks = random_ticks(100, seed=23)
+    first, first_stats = replay(ticks)
+    second, second_stats = replay(ticks)
+
+    assert first_stats.ticks == 100
+    # One recomputation every third tick
+    assert first_stats.consensus_results == len(first.layer.consensus_history) == 33
+    assert first_stats.simulated_seconds == pytest.approx(ticks[-1].timestamp - ticks[0].timestamp)
+    assert first.clock() == ticks[-1].timestamp
+
+    # Same ticks, same results: timestamps come from the simulated clock, not the wall clock
+    assert [(result.hri_value, result.sss_value, result.consensus_timestamp)
+            for result in first.layer.consensus_history] == \
+        [(result.hri_value, result.sss_value, result.consensus_timestamp)
+         for result in second.layer.consensus_history]
+    assert (first.layer.current_hri, first.layer.current_sss) == (second.layer.current_hri, second.layer.current_sss)
@@ -0,0 +1,62 @@
+import json
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+import sensory_data_level
+from sensory_data_level import ConsensusResult, MarketDataPoint, MerkleBlockSigner, SensoryDataLayer
+
+
+def points():
+    return [
+        MarketDataPoint('BTC', 50000.123456789, 12.5, -1.25, 1_700_000_000.125, 'coinbase'),
+        MarketDataPoint('ETH', 0.1 + 0.2, 0.0, 0.0, 1e16, 'binance', harmonic_signature='A4')
+    ]
+
+
+def results():
+    unsigned = ConsensusResult(42.5, np.float64(61.25), np.float64(40.625), 1_700_000_000.5, 3, ['ab', 'cd'])
+    signed = [ConsensusResult(40.0 + index, 60.0, 50.0, 1_700_000_001.0 + index, 1, []) for index in range(3)]
+    signer = MerkleBlockSigner(b'k' * 32)
+    for consensus_result in signed:
+        signer.add(consensus_result)
+    signer.seal()
+    return [unsigned] + signed
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def json_backend(request, monkeypatch):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(sensory_data_level, 'orjson', None)
+    return request.param
+
+
+@pytest.mark.parametrize('make_records', [points, results])
+def test_to_dict_matches_asdict(make_records):
+    for record in make_records():
+        assert record.to_dict() == asdict(record)
+        assert not hasattr(record, '__dict__')
+
+
+@pytest.mark.parametrize('make_records', [points, results])
+def test_to_json_matches_asdict_json_dumps(make_records, json_backend):
+    for record in make_records():
+        assert json.loads(record.to_json()) == json.loads(json.dumps(asdict(record)))
+
+
+def test_to_dict_does_not_share_mutable_fields():
+    consensus_result = results()[1]
+    data = consensus_result.to_dict()
+    data['validation_signatures'].append('x')
+    data['inclusion_proof']['path'].append(('00', 'L'))
+    assert consensus_result.to_dict() == asdict(consensus_result)
+
+
+def test_history_json_matches_asdict_json_dumps(json_backend):
+    layer = SensoryDataLayer(log_consensus_updates=False)
+    layer.consensus_history.extend(results())
+    assert json.loads(layer.get_consensus_history_json(limit=3)) == \
+        json.loads(json.dumps([asdict(result) for result in results()[-3:]]))
@@ -0,0 +1,172 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from sensory_data_level import MarketDataIngestionEngine, SensoryDataLayer, SubscriberFanout, Subscription
+
+from test_sensory_calculators import random_ticks
+
+
+def gated_consumer(received):
+    """Consumer that records items but holds each delivery until the gate opens"""
+    gate = asyncio.Event()
+
+    async def consume(item):
+        await gate.wait()
+        received.append(item)
+
+    return consume, gate
+
+
+async def publish_then_release(policy, items, maxsize=2, key=None):
+    received = []
+    consume, gate = gated_consumer(received)
+    fanout = SubscriberFanout()
+    subscription = fanout.subscribe(consume, maxsize=maxsize, policy=policy, key=key)
+    for item in items:
+        await fanout.publish(item)
+    gate.set()
+    while len(received) < subscription.published - subscription.dropped - subscription.conflated:
+        await asyncio.sleep(0)
+    await fanout.close()
+    return received, subscription
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        Subscription(None, policy='latest')
+
+
+def test_drop_oldest_keeps_the_newest_items():
+    received, subscription = asyncio.run(publish_then_release('drop_oldest', range(5)))
+    assert received == [3, 4]
+    assert subscription.dropped == 3
+    assert subscription.max_depth == 2
+
+
+def test_drop_newest_keeps_the_first_items():
+    received, subscription = asyncio.run(publish_then_release('drop_newest', range(5)))
+    assert received == [0, 1]
+    assert subscription.dropped == 3
+
+
+def test_conflate_keeps_the_latest_item_per_key():
+    items = [SimpleNamespace(symbol=symbol, value=value)
+             for value, symbol in enumerate(['BTC', 'ETH', 'BTC', 'BTC', 'SOL'])]
+    received, subscription = asyncio.run(publish_then_release('conflate', items, maxsize=2))
+
+    # SOL evicts the oldest key (BTC, carrying its latest value); ETH stays
+    assert [(item.symbol, item.value) for item in received] == [('ETH', 1), ('SOL', 4)]
+    assert subscription.conflated == 2
+    assert subscription.dropped == 1
+
+
+def test_block_waits_for_the_consumer_and_drops_nothing():
+    async def run():
+        received = []
+        consume, gate = gated_consumer(received)
+        fanout = SubscriberFanout()
+        subscription = fanout.subscribe(consume, maxsize=1, policy='block')
+        publisher = asyncio.create_task(asyncio.wait_for(
+            asyncio.gather(*[fanout.publish(item) for item in range(4)]), 5))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert not publisher.done()
+
+        gate.set()
+        await publisher
+        await fanout.close()
+        return received, subscription
+
+    received, subscription = asyncio.run(run())
+    assert sorted(received) == [0, 1, 2, 3]
+    assert subscription.dropped == 0
+    assert subscription.delivered == 4
+
+
+def test_lag_and_drop_metrics():
+    async def run():
+        async def slow(item):
+            await asyncio.sleep(0.01)
+
+        fanout = SubscriberFanout()
+        fanout.subscribe(slow, maxsize=3, policy='drop_oldest', name='slow')
+        for item in range(10):
+            await fanout.publish(item)
+        await asyncio.sleep(0.1)
+        stats = fanout.get_stats()
+        await fanout.close()
+        return stats
+
+    [stats] = asyncio.run(run())
+    assert stats['name'] == 'slow'
+    assert stats['published'] == 10
+    assert stats['dropped'] == 7
+    assert stats['delivered'] == 3
+    assert stats['depth'] == 0
+    assert stats['max_lag_ms'] >= stats['avg_lag_ms'] > 0
+
+    # Each queued item waited behind the 10ms deliveries before it
+    assert stats['max_lag_ms'] >= 15
+
+
+def test_tick_latency_stays_flat_as_slow_consumers_attach():
+    ticks = random_ticks(500, seed=12)
+
+    async def ingest(consumer_count):
+        engine = MarketDataIngestionEngine(buffer_size=1000)
+
+        async def slow(item):
+            await asyncio.sleep(0.01)
+
+        for _ in range(consumer_count):
+            engine.subscribe(slow, maxsize=100)
+        started = time.perf_counter()
+        for tick in ticks:
+            await engine._process_market_data(tick)
+        elapsed = time.perf_counter() - started
+        await engine.fanout.close()
+        return elapsed
+
+    alone = asyncio.run(ingest(1))
+    crowded = asyncio.run(ingest(50))
+
+    # One slow consumer would need 5s for these ticks; the feed never waits for them
+    assert alone < 1.0
+    assert crowded < 1.0
+
+
+def test_legacy_callbacks_are_queued_and_delivered_on_close():
+    ticks = random_ticks(20, seed=13)
+
+    async def run():
+        layer = SensoryDataLayer(log_consensus_updates=False)
+        layer.use_deferred_timer = False
+        seen, results = [], []
+
+        async def on_tick(tick):
+            await asyncio.sleep(0)
+            seen.append(tick)
+
+        async def on_consensus(consensus_result):
+            results.append(consensus_result)
+
+        tick_subscription = layer.ingestion_engine.add_callback(on_tick)
+        consensus_subscription = layer.add_consensus_callback(on_consensus)
+        for tick in ticks:
+            await layer.ingestion_engine._process_market_data(tick)
+        await layer.close()
+        return layer, seen, results, tick_subscription, consensus_subscription
+
+    layer, seen, results, tick_subscription, consensus_subscription = asyncio.run(run())
+    assert tick_subscription.policy == consensus_subscription.policy == 'block'
+    assert seen == ticks
+    assert results == list(layer.consensus_history)
+    assert len(results) == len(ticks) - 1
+
+    # close() released both fan-outs
+    assert not layer.ingestion_engine.fanout.subscriptions
+    assert not layer.consensus_fanout.subscriptions
+    assert tick_subscription._task is None and consensus_subscription._task is None
@@ -0,0 +1,61 @@
+import numpy as np
+
+from sensory_data_level import ColumnarTickBuffer, MarketDataIngestionEngine
+
+from test_sensory_calculators import random_ticks
+
+
+def filled_buffer(capacity, ticks):
+    buffer = ColumnarTickBuffer(capacity)
+    for tick in ticks:
+        buffer.append_point(tick)
+    return buffer
+
+
+def test_window_matches_last_ticks_after_wraparound():
+    ticks = random_ticks(37, seed=4)
+    buffer = filled_buffer(10, ticks)
+    for limit in (None, 0, 1, 7, 10, 50):
+        expected = ticks[-10:] if limit is None else ticks[len(ticks) - min(limit, 10):]
+        window = buffer.window(limit)
+        assert [point.symbol for point in window.to_market_data()] == [tick.symbol for tick in expected]
+        np.testing.assert_array_equal(window.price, [tick.price for tick in expected])
+
+
+def test_copied_window_survives_later_appends():
+    ticks = random_ticks(30, seed=5)
+    buffer = filled_buffer(8, ticks[:8])
+    view = buffer.window(4)
+    copied = buffer.window(4, copy=True)
+    expected = [tick.price for tick in ticks[4:8]]
+    
+    # A view of n ticks stays valid for capacity - n appends
+    for tick in ticks[8:12]:
+        buffer.append_point(tick)
+    np.testing.assert_array_equal(view.price, expected)
+    
+    for tick in ticks[12:]:
+        buffer.append_point(tick)
+    np.testing.assert_array_equal(copied.price, expected)
+    assert not np.array_equal(view.price, expected)
+
+
+def test_clear_resets_counters():
+    buffer = filled_buffer(5, random_ticks(12, seed=6))
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.total_appended == 0
+    assert len(buffer.window()) == 0
+
+
+def test_snapshot_matches_across_buffer_modes():
+    ticks = random_ticks(15, seed=7)
+    engines = [MarketDataIngestionEngine(buffer_size=10, columnar=columnar) for columnar in (False, True)]
+    for engine in engines:
+        engine.restore(ticks)
+    deque_engine, columnar_engine = engines
+    
+    assert columnar_engine.data_buffer is None
+    assert columnar_engine.snapshot() == deque_engine.snapshot() == ticks[-10:]
+    columnar_engine.snapshot().append(ticks[0])
+    assert columnar_engine.get_buffered_count() == 10
@@ -0,0 +1,119 @@
+import asyncio
+import os
+
+import numpy as np
+
+from sensory_data_level import ConsensusScheduler, SensoryDataLayer
+from sensory_log import open_sensory_logs
+
+from test_sensory_calculators import random_ticks
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        
+    def __call__(self):
+        return self.now
+
+
+ROLLUP_RESOLUTIONS = ((1.0, 30), (10.0, 30))
+
+
+def make_layer(directory, clock, interval=5):
+    tick_log, consensus_log = open_sensory_logs(str(directory))
+    layer = SensoryDataLayer(window_size=10, clock=clock, tick_log=tick_log, consensus_log=consensus_log,
+                             scheduler=ConsensusScheduler(tick_interval=interval, clock=clock),
+                             rollup_resolutions=ROLLUP_RESOLUTIONS, log_consensus_updates=False)
+    layer.use_deferred_timer = False
+    return layer
+
+
+async def feed(layer, clock, ticks):
+    for tick in ticks:
+        clock.now = tick.timestamp
+        await layer.ingestion_engine._process_market_data(tick)
+
+
+def close(layer):
+    asyncio.run(layer.close())
+    layer.ingestion_engine.tick_log.close()
+    layer.consensus_log.close()
+
+
+def test_warm_start_restores_pending_ticks(tmp_path):
+    ticks = random_ticks(15, seed=13)
+    clock = Clock()
+    layer = make_layer(tmp_path, clock)
+    asyncio.run(feed(layer, clock, ticks[:13]))
+    assert layer.scheduler.pending_ticks == 3
+    close(layer)
+    
+    restarted = make_layer(tmp_path, clock)
+    stats = restarted.warm_start()
+    assert stats['pending_ticks'] == 3
+    assert len(restarted.consensus_history) == 2
+    
+    # Two more ticks complete the interval started before the restart
+    asyncio.run(feed(restarted, clock, ticks[13:]))
+    assert len(restarted.consensus_history) == 3
+    assert restarted.consensus_history[-1].consensus_timestamp == ticks[14].timestamp
+    close(restarted)
+
+
+def rollup_view(layer):
+    end = layer.rollups.latest_timestamp
+    return [layer.rollups.query(end - span, end) for span in (20.0, 250.0)]
+
+
+def assert_same_rollups(actual, expected):
+    # Sums folded in a different order can differ in the last bit
+    for actual_query, expected_query in zip(actual, expected):
+        assert actual_query.keys() == expected_query.keys()
+        for name, values in expected_query.items():
+            np.testing.assert_allclose(actual_query[name], values, rtol=1e-12)
+
+
+def test_warm_start_loads_the_rollup_snapshot_and_folds_in_the_tail(tmp_path):
+    ticks = random_ticks(200, seed=14)
+    clock = Clock()
+    layer = make_layer(tmp_path, clock, interval=1)
+    asyncio.run(feed(layer, clock, ticks[:120]))
+    close(layer)
+    snapshot = os.path.join(str(tmp_path), 'consensus.log.rollups')
+    assert os.path.exists(snapshot)
+    
+    # A second run that stops without close(): the snapshot misses its results
+    second = make_layer(tmp_path, clock, interval=1)
+    second.warm_start()
+    asyncio.run(feed(second, clock, ticks[120:]))
+    expected = rollup_view(second)
+    second.ingestion_engine.tick_log.close()
+    second.consensus_log.close()
+    
+    restarted = make_layer(tmp_path, clock, interval=1)
+    restarted.warm_start()
+    assert_same_rollups(rollup_view(restarted), expected)
+    
+    # Without the snapshot each ring is rebuilt from its own horizon of the log
+    os.remove(snapshot)
+    rebuilt = make_layer(tmp_path, clock, interval=1)
+    rebuilt.warm_start()
+    assert_same_rollups(rollup_view(rebuilt), expected)
+    rebuilt.ingestion_engine.tick_log.close()
+    rebuilt.consensus_log.close()
+    close(restarted)
+
+
+def test_cold_layer_does_not_snapshot_rollups_it_never_restored(tmp_path):
+    ticks = random_ticks(30, seed=15)
+    clock = Clock()
+    layer = make_layer(tmp_path, clock)
+    asyncio.run(feed(layer, clock, ticks))
+    close(layer)
+    os.remove(os.path.join(str(tmp_path), 'consensus.log.rollups'))
+    
+    # Reopened without warm_start(): its rollups miss the logged history
+    cold = make_layer(tmp_path, clock)
+    close(cold)
+    assert not os.path.exists(os.path.join(str(tmp_path), 'consensus.log.rollups'))